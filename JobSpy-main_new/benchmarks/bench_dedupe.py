@@ -0,0 +1,70 @@
+"""
+Benchmarks cross-site dedupe of job records at growing result sizes, to check
+that the fuzzy (MinHash/LSH) pass stays roughly linear.
+
+Usage: python benchmarks/bench_dedupe.py [--jobs 5000 10000 50000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from jobspy.dedupe import dedupe_records
+from jobspy.record import JobRecord
+
+SITES = ["linkedin", "indeed", "glassdoor", "google"]
+WORDS = [f"word{i}" for i in range(3000)]
+
+
+def make_records(count: int) -> list[JobRecord]:
+    """
+    Every posting appears on two sites; the second copy words its title and the
+    end of its description differently, so only the fuzzy pass merges them
+    """
+    records = []
+    for i in range(count):
+        posting = i // 2
+        rng = random.Random(posting)
+        description = " ".join(rng.choice(WORDS) for _ in range(250))
+        if i % 2:
+            description += " apply on our careers page"
+        records.append(
+            JobRecord(
+                {
+                    "id": f"job-{i}",
+                    "site": SITES[i % len(SITES)],
+                    "title": f"{'Sr.' if i % 2 else 'Senior'} Engineer {posting % 40}",
+                    "company": f"Company {posting}",
+                    "location": "Austin, TX" if i % 2 else "Austin, TX, US",
+                    "description": description,
+                }
+            )
+        )
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, nargs="+", default=[5000, 10000, 50000])
+    args = parser.parse_args()
+
+    for count in args.jobs:
+        records = make_records(count)
+        for mode in ("exact", "fuzzy"):
+            start = time.perf_counter()
+            deduped = dedupe_records(records, mode)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{mode:<6} jobs: {count:>6}  kept: {len(deduped):>6}  "
+                f"{elapsed:.2f}s  ({elapsed / count * 1e6:.0f} us/job)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmarks description conversion to markdown: markdownify against the fast
+converter in jobspy.markdown, and markdown_converter, which adds the conversion
+cache. About a fifth of the synthetic descriptions repeat, as multi-location
+postings do; the fast converter is checked to match markdownify on all of them.
+
+Usage: python benchmarks/bench_markdown.py [--jobs 1000] [--descriptions FILE]
+    FILE holds a JSON list of description HTML strings to use instead
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from markdownify import markdownify as md
+
+from jobspy.markdown import html_to_markdown
+from jobspy.util import markdown_converter
+
+WORDS = [f"word{i}" for i in range(2000)] + ["C++", "node_js", "*required*", "&amp;"]
+
+
+def make_descriptions(count: int) -> list[str]:
+    descriptions = []
+    for i in range(count):
+        posting = i if i % 4 else i // 4 * 3
+        rng = random.Random(posting)
+
+        def sentence():
+            return " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 20)))
+
+        items = "".join(
+            f"<li>{sentence()} <b>{rng.choice(WORDS)}</b></li>" for _ in range(6)
+        )
+        descriptions.append(
+            f"<div><h2>About the role</h2><p>{sentence()}<br>{sentence()}</p>"
+            f"<h3>Requirements</h3><ul>{items}</ul>"
+            f"<p><strong>Benefits:</strong> <em>{sentence()}</em></p>"
+            f'<p>Apply at <a href="https://example.com/jobs/{posting}">our site</a></p></div>'
+        )
+    return descriptions
+
+
+def timed(convert, descriptions: list[str]) -> float:
+    started = time.perf_counter()
+    for description in descriptions:
+        convert(description)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--descriptions", help="JSON list of description HTML")
+    args = parser.parse_args()
+
+    if args.descriptions:
+        with open(args.descriptions, encoding="utf-8") as f:
+            descriptions = json.load(f)
+    else:
+        descriptions = make_descriptions(args.jobs)
+
+    fallbacks = sum(html_to_markdown(d) is None for d in descriptions)
+    mismatches = sum(html_to_markdown(d) not in (None, md(d)) for d in descriptions)
+    markdownify_time = timed(md, descriptions)
+    fast_time = timed(html_to_markdown, descriptions)
+    cached_time = timed(markdown_converter, descriptions)
+
+    print(f"descriptions: {len(descriptions)} ({len(set(descriptions))} distinct)")
+    print(f"left to markdownify: {fallbacks}")
+    print(f"output differing from markdownify: {mismatches}")
+    print(f"markdownify:        {markdownify_time:.3f}s")
+    print(f"fast converter:     {fast_time:.3f}s ({markdownify_time / fast_time:.1f}x)")
+    print(f"markdown_converter: {cached_time:.3f}s ({markdownify_time / cached_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
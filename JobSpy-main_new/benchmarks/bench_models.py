@@ -0,0 +1,179 @@
+"""
+Benchmarks the per-job cost of turning scraped fields into a result record:
+
+- dict: JobPost, Location and Compensation validated on construction, then
+  flattened through model_dump() with the location validated again (the old
+  _normalize_job)
+- construct: the models built with model_construct, skipping validation, and
+  flattened by _normalize_job from their attributes
+- validated: the models validated on construction and flattened by
+  _normalize_job from their attributes (what scrape_jobs does)
+
+All paths must produce the same records; mismatches are reported.
+
+Usage: python benchmarks/bench_models.py [--jobs 1000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from jobspy import _normalize_job, desired_order
+from jobspy.model import (
+    Compensation,
+    CompensationInterval,
+    Country,
+    JobPost,
+    JobType,
+    Location,
+    SalarySource,
+)
+from jobspy.util import extract_salary
+
+
+def scraped_fields(jobs: int) -> list[dict]:
+    """Fields shaped like what the scrapers find, some jobs with a salary"""
+    description = "Build and ship features in Python. " * 40
+    fields = []
+    for i in range(jobs):
+        salary = (
+            {
+                "interval": CompensationInterval.YEARLY,
+                "min_amount": 90000 + i,
+                "max_amount": 140000 + i,
+                "currency": "USD",
+            }
+            if i % 2
+            else None
+        )
+        fields.append(
+            {
+                "job": {
+                    "id": f"li-{i}",
+                    "title": f"Software Engineer {i}",
+                    "company_name": f"Company {i % 50}",
+                    "company_url": f"https://www.linkedin.com/company/{i % 50}",
+                    "job_url": f"https://www.linkedin.com/jobs/view/{i}",
+                    "date_posted": date(2024, 1, 1) + timedelta(days=i % 30),
+                    "job_type": [JobType.FULL_TIME],
+                    "is_remote": bool(i % 3),
+                    "description": description,
+                    "emails": [f"jobs{i}@example.com"],
+                    "job_level": "mid-senior level",
+                    "company_industry": "Software Development",
+                },
+                "location": {"city": "Austin", "state": "TX", "country": Country.USA},
+                "compensation": salary,
+            }
+        )
+    return fields
+
+
+def validated_job(fields: dict) -> JobPost:
+    compensation = fields["compensation"]
+    return JobPost(
+        **fields["job"],
+        location=Location(**fields["location"]),
+        compensation=Compensation(**compensation) if compensation else None,
+    )
+
+
+def constructed_job(fields: dict) -> JobPost:
+    compensation = fields["compensation"]
+    return JobPost.model_construct(
+        **fields["job"],
+        location=Location.model_construct(**fields["location"]),
+        compensation=(
+            Compensation.model_construct(**compensation) if compensation else None
+        ),
+    )
+
+
+def dict_normalize(job: JobPost, site: str, country: Country) -> dict:
+    """_normalize_job as it was, without the annual salary conversion"""
+    job_data = job.model_dump()
+    job_data["site"] = site
+    job_data["company"] = job_data["company_name"]
+    job_data["job_type"] = (
+        ", ".join(job_type.value[0] for job_type in job_data["job_type"])
+        if job_data["job_type"]
+        else None
+    )
+    job_data["emails"] = ", ".join(job_data["emails"]) if job_data["emails"] else None
+    if job_data["location"]:
+        job_data["location"] = Location(**job_data["location"]).display_location()
+    compensation_obj = job_data.get("compensation")
+    if compensation_obj:
+        job_data["interval"] = compensation_obj["interval"].value
+        job_data["min_amount"] = compensation_obj["min_amount"]
+        job_data["max_amount"] = compensation_obj["max_amount"]
+        job_data["currency"] = compensation_obj["currency"]
+        job_data["salary_source"] = SalarySource.DIRECT_DATA.value
+    elif country == Country.USA:
+        (
+            job_data["interval"],
+            job_data["min_amount"],
+            job_data["max_amount"],
+            job_data["currency"],
+        ) = extract_salary(job_data["description"])
+        job_data["salary_source"] = SalarySource.DESCRIPTION.value
+    job_data["salary_source"] = (
+        job_data["salary_source"] if job_data.get("min_amount") else None
+    )
+    job_data["skills"] = ", ".join(job_data["skills"]) if job_data["skills"] else None
+    return {column: job_data.get(column) for column in desired_order}
+
+
+PATHS = {
+    "dict": lambda fields: dict_normalize(
+        validated_job(fields), "linkedin", Country.USA
+    ),
+    "construct": lambda fields: _normalize_job(
+        constructed_job(fields), "linkedin", Country.USA, False
+    ),
+    "validated": lambda fields: _normalize_job(
+        validated_job(fields), "linkedin", Country.USA, False
+    ),
+}
+
+
+def best_of(repeat: int, path, fields: list[dict]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for job_fields in fields:
+            path(job_fields)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    fields = scraped_fields(args.jobs)
+    expected = [PATHS["dict"](job_fields) for job_fields in fields]
+    baseline = best_of(args.repeat, PATHS["dict"], fields)
+    print(f"{args.jobs} jobs")
+    for name, path in PATHS.items():
+        mismatches = sum(
+            path(job_fields) != record for job_fields, record in zip(fields, expected)
+        )
+        elapsed = best_of(args.repeat, path, fields)
+        print(
+            f"{name:<10} {elapsed * 1000:8.2f}ms  "
+            f"{elapsed / args.jobs * 1e6:6.1f}us/job  ({baseline / elapsed:4.1f}x)  "
+            f"{mismatches} mismatched records"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Benchmarks turning job records into JSON-ready dicts for the webhook:
+
+- dataframe: the scrape_jobs DataFrame, then to_dict("records") and a pass over
+  every cell turning dates into ISO strings and NaN into None (what
+  job_scraper_webhook.py did)
+- records: scrape_jobs(output="records")
+
+Both must give the same dicts, and, with pyarrow installed, the same
+jobs_to_arrow table; the import time of pandas, which only the dataframe path
+needs, is reported separately.
+
+Usage: python benchmarks/bench_output.py [--jobs 1000 10000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from jobspy import _jobs_result, jobs_to_arrow
+from jobspy.record import JobRecord
+
+
+def scraped_records(count: int) -> list[JobRecord]:
+    """Records shaped like scraped jobs, half with a salary and some undated"""
+    records = []
+    for i in range(count):
+        values = {
+            "id": f"in-{i}",
+            "site": "indeed" if i % 2 else "linkedin",
+            "job_url": f"https://example.com/jobs/{i}",
+            "title": f"Software Engineer {i % 200}",
+            "company": f"Company {i % 500}",
+            "location": "Austin, TX, US",
+            "date_posted": date(2024, 1, 1) + timedelta(days=i % 30) if i % 7 else None,
+            "job_type": "fulltime",
+            "is_remote": i % 3 == 0,
+            "description": f"Job {i}: build and ship features. " * 20,
+        }
+        if i % 2:
+            values.update(
+                salary_source="direct_data",
+                interval="yearly",
+                min_amount=float(90000 + i % 1000),
+                max_amount=float(140000 + i % 1000),
+                currency="USD",
+            )
+        records.append(JobRecord(values))
+    return records
+
+
+def dataframe_dicts(records: list[JobRecord]) -> list[dict]:
+    import pandas as pd
+
+    jobs = _jobs_result(records, None, [], None, "dataframe")
+    cleaned_jobs = []
+    for job in jobs.to_dict("records"):
+        cleaned_job = {}
+        for key, value in job.items():
+            if isinstance(value, (datetime, date)):
+                cleaned_job[key] = value.isoformat()
+            elif pd.isna(value):
+                cleaned_job[key] = None
+            else:
+                cleaned_job[key] = value
+        cleaned_jobs.append(cleaned_job)
+    return cleaned_jobs
+
+
+def records_dicts(records: list[JobRecord]) -> list[dict]:
+    return _jobs_result(records, None, [], None, "records")
+
+
+def same_arrow_tables(records: list[JobRecord]) -> bool | None:
+    """Whether records and the DataFrame make the same table; None without pyarrow"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return None
+    dataframe = _jobs_result(records, None, [], None, "dataframe")
+    # the documented pipeline: jobs_to_arrow(scrape_jobs(..., output="records"))
+    return jobs_to_arrow(records_dicts(records)).equals(jobs_to_arrow(dataframe))
+
+
+def best_of(repeat: int, convert, records: list[JobRecord]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        convert(records)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def pandas_import_seconds() -> float:
+    code = (
+        "import time; started = time.perf_counter(); import pandas; "
+        "print(time.perf_counter() - started)"
+    )
+    return float(subprocess.check_output([sys.executable, "-c", code]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"pandas import: {pandas_import_seconds() * 1000:.0f}ms (dataframe only)")
+    for count in args.jobs:
+        records = scraped_records(count)
+        same = dataframe_dicts(records) == records_dicts(records)
+        same_arrow = same_arrow_tables(records)
+        tables = (
+            ""
+            if same_arrow is None
+            else f", {'same' if same_arrow else 'DIFFERENT'} tables"
+        )
+        baseline = best_of(args.repeat, dataframe_dicts, records)
+        elapsed = best_of(args.repeat, records_dicts, records)
+        print(
+            f"jobs: {count:>6}  dataframe {baseline * 1000:8.1f}ms  "
+            f"records {elapsed * 1000:8.1f}ms  ({baseline / elapsed:4.1f}x)  "
+            f"{'same' if same else 'DIFFERENT'} dicts{tables}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Benchmarks the HTML parsing of each site's pages: html.parser on the whole page
+(the old behaviour) against lxml on the whole page and lxml building only the
+elements the scraper reads (the strainer the scraper uses, if any).
+
+Pages are read from --pages DIR as <case>.html (e.g. linkedin_search.html saved
+from a browser); cases without a saved page use a synthetic page shaped like
+the site's markup.
+
+Usage: python benchmarks/bench_parse.py [--pages DIR] [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bs4 import BeautifulSoup
+
+from jobspy.bayt import JOB_LISTINGS
+from jobspy.bdjobs import JOB_CARDS
+from jobspy.bdjobs.util import find_job_listings
+from jobspy.internshala import LISTING_CARDS
+from jobspy.internshala.util import find_job_cards
+from jobspy.linkedin import SEARCH_CARDS
+from jobspy.parse import DEFAULT_HTML_PARSER
+
+CARDS_PER_PAGE = 25
+
+
+def _page(body: str) -> str:
+    """Wraps body in the bulk real pages carry: inline state, styles and navigation"""
+    state = json.dumps({"items": [{"id": i, "text": "x" * 200} for i in range(300)]})
+    nav = "".join(
+        f'<li class="nav-item"><a class="nav-link" href="/section/{i}">Section {i}</a></li>'
+        for i in range(300)
+    )
+    footer = "".join(f"<p class='footer-text'>Footer line {i}</p>" for i in range(150))
+    return (
+        "<!DOCTYPE html><html><head><title>Jobs</title>"
+        f"<style>{'.c{color:red} ' * 2000}</style>"
+        f'<script type="application/json">{state}</script></head>'
+        f"<body><header><nav><ul>{nav}</ul></nav></header>"
+        f"<main>{body}</main><footer>{footer}</footer></body></html>"
+    )
+
+
+def _description(i: int) -> str:
+    return "".join(
+        f"<p>Responsibility {i}.{n}: build and <b>ship</b> features</p><ul>"
+        + "".join(f"<li>Requirement {k}</li>" for k in range(5))
+        + "</ul>"
+        for n in range(20)
+    )
+
+
+def synthetic_pages() -> dict[str, str]:
+    linkedin_cards = "".join(
+        f'<li><div class="base-card relative base-search-card base-search-card--link job-search-card">'
+        f'<a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/engineer-{i}">'
+        f'<span class="sr-only">Engineer {i}</span></a>'
+        f'<div class="base-search-card__info"><h3 class="base-search-card__title">Engineer {i}</h3>'
+        f'<h4 class="base-search-card__subtitle"><a href="/company/{i}">Company {i}</a></h4>'
+        f'<div class="base-search-card__metadata"><span class="job-search-card__location">Austin, TX</span>'
+        f'<time class="job-search-card__listdate" datetime="2024-01-01">1 day ago</time></div></div></div></li>'
+        for i in range(CARDS_PER_PAGE)
+    )
+    bayt_cards = "".join(
+        f'<li class="has-pointer-d" data-js-job=""><h2><a href="/en/job/{i}">Engineer {i}</a></h2>'
+        f'<div class="t-nowrap p10l"><span>Company {i}</span></div>'
+        f'<div class="t-mute t-small">Dubai</div></li><li class="ad">Sponsored</li>'
+        for i in range(CARDS_PER_PAGE)
+    )
+    internshala_cards = "".join(
+        f'<div class="container-fluid individual_internship visibilityTrackerItem" internshipid="{i}">'
+        f'<h3 class="job-internship-name"><a class="job-title-href" href="/internship/detail/{i}">Intern {i}</a></h3>'
+        f'<p class="company-name">Company {i}</p><div class="row-1-item locations"><span><a>Mumbai</a></span></div>'
+        f'<div class="row-1-item"><span class="stipend">₹ 10,000 /month</span></div></div>'
+        for i in range(CARDS_PER_PAGE)
+    )
+    bdjobs_cards = "".join(
+        f'<div class="norm-jobs-wrapper"><div class="job-title-text"><a href="jobdetails.asp?id={i}">Engineer {i}</a></div>'
+        f'<div class="comp-name-text">Company {i}</div><div class="locon-text-d">Dhaka</div>'
+        f'<div class="dead-text-d">Deadline: 1 Jan 2025</div></div>'
+        for i in range(CARDS_PER_PAGE)
+    )
+    return {
+        "linkedin_search": _page(f"<ul>{linkedin_cards}</ul>"),
+        "bayt_search": _page(f"<ul>{bayt_cards}</ul>"),
+        "internshala_search": _page(internshala_cards),
+        "bdjobs_search": _page(bdjobs_cards),
+        "linkedin_job": _page(
+            f'<div class="show-more-less-html__markup">{_description(0)}</div>'
+        ),
+        "ziprecruiter_job": _page(
+            f'<div class="job_description">{_description(0)}</div>'
+            f'<section class="company_description">{_description(1)}</section>'
+        ),
+    }
+
+
+# case: (strainer the scraper parses with, what the scraper looks up)
+CASES = {
+    "linkedin_search": (
+        SEARCH_CARDS,
+        lambda soup: soup.find_all("div", class_="base-search-card"),
+    ),
+    "bayt_search": (
+        JOB_LISTINGS,
+        lambda soup: soup.find_all("li", attrs={"data-js-job": ""}),
+    ),
+    "internshala_search": (LISTING_CARDS, find_job_cards),
+    "bdjobs_search": (JOB_CARDS, find_job_listings),
+    "linkedin_job": (
+        None,
+        lambda soup: soup.find_all(
+            "div", class_=lambda x: x and "show-more-less-html__markup" in x
+        ),
+    ),
+    "ziprecruiter_job": (
+        None,
+        lambda soup: soup.find_all("div", class_="job_description"),
+    ),
+}
+
+
+def best_of(repeat: int, parse) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", help="directory of saved <case>.html pages")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    pages = synthetic_pages()
+    for case in CASES:
+        path = os.path.join(args.pages or "", f"{case}.html")
+        if args.pages and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                pages[case] = f.read()
+
+    print(f"default backend: {DEFAULT_HTML_PARSER}")
+    for case, (strainer, find) in CASES.items():
+        markup = pages[case]
+        variants = {
+            "html.parser": lambda: BeautifulSoup(markup, "html.parser"),
+            "lxml": lambda: BeautifulSoup(markup, "lxml"),
+        }
+        if strainer is not None:
+            variants["lxml+strainer"] = lambda: BeautifulSoup(
+                markup, "lxml", parse_only=strainer
+            )
+        found = {name: len(find(parse())) for name, parse in variants.items()}
+        if len(set(found.values())) != 1:
+            print(f"{case}: backends disagree on the elements found: {found}")
+            continue
+        baseline = best_of(args.repeat, variants["html.parser"])
+        results = "  ".join(
+            f"{name} {elapsed * 1000:7.2f}ms ({baseline / elapsed:4.1f}x)"
+            for name, parse in variants.items()
+            for elapsed in [best_of(args.repeat, parse)]
+        )
+        print(f"{case:<20} {len(markup) // 1024:>5} KiB  {found['lxml']:>3} found  {results}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Benchmarks the memory held by job records between the scrapers and the output
+stage: one dict per job with every column (the old record) against JobRecord,
+which keeps the usual columns in slots, only the set values of the others and
+one copy of each repeated string.
+
+Records are built from fresh strings per job, as parsing pages produces them, and
+the DataFrame built from each kind must be the same.
+
+Usage: python benchmarks/bench_records.py [--jobs 10000 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from jobspy import _records_to_frame
+from jobspy.record import JobRecord
+from jobspy.util import desired_order
+
+SITES = ["linkedin", "indeed", "glassdoor", "google", "naukri"]
+CITIES = ["Austin, TX", "New York, NY", "Seattle, WA", "Bengaluru, Karnataka, India"]
+
+
+def fresh(text: str) -> str:
+    """A copy of text that is a new string, as each parsed page gives"""
+    return "".join(text)
+
+
+def scraped_values(count: int) -> list[dict]:
+    """Column values of count jobs; naukri jobs fill the naukri-only columns"""
+    rng = random.Random(1)
+    jobs = []
+    for i in range(count):
+        site = SITES[i % len(SITES)]
+        values = {
+            "id": f"{site[:2]}-{i}",
+            "site": fresh(site),
+            "job_url": f"https://example.com/{site}/jobs/{i}",
+            "title": f"Software Engineer {rng.randrange(200)}",
+            "company": f"Company {rng.randrange(500)}",
+            "location": fresh(rng.choice(CITIES)),
+            "date_posted": date(2024, 1, 1) + timedelta(days=i % 30),
+            "job_type": fresh("fulltime"),
+            "is_remote": i % 3 == 0,
+            "description": f"Job {i}: build and ship features. " * 20,
+            "company_url": f"https://example.com/company/{rng.randrange(500)}",
+        }
+        if i % 2:
+            values.update(
+                salary_source=fresh("direct_data"),
+                interval=fresh("yearly"),
+                min_amount=float(90000 + i % 1000),
+                max_amount=float(140000 + i % 1000),
+                currency=fresh("USD"),
+            )
+        if site == "naukri":
+            values.update(
+                skills="python, sql",
+                experience_range=f"{i % 5}-{i % 5 + 3} Yrs",
+                company_rating=4.1,
+                company_reviews_count=i % 900,
+                vacancy_count=1,
+            )
+        jobs.append(values)
+    return jobs
+
+
+def held(build, jobs: list[dict]) -> tuple[list, int, float]:
+    """
+    Records built from jobs, the bytes they hold and the seconds building them
+    takes (timed on a second build, outside tracemalloc)
+    """
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    records = [build(values) for values in jobs]
+    size = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    started = time.perf_counter()
+    [build(values) for values in jobs]
+    return records, size, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+
+    kinds = {
+        "dict": lambda values: {column: values.get(column) for column in desired_order},
+        "JobRecord": JobRecord,
+    }
+    for count in args.jobs:
+        jobs = scraped_values(count)
+        frames = {}
+        for kind, build in kinds.items():
+            records, size, elapsed = held(build, jobs)
+            started = time.perf_counter()
+            frames[kind] = _records_to_frame(records)
+            assembly = time.perf_counter() - started
+            print(
+                f"{kind:<10} jobs: {count:>7}  held {size / 2**20:8.1f}MB "
+                f"({size / count:6.0f} B/job)  built {elapsed:.2f}s  "
+                f"assembled {assembly:.2f}s"
+            )
+            del records
+        if not frames["dict"].equals(frames["JobRecord"]):
+            print("DataFrames differ")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Benchmarks each scraper end to end against recorded responses, so performance
+changes can be measured without hitting the live sites.
+
+First record real responses (search pages, GraphQL payloads, detail pages) of
+each site into a fixtures directory; the query is saved alongside them:
+
+    python benchmarks/bench_replay.py record --fixtures DIR --search-term "python"
+
+then replay them as often as needed. Per site and result count this reports the
+scrape_jobs wall time, the CPU time and peak memory of each stage (replay:
+serving recorded responses in place of the network, scrape: parsing pages and
+building jobs, assemble: building the DataFrame) and fixture misses, which
+mean the run sent requests that were never recorded:
+
+    python benchmarks/bench_replay.py run --fixtures DIR [--results 10 100 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from jobspy import (
+    SCRAPER_MAPPING,
+    _build_scraper_input,
+    _normalize_job,
+    _records_to_frame,
+    scrape_jobs,
+)
+from jobspy.model import Country, Site
+from jobspy.replay import Replayer, recording, use_transport
+from jobspy.util import map_str_to_site, set_logger_level
+
+QUERY_FILE = "query.json"
+
+
+def site_query(query: dict, site: Site, results_wanted: int) -> dict:
+    return {**query, "site_name": site.value, "results_wanted": results_wanted}
+
+
+def scraper_input(query: dict):
+    return _build_scraper_input(
+        site_name=query["site_name"],
+        search_term=query.get("search_term"),
+        google_search_term=query.get("google_search_term"),
+        location=query.get("location"),
+        distance=50,
+        is_remote=False,
+        job_type=None,
+        easy_apply=None,
+        results_wanted=query["results_wanted"],
+        country_indeed=query.get("country_indeed", "usa"),
+        description_format="markdown",
+        linkedin_fetch_description=query.get("linkedin_fetch_description", False),
+        linkedin_company_ids=None,
+        offset=0,
+        hours_old=None,
+        internshala_search_term=query.get("internshala_search_term"),
+        only_new=False,
+    )
+
+
+def run_stages(fixtures: str, query: dict, site: Site) -> tuple[dict, dict, int, int]:
+    """
+    Scrapes the site from the fixtures and assembles the DataFrame, timing each
+    stage; returns CPU seconds and peak bytes per stage, jobs found and misses
+    """
+    country = Country.from_string(query.get("country_indeed", "usa"))
+    cpu, peak = {}, {}
+    replayer = Replayer(fixtures)
+    with use_transport(replayer):
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        started = time.process_time()
+        jobs = SCRAPER_MAPPING[site]().scrape(scraper_input(query)).jobs
+        cpu["scrape"] = time.process_time() - started - replayer.seconds
+        cpu["replay"] = replayer.seconds
+        peak["scrape"] = tracemalloc.get_traced_memory()[1] - baseline
+
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    started = time.process_time()
+    _records_to_frame(
+        [_normalize_job(job, site.value, country, False) for job in jobs]
+    )
+    cpu["assemble"] = time.process_time() - started
+    peak["assemble"] = tracemalloc.get_traced_memory()[1] - baseline
+    return cpu, peak, len(jobs), replayer.misses
+
+
+def record(args):
+    query = {
+        "search_term": args.search_term,
+        "google_search_term": args.google_search_term,
+        "location": args.location,
+        "country_indeed": args.country,
+        "linkedin_fetch_description": True,
+    }
+    os.makedirs(args.fixtures, exist_ok=True)
+    with open(os.path.join(args.fixtures, QUERY_FILE), "w") as f:
+        json.dump(query, f, indent=2)
+    for site in args.sites:
+        # the largest run records the pages the smaller ones need
+        for results_wanted in sorted(args.results, reverse=True):
+            with recording(args.fixtures) as recorder:
+                jobs = scrape_jobs(**site_query(query, site, results_wanted))
+            print(
+                f"{site.value:<14} {results_wanted:>5} wanted  {len(jobs):>5} found  "
+                f"{recorder.recorded:>5} responses recorded"
+            )
+
+
+def run(args):
+    with open(os.path.join(args.fixtures, QUERY_FILE)) as f:
+        query = json.load(f)
+
+    print(
+        f"{'site':<14} {'wanted':>6} {'found':>6} {'wall':>8} "
+        f"{'replay cpu':>11} {'scrape cpu':>11} {'assemble cpu':>13} "
+        f"{'scrape peak':>12} {'assemble peak':>14} {'misses':>7}"
+    )
+    for site in args.sites:
+        for results_wanted in args.results:
+            site_args = site_query(query, site, results_wanted)
+            wall = []
+            for _ in range(args.repeat):
+                with use_transport(Replayer(args.fixtures)):
+                    started = time.perf_counter()
+                    scrape_jobs(**site_args)
+                    wall.append(time.perf_counter() - started)
+
+            timings = [
+                run_stages(args.fixtures, site_args, site) for _ in range(args.repeat)
+            ]
+            cpu = {
+                stage: min(timing[0][stage] for timing in timings)
+                for stage in timings[0][0]
+            }
+            _, _, found, misses = timings[0]
+            tracemalloc.start()
+            _, peak, _, _ = run_stages(args.fixtures, site_args, site)
+            tracemalloc.stop()
+
+            print(
+                f"{site.value:<14} {results_wanted:>6} {found:>6} {min(wall):>7.3f}s "
+                f"{cpu['replay']:>10.3f}s {cpu['scrape']:>10.3f}s {cpu['assemble']:>12.3f}s "
+                f"{peak['scrape'] / 2**20:>10.1f}MB {peak['assemble'] / 2**20:>12.1f}MB "
+                f"{misses:>7}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    record_parser = commands.add_parser("record", help="record live responses")
+    record_parser.add_argument("--search-term", default="software engineer")
+    record_parser.add_argument("--google-search-term")
+    record_parser.add_argument("--location", default="San Francisco, CA")
+    record_parser.add_argument("--country", default="usa")
+    run_parser = commands.add_parser("run", help="benchmark against recordings")
+    run_parser.add_argument("--repeat", type=int, default=3)
+    for command in (record_parser, run_parser):
+        command.add_argument("--fixtures", required=True, help="fixtures directory")
+        command.add_argument(
+            "--sites", nargs="+", default=[site.value for site in Site]
+        )
+        command.add_argument(
+            "--results", nargs="+", type=int, default=[10, 100, 1000]
+        )
+    args = parser.parse_args()
+    args.sites = [map_str_to_site(site) for site in args.sites]
+
+    set_logger_level(0)
+    if args.command == "record":
+        record(args)
+    else:
+        run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmarks DataFrame assembly of scraped jobs: the old one-DataFrame-per-job
+concat path against the columnar builder used by scrape_jobs.
+
+Usage: python benchmarks/bench_result_assembly.py [--jobs 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from jobspy import _normalize_job, _records_to_frame
+from jobspy.model import (
+    Compensation,
+    CompensationInterval,
+    Country,
+    JobPost,
+    JobType,
+    Location,
+)
+from jobspy.util import desired_order
+
+
+def make_jobs(count: int) -> list[JobPost]:
+    jobs = []
+    for i in range(count):
+        jobs.append(
+            JobPost(
+                id=f"li-{i}",
+                title=f"Software Engineer {i % 50}",
+                company_name=f"Company {i % 300}",
+                job_url=f"https://www.linkedin.com/jobs/view/{i}",
+                location=Location(city="Austin", state="TX", country=Country.USA),
+                description=f"Build things. Pays $120,000 - $150,000. Job {i}",
+                compensation=(
+                    Compensation(
+                        interval=CompensationInterval.YEARLY,
+                        min_amount=100000,
+                        max_amount=150000,
+                    )
+                    if i % 3 == 0
+                    else None
+                ),
+                date_posted=date(2024, 1, 1) + timedelta(days=i % 30),
+                job_type=[JobType.FULL_TIME] if i % 2 else None,
+                emails=["jobs@example.com"] if i % 10 == 0 else None,
+                is_remote=bool(i % 4 == 0),
+            )
+        )
+    return jobs
+
+
+def legacy_frame(records: list[dict]) -> pd.DataFrame:
+    jobs_dfs = [pd.DataFrame([record]) for record in records]
+    filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
+    jobs_df = pd.concat(filtered_dfs, ignore_index=True)
+    for column in desired_order:
+        if column not in jobs_df.columns:
+            jobs_df[column] = None
+    return jobs_df[desired_order]
+
+
+def timed(func, records: list[dict]) -> tuple[float, pd.DataFrame]:
+    start = time.perf_counter()
+    result = func(records)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=10000)
+    args = parser.parse_args()
+
+    records = [
+        _normalize_job(job, "linkedin", Country.USA, False)
+        for job in make_jobs(args.jobs)
+    ]
+
+    legacy_time, legacy_df = timed(legacy_frame, records)
+    columnar_time, columnar_df = timed(_records_to_frame, records)
+    pd.testing.assert_frame_equal(legacy_df, columnar_df)
+
+    print(f"jobs:     {args.jobs}")
+    print(f"legacy:   {legacy_time:.3f}s")
+    print(f"columnar: {columnar_time:.3f}s")
+    print(f"speedup:  {legacy_time / columnar_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,30 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Tuple
-
-import pandas as pd
-
-from jobspy.bayt import BaytScraper
-from jobspy.bdjobs import BDJobs
-from jobspy.glassdoor import Glassdoor
-from jobspy.google import Google
-from jobspy.indeed import Indeed
-from jobspy.linkedin import LinkedIn
-from jobspy.naukri import Naukri
-from jobspy.internshala import Internshala
-from jobspy.model import JobType, Location, JobResponse, Country
-from jobspy.model import SalarySource, ScraperInput, Site
+import asyncio
+import functools
+import importlib
+import inspect
+import math
+import threading
+import time
+from collections.abc import Mapping, MutableMapping
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from contextvars import copy_context
+from datetime import date
+from typing import TYPE_CHECKING, Iterable, Iterator, Tuple
+
+from jobspy.arrow import jobs_to_arrow, write_parquet
+from jobspy.batch import DetailFetches, run_capped
+from jobspy.cache import ResponseCache
+from jobspy.deadline import Deadline, DeadlineExceeded, deadline_scope
+from jobspy.metrics import Metrics, metrics_scope
+from jobspy.parse import set_html_parser
+from jobspy.model import JobPost, JobType, Location, JobResponse, Country
+from jobspy.model import SalarySource, Scraper, ScraperInput, Site
+from jobspy.proxy import proxy_stats
+from jobspy.record import JobRecord
+from jobspy.store import JobStore
 from jobspy.util import (
     set_logger_level,
     extract_salary,
@@ -23,11 +33,555 @@ from jobspy.util import (
     map_str_to_site,
     convert_to_annual,
     desired_order,
+    close_sessions,
 )
-from jobspy.ziprecruiter import ZipRecruiter
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# scraper class of each site as (module, class name); a scraper module, with the
+# dependencies only it needs, is imported the first time its site is scraped
+SCRAPER_CLASSES = {
+    Site.LINKEDIN: ("jobspy.linkedin", "LinkedIn"),
+    Site.INDEED: ("jobspy.indeed", "Indeed"),
+    Site.ZIP_RECRUITER: ("jobspy.ziprecruiter", "ZipRecruiter"),
+    Site.GLASSDOOR: ("jobspy.glassdoor", "Glassdoor"),
+    Site.GOOGLE: ("jobspy.google", "Google"),
+    Site.BAYT: ("jobspy.bayt", "BaytScraper"),
+    Site.NAUKRI: ("jobspy.naukri", "Naukri"),
+    Site.BDJOBS: ("jobspy.bdjobs", "BDJobs"),
+    Site.INTERNSHALA: ("jobspy.internshala", "Internshala"),
+}
+
+
+class _LazyScrapers(MutableMapping):
+    """
+    Scraper class of each site, importing the scraper's module on first lookup;
+    classes assigned to a site are used as they are
+    """
+
+    def __init__(self, classes: dict[Site, tuple[str, str]]):
+        self._classes: dict[Site, tuple[str, str] | type[Scraper]] = dict(classes)
+        self._lock = threading.Lock()
+
+    def __getitem__(self, site: Site) -> type[Scraper]:
+        scraper_class = self._classes[site]
+        if not isinstance(scraper_class, tuple):
+            return scraper_class
+        module, name = scraper_class
+        # sites are scraped from worker threads, which may look up together
+        with self._lock:
+            return getattr(importlib.import_module(module), name)
+
+    def __setitem__(self, site: Site, scraper_class: type[Scraper]):
+        self._classes[site] = scraper_class
+
+    def __delitem__(self, site: Site):
+        del self._classes[site]
+
+    def __iter__(self) -> Iterator[Site]:
+        return iter(self._classes)
+
+    def __len__(self) -> int:
+        return len(self._classes)
+
+
+SCRAPER_MAPPING = _LazyScrapers(SCRAPER_CLASSES)
+
+
+def __getattr__(name: str):
+    # the scraper classes stay importable from jobspy, e.g. from jobspy import BDJobs
+    for module, class_name in SCRAPER_CLASSES.values():
+        if class_name == name:
+            return getattr(importlib.import_module(module), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _get_site_types(site_name: str | list[str] | Site | list[Site] | None) -> list[Site]:
+    site_types = list(Site)
+    if isinstance(site_name, str):
+        site_types = [map_str_to_site(site_name)]
+    elif isinstance(site_name, Site):
+        site_types = [site_name]
+    elif isinstance(site_name, list):
+        site_types = [
+            map_str_to_site(site) if isinstance(site, str) else site
+            for site in site_name
+        ]
+    return site_types
+
+
+def _build_scraper_input(
+    site_name: str | list[str] | Site | list[Site] | None,
+    search_term: str | None,
+    google_search_term: str | None,
+    location: str | None,
+    distance: int | None,
+    is_remote: bool,
+    job_type: str | None,
+    easy_apply: bool | None,
+    results_wanted: int,
+    country_indeed: str,
+    description_format: str,
+    linkedin_fetch_description: bool | None,
+    linkedin_company_ids: list[int] | None,
+    offset: int | None,
+    hours_old: int | None,
+    internshala_search_term: str | None,
+    only_new: bool,
+) -> ScraperInput:
+    return ScraperInput(
+        site_type=_get_site_types(site_name),
+        country=Country.from_string(country_indeed),
+        search_term=search_term,
+        google_search_term=google_search_term,
+        internshala_search_term=internshala_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        job_type=get_enum_from_value(job_type) if job_type else None,
+        easy_apply=easy_apply,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        results_wanted=results_wanted,
+        linkedin_company_ids=linkedin_company_ids,
+        offset=offset,
+        hours_old=hours_old,
+        only_new=only_new,
+    )
+
+
+def _open_cache(http_cache: ResponseCache | str | None) -> ResponseCache | None:
+    if isinstance(http_cache, str):
+        return ResponseCache(http_cache)
+    return http_cache
+
+
+def _open_store(job_store: JobStore | str | None, only_new: bool) -> JobStore | None:
+    if isinstance(job_store, str):
+        return JobStore(job_store)
+    if job_store is None and only_new:
+        return JobStore()
+    return job_store
+
+
+def _record_jobs(
+    store: JobStore | None,
+    site_value: str,
+    jobs: list[JobPost],
+    scraper_input: ScraperInput,
+) -> list[JobPost]:
+    """
+    Saves a site's jobs to the job store; with only_new, drops the ones it already held
+    """
+    if store is None:
+        return jobs
+    known = store.known_ids(job.id for job in jobs) if scraper_input.only_new else set()
+    store.add(site_value, jobs, scraper_input.description_format)
+    return [job for job in jobs if job.id not in known]
+
+
+def _scrape_site(
+    site: Site,
+    scraper_input: ScraperInput,
+    proxies: list[str] | str | None,
+    ca_cert: str | None,
+    user_agent: str | None,
+    cache: ResponseCache | None,
+    store: JobStore | None,
+    details: DetailFetches | None = None,
+    call_deadline: float | None = None,
+    budget: float | None = None,
+    metrics: Metrics | None = None,
+) -> Tuple[str, JobResponse]:
+    scraper_class = SCRAPER_MAPPING[site]
+    deadline = Deadline.start(call_deadline, budget)
+    with metrics_scope(metrics, site=site.value), deadline_scope(deadline):
+        scraper = scraper_class(
+            proxies=proxies,
+            ca_cert=ca_cert,
+            user_agent=user_agent,
+            cache=cache,
+            job_store=store,
+        )
+        scraper.detail_fetches = details
+        try:
+            scraped_data: JobResponse = scraper.scrape(scraper_input)
+        except DeadlineExceeded:
+            # the scraper let the timeout escape, so its jobs are lost
+            scraped_data = JobResponse()
+    scraped_data.truncated = deadline is not None and deadline.cut_short
+    _log_finished(site)
+    return site.value, scraped_data
+
+
+async def _scrape_site_async(
+    site: Site,
+    scraper_input: ScraperInput,
+    proxies: list[str] | str | None,
+    ca_cert: str | None,
+    user_agent: str | None,
+    cache: ResponseCache | None,
+    store: JobStore | None,
+    call_deadline: float | None = None,
+    budget: float | None = None,
+    metrics: Metrics | None = None,
+) -> Tuple[str, JobResponse]:
+    scraper_class = SCRAPER_MAPPING[site]
+    # a site without a budget still gets a deadline, for cancel() to spend
+    deadline = Deadline.start(call_deadline, budget) or Deadline(math.inf)
+    # the task's context, deadline and metrics included, is copied into the threads
+    with metrics_scope(metrics, site=site.value), deadline_scope(deadline):
+        executor = _async_executor()
+        # constructors may already hit the network (ZipRecruiter fetches cookies)
+        scraper = await asyncio.get_running_loop().run_in_executor(
+            executor,
+            copy_context().run,
+            functools.partial(
+                scraper_class,
+                proxies=proxies,
+                ca_cert=ca_cert,
+                user_agent=user_agent,
+                cache=cache,
+                job_store=store,
+            ),
+        )
+        try:
+            scraped_data: JobResponse = await scraper.scrape_async(
+                scraper_input, executor
+            )
+        except DeadlineExceeded:
+            scraped_data = JobResponse()
+        except asyncio.CancelledError:
+            # the thread cannot be interrupted, but its next request is refused,
+            # so the scraper stops at its next page or detail fetch
+            deadline.cancel()
+            raise
+    scraped_data.truncated = deadline.cut_short
+    _log_finished(site)
+    return site.value, scraped_data
+
+
+def _log_finished(site: Site):
+    cap_name = site.value.capitalize()
+    site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
+    site_name = "LinkedIn" if cap_name == "Linkedin" else cap_name
+    create_logger(site_name).info(f"finished scraping")
+
+
+def _normalize_job(
+    job: JobPost, site: str, country: Country, enforce_annual_salary: bool
+) -> JobRecord:
+    """
+    Flattens a scraped JobPost into a record keyed by the columns in desired_order
+    """
+    # a shallow copy of the fields: the nested models are read, not re-validated
+    job_data = dict(job.__dict__)
+    job_data["site"] = site
+    job_data["company"] = job_data["company_name"]
+    job_data["job_type"] = (
+        ", ".join(job_type.value[0] for job_type in job_data["job_type"])
+        if job_data["job_type"]
+        else None
+    )
+    job_data["emails"] = (
+        ", ".join(job_data["emails"]) if job_data["emails"] else None
+    )
+    if job_data["location"]:
+        job_data["location"] = job_data["location"].display_location()
+
+    # Handle compensation
+    compensation_obj = job_data.get("compensation")
+    if compensation_obj:
+        job_data["interval"] = (
+            compensation_obj.interval.value if compensation_obj.interval else None
+        )
+        job_data["min_amount"] = compensation_obj.min_amount
+        job_data["max_amount"] = compensation_obj.max_amount
+        job_data["currency"] = compensation_obj.currency
+        job_data["salary_source"] = SalarySource.DIRECT_DATA.value
+        if enforce_annual_salary and (
+            job_data["interval"]
+            and job_data["interval"] != "yearly"
+            and job_data["min_amount"]
+            and job_data["max_amount"]
+        ):
+            convert_to_annual(job_data)
+    else:
+        if country == Country.USA:
+            (
+                job_data["interval"],
+                job_data["min_amount"],
+                job_data["max_amount"],
+                job_data["currency"],
+            ) = extract_salary(
+                job_data["description"],
+                enforce_annual_salary=enforce_annual_salary,
+            )
+            job_data["salary_source"] = SalarySource.DESCRIPTION.value
+
+    job_data["salary_source"] = (
+        job_data["salary_source"]
+        if "min_amount" in job_data and job_data["min_amount"]
+        else None
+    )
+
+    #naukri-specific fields
+    job_data["skills"] = (
+        ", ".join(job_data["skills"]) if job_data["skills"] else None
+    )
+
+    return JobRecord(job_data)
+
+
+def _records_to_frame(
+    records: Iterable[Mapping],
+    column_order: list[str] = desired_order,
+    metrics: Metrics | None = None,
+) -> pd.DataFrame:
+    """
+    Collects job records column by column and builds the DataFrame once, in column_order
+    """
+    # pandas is imported on first use, so callers that never build a DataFrame
+    # do not pay for it
+    import numpy as np
+    import pandas as pd
+
+    columns: dict[str, list] = {column: [] for column in column_order}
+    for record in records:
+        for column, values in columns.items():
+            values.append(record[column])
+
+    started = time.perf_counter()
+    jobs_df = pd.DataFrame(columns, columns=column_order)
+    for column in column_order:
+        missing = jobs_df[column].isna()
+        if missing.all():
+            # columns no job filled in stay as empty (None) columns
+            jobs_df[column] = None
+        elif missing.any():
+            jobs_df[column] = jobs_df[column].where(~missing, np.nan)
+    if metrics is not None:
+        metrics.observe("dataframe_assembly_seconds", time.perf_counter() - started)
+    return jobs_df
+
+
+# seconds sites get past their deadline to hand back the jobs they have
+DEADLINE_GRACE = 5.0
+
+
+def _site_budgets(site_deadlines: dict[str | Site, float] | None) -> dict[Site, float]:
+    return {
+        map_str_to_site(site) if isinstance(site, str) else site: seconds
+        for site, seconds in (site_deadlines or {}).items()
+    }
+
+
+def _site_wait_until(
+    started: float, call_deadline: float | None, budget: float | None
+) -> float:
+    """time.monotonic() value a site started at started must finish by, or inf"""
+    return min(
+        math.inf if budget is None else started + budget,
+        math.inf if call_deadline is None else call_deadline,
+    )
+
+
+def _finished_site(future: Future, site: Site) -> Tuple[str, JobResponse]:
+    """Result of a finished site; a scraper that raised is logged and has no jobs"""
+    try:
+        return future.result()
+    except Exception as e:
+        create_logger("JobSpy").error(f"{site.value} failed: {e}")
+        return site.value, JobResponse()
+
+
+def _dropped_site(site: Site) -> Tuple[str, JobResponse]:
+    """Result of a site abandoned DEADLINE_GRACE seconds after its deadline"""
+    create_logger("JobSpy").warning(f"{site.value} missed its deadline, dropping it")
+    return site.value, JobResponse(truncated=True)
+
+
+def _site_results(
+    scraper_input: ScraperInput,
+    proxies: list[str] | str | None,
+    ca_cert: str | None,
+    user_agent: str | None,
+    cache: ResponseCache | None,
+    store: JobStore | None,
+    deadline_seconds: float | None,
+    site_deadlines: dict[str | Site, float] | None,
+    metrics: Metrics | None = None,
+) -> Iterator[Tuple[str, JobResponse]]:
+    """
+    Scrapes the sites concurrently, yielding (site, JobResponse) as each finishes.
+    A site still running DEADLINE_GRACE seconds after its deadline is abandoned
+    and yielded as truncated with no jobs.
+    """
+    started = time.monotonic()
+    call_deadline = started + deadline_seconds if deadline_seconds is not None else None
+    budgets = _site_budgets(site_deadlines)
+    # the wait is bounded only when every site has a deadline
+    wait_until = max(
+        (
+            _site_wait_until(started, call_deadline, budgets.get(site))
+            for site in scraper_input.site_type
+        ),
+        default=math.inf,
+    )
+
+    executor = ThreadPoolExecutor()
+    try:
+        futures = {
+            executor.submit(
+                _scrape_site,
+                site,
+                scraper_input,
+                proxies,
+                ca_cert,
+                user_agent,
+                cache,
+                store,
+                call_deadline=call_deadline,
+                budget=budgets.get(site),
+                metrics=metrics,
+            ): site
+            for site in scraper_input.site_type
+        }
+        pending = set(futures)
+        try:
+            timeout = (
+                None
+                if wait_until == math.inf
+                else max(0.0, wait_until + DEADLINE_GRACE - time.monotonic())
+            )
+            for future in as_completed(futures, timeout=timeout):
+                pending.discard(future)
+                yield _finished_site(future, futures[future])
+        except FuturesTimeoutError:
+            for future in pending:
+                if future.done():
+                    yield _finished_site(future, futures[future])
+                else:
+                    yield _dropped_site(futures[future])
+    finally:
+        # an abandoned iterator must not block on the sites still running
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _site_records(
+    site_results: Iterable[Tuple[str, JobResponse]],
+    store: JobStore | None,
+    scraper_input: ScraperInput,
+    enforce_annual_salary: bool,
+    truncated_sites: list[str] | None = None,
+    metrics: Metrics | None = None,
+) -> Iterator[JobRecord]:
+    """
+    Job records of each site's results; sites cut short by their deadline are
+    added to truncated_sites
+    """
+    for site_value, job_response in site_results:
+        if job_response.truncated and truncated_sites is not None:
+            truncated_sites.append(site_value)
+        for job in _record_jobs(store, site_value, job_response.jobs, scraper_input):
+            started = time.perf_counter()
+            record = _normalize_job(
+                job, site_value, scraper_input.country, enforce_annual_salary
+            )
+            if metrics is not None:
+                metrics.observe(
+                    "job_normalization_seconds",
+                    time.perf_counter() - started,
+                    site=site_value,
+                )
+            yield record
+
+
+def iter_jobs(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    offset: int | None = 0,
+    hours_old: int = None,
+    enforce_annual_salary: bool = False,
+    verbose: int = 0,
+    user_agent: str = None,
+    internshala_search_term: str | None = None,
+    http_cache: ResponseCache | str | None = None,
+    only_new: bool = False,
+    job_store: JobStore | str | None = None,
+    deadline_seconds: float | None = None,
+    site_deadlines: dict[str | Site, float] | None = None,
+    metrics: Metrics | None = None,
+    **kwargs,
+) -> Iterator[dict]:
+    """
+    Scrapes job boards concurrently, yielding each site's jobs as soon as that site
+    finishes. Streaming is per site, not per page: a site's first job comes once
+    its last page, and its detail pages, are done
+    :param deadline_seconds: time budget of the whole call; sites still running stop
+        and return the jobs found so far
+    :param site_deadlines: time budget per site, e.g. {"linkedin": 60}
+    :param metrics: Metrics collecting request, parsing and assembly timings
+    :return: iterator of job records keyed by the columns of the scrape_jobs DataFrame,
+        ready for JSON like those of output="records": dates are ISO strings
+    """
+    set_logger_level(verbose)
+    scraper_input = _build_scraper_input(
+        site_name=site_name,
+        search_term=search_term,
+        google_search_term=google_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        job_type=job_type,
+        easy_apply=easy_apply,
+        results_wanted=results_wanted,
+        country_indeed=country_indeed,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        linkedin_company_ids=linkedin_company_ids,
+        offset=offset,
+        hours_old=hours_old,
+        internshala_search_term=internshala_search_term,
+        only_new=only_new,
+    )
+    cache = _open_cache(http_cache)
+    store = _open_store(job_store, only_new)
+    records = _site_records(
+        _site_results(
+            scraper_input,
+            proxies,
+            ca_cert,
+            user_agent,
+            cache,
+            store,
+            deadline_seconds,
+            site_deadlines,
+            metrics,
+        ),
+        store,
+        scraper_input,
+        enforce_annual_salary,
+        metrics=metrics,
+    )
+    # the same plain dicts as scrape_jobs(output="iter")
+    yield from _plain_records(records, None)
 
-# Update the SCRAPER_MAPPING dictionary in the scrape_jobs function
 
 def scrape_jobs(
     site_name: str | list[str] | Site | list[Site] | None = None,
@@ -51,181 +605,498 @@ def scrape_jobs(
     verbose: int = 0,
     user_agent: str = None,
     internshala_search_term: str | None = None,
+    http_cache: ResponseCache | str | None = None,
+    only_new: bool = False,
+    job_store: JobStore | str | None = None,
+    dedupe: str | None = None,
+    deadline_seconds: float | None = None,
+    site_deadlines: dict[str | Site, float] | None = None,
+    metrics: Metrics | None = None,
+    output: str = "dataframe",
     **kwargs,
-) -> pd.DataFrame:
+) -> pd.DataFrame | list[dict] | Iterator[dict]:
     """
     Scrapes job data from job boards concurrently
-    :return: Pandas DataFrame containing job data
-    """
-    SCRAPER_MAPPING = {
-        Site.LINKEDIN: LinkedIn,
-        Site.INDEED: Indeed,
-        Site.ZIP_RECRUITER: ZipRecruiter,
-        Site.GLASSDOOR: Glassdoor,
-        Site.GOOGLE: Google,
-        Site.BAYT: BaytScraper,
-        Site.NAUKRI: Naukri,
-        Site.BDJOBS: BDJobs,  # Add BDJobs to the scraper mapping
-        Site.INTERNSHALA: Internshala,    
-    }
+    :param dedupe: "exact" or "fuzzy" to merge the same posting found on several sites
+    :param deadline_seconds: time budget of the whole call; sites still running stop
+        and return the jobs found so far
+    :param site_deadlines: time budget per site, e.g. {"linkedin": 60}
+    :param metrics: Metrics collecting request, parsing and assembly timings
+    :param output: "dataframe", "records" or "iter" (see _jobs_result)
+    :return: Pandas DataFrame containing job data; attrs["truncated_sites"] lists
+        the sites whose time budget ran out and, with metrics, attrs["metrics"]
+        holds metrics.summary()
+    """
     set_logger_level(verbose)
-    job_type = get_enum_from_value(job_type) if job_type else None
-
-    def get_site_type():
-        site_types = list(Site)
-        if isinstance(site_name, str):
-            site_types = [map_str_to_site(site_name)]
-        elif isinstance(site_name, Site):
-            site_types = [site_name]
-        elif isinstance(site_name, list):
-            site_types = [
-                map_str_to_site(site) if isinstance(site, str) else site
-                for site in site_name
-            ]
-        return site_types
-
-    country_enum = Country.from_string(country_indeed)
-
-    scraper_input = ScraperInput(
-        site_type=get_site_type(),
-        country=country_enum,
+    _check_output(output)
+    scraper_input = _build_scraper_input(
+        site_name=site_name,
         search_term=search_term,
         google_search_term=google_search_term,
-        internshala_search_term=internshala_search_term,
         location=location,
         distance=distance,
         is_remote=is_remote,
         job_type=job_type,
         easy_apply=easy_apply,
+        results_wanted=results_wanted,
+        country_indeed=country_indeed,
         description_format=description_format,
         linkedin_fetch_description=linkedin_fetch_description,
-        results_wanted=results_wanted,
         linkedin_company_ids=linkedin_company_ids,
         offset=offset,
         hours_old=hours_old,
+        internshala_search_term=internshala_search_term,
+        only_new=only_new,
+    )
+    cache = _open_cache(http_cache)
+    store = _open_store(job_store, only_new)
+    truncated_sites = []
+    return _jobs_result(
+        _site_records(
+            _site_results(
+                scraper_input,
+                proxies,
+                ca_cert,
+                user_agent,
+                cache,
+                store,
+                deadline_seconds,
+                site_deadlines,
+                metrics,
+            ),
+            store,
+            scraper_input,
+            enforce_annual_salary,
+            truncated_sites,
+            metrics,
+        ),
+        dedupe,
+        truncated_sites,
+        metrics,
+        output,
     )
 
-    def scrape_site(site: Site) -> Tuple[str, JobResponse]:
-        scraper_class = SCRAPER_MAPPING[site]
-        scraper = scraper_class(proxies=proxies, ca_cert=ca_cert, user_agent=user_agent)
-        scraped_data: JobResponse = scraper.scrape(scraper_input)
-        cap_name = site.value.capitalize()
-        site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
-        site_name = "LinkedIn" if cap_name == "Linkedin" else cap_name
-        create_logger(site_name).info(f"finished scraping")
-        return site.value, scraped_data
 
-    site_to_jobs_dict = {}
+# threads scrape_jobs_async runs site scrapes on, shared by every call; site
+# scrapes are blocking I/O, so the pool is not sized by the CPU count
+ASYNC_SCRAPE_WORKERS = 64
 
-    def worker(site):
-        site_val, scraped_info = scrape_site(site)
-        return site_val, scraped_info
+_async_executor_instance: ThreadPoolExecutor | None = None
+_async_executor_lock = threading.Lock()
 
-    with ThreadPoolExecutor() as executor:
-        future_to_site = {
-            executor.submit(worker, site): site for site in scraper_input.site_type
-        }
 
-        for future in as_completed(future_to_site):
-            site_value, scraped_data = future.result()
-            site_to_jobs_dict[site_value] = scraped_data
-
-    jobs_dfs: list[pd.DataFrame] = []
-
-    for site, job_response in site_to_jobs_dict.items():
-        for job in job_response.jobs:
-            job_data = job.dict()
-            job_url = job_data["job_url"]
-            job_data["site"] = site
-            job_data["company"] = job_data["company_name"]
-            job_data["job_type"] = (
-                ", ".join(job_type.value[0] for job_type in job_data["job_type"])
-                if job_data["job_type"]
-                else None
+def _async_executor() -> ThreadPoolExecutor:
+    global _async_executor_instance
+    with _async_executor_lock:
+        if _async_executor_instance is None:
+            _async_executor_instance = ThreadPoolExecutor(
+                max_workers=ASYNC_SCRAPE_WORKERS, thread_name_prefix="jobspy-async"
             )
-            job_data["emails"] = (
-                ", ".join(job_data["emails"]) if job_data["emails"] else None
+        return _async_executor_instance
+
+
+def set_async_workers(workers: int):
+    """
+    Sizes the thread pool scrape_jobs_async runs site scrapes on: the most site
+    scrapes, over all concurrent calls, that run at the same time
+    """
+    global ASYNC_SCRAPE_WORKERS, _async_executor_instance
+    if workers < 1:
+        raise ValueError(f"Invalid async workers: {workers}, expected at least 1")
+    with _async_executor_lock:
+        ASYNC_SCRAPE_WORKERS = workers
+        previous, _async_executor_instance = _async_executor_instance, None
+    if previous is not None:
+        # scrapes already running finish on the old pool
+        previous.shutdown(wait=False)
+
+
+async def scrape_jobs_async(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    offset: int | None = 0,
+    hours_old: int = None,
+    enforce_annual_salary: bool = False,
+    verbose: int = 0,
+    user_agent: str = None,
+    internshala_search_term: str | None = None,
+    http_cache: ResponseCache | str | None = None,
+    only_new: bool = False,
+    job_store: JobStore | str | None = None,
+    dedupe: str | None = None,
+    deadline_seconds: float | None = None,
+    site_deadlines: dict[str | Site, float] | None = None,
+    metrics: Metrics | None = None,
+    output: str = "dataframe",
+    **kwargs,
+) -> pd.DataFrame | list[dict] | Iterator[dict]:
+    """
+    Awaitable wrapper of scrape_jobs that offloads the blocking scrapers to
+    threads; it is not async I/O. Each site of each call holds one thread of a
+    pool shared by every call (ASYNC_SCRAPE_WORKERS threads, see
+    set_async_workers) for its whole scrape, and scrapers keep their own worker
+    threads for detail pages, so concurrency is bounded by threads. Calls beyond
+    the pool's size wait for a thread. Cancelling the call cannot interrupt a
+    request in flight; each site stops at its next request instead.
+    :param dedupe: "exact" or "fuzzy" to merge the same posting found on several sites
+    :param deadline_seconds: time budget of the whole call; sites still running stop
+        and return the jobs found so far
+    :param site_deadlines: time budget per site, e.g. {"linkedin": 60}
+    :param metrics: Metrics collecting request, parsing and assembly timings
+    :param output: "dataframe", "records" or "iter" (see _jobs_result)
+    :return: Pandas DataFrame containing job data; attrs["truncated_sites"] lists
+        the sites whose time budget ran out and, with metrics, attrs["metrics"]
+        holds metrics.summary()
+    """
+    set_logger_level(verbose)
+    _check_output(output)
+    scraper_input = _build_scraper_input(
+        site_name=site_name,
+        search_term=search_term,
+        google_search_term=google_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        job_type=job_type,
+        easy_apply=easy_apply,
+        results_wanted=results_wanted,
+        country_indeed=country_indeed,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        linkedin_company_ids=linkedin_company_ids,
+        offset=offset,
+        hours_old=hours_old,
+        internshala_search_term=internshala_search_term,
+        only_new=only_new,
+    )
+    cache = _open_cache(http_cache)
+    store = _open_store(job_store, only_new)
+    call_deadline = (
+        time.monotonic() + deadline_seconds if deadline_seconds is not None else None
+    )
+    budgets = _site_budgets(site_deadlines)
+
+    async def bounded_scrape(site: Site) -> Tuple[str, JobResponse]:
+        wait_until = _site_wait_until(
+            time.monotonic(), call_deadline, budgets.get(site)
+        )
+        scrape = _scrape_site_async(
+            site,
+            scraper_input,
+            proxies,
+            ca_cert,
+            user_agent,
+            cache,
+            store,
+            call_deadline=call_deadline,
+            budget=budgets.get(site),
+            metrics=metrics,
+        )
+        try:
+            if wait_until == math.inf:
+                return await scrape
+            return await asyncio.wait_for(
+                scrape, wait_until + DEADLINE_GRACE - time.monotonic()
             )
-            if job_data["location"]:
-                job_data["location"] = Location(
-                    **job_data["location"]
-                ).display_location()
-
-            # Handle compensation
-            compensation_obj = job_data.get("compensation")
-            if compensation_obj and isinstance(compensation_obj, dict):
-                job_data["interval"] = (
-                    compensation_obj.get("interval").value
-                    if compensation_obj.get("interval")
-                    else None
+        except asyncio.TimeoutError:
+            return _dropped_site(site)
+        except Exception as e:
+            create_logger("JobSpy").error(f"{site.value} failed: {e}")
+            return site.value, JobResponse()
+
+    site_results = await asyncio.gather(
+        *(bounded_scrape(site) for site in scraper_input.site_type)
+    )
+    truncated_sites = []
+    return _jobs_result(
+        _site_records(
+            site_results,
+            store,
+            scraper_input,
+            enforce_annual_salary,
+            truncated_sites,
+            metrics,
+        ),
+        dedupe,
+        truncated_sites,
+        metrics,
+        output,
+    )
+
+
+def _query_options(query: dict, defaults: dict) -> dict:
+    """
+    iter_jobs arguments of one batch query: the query's own, then the batch-wide
+    ones, then iter_jobs' defaults
+    """
+    options = {
+        name: parameter.default
+        for name, parameter in inspect.signature(iter_jobs).parameters.items()
+        if parameter.default is not inspect.Parameter.empty
+    }
+    unknown = sorted(set(query) - set(options))
+    if unknown:
+        raise ValueError(
+            f"Invalid query option(s): {', '.join(unknown)}, "
+            "expected iter_jobs parameters"
+        )
+    options.update(defaults)
+    options.update(query)
+    return options
+
+
+def scrape_jobs_batch(
+    queries: list[dict],
+    max_workers: int = 8,
+    site_concurrency: dict[str | Site, int] | None = None,
+    dedupe: str | None = None,
+    deadline_seconds: float | None = None,
+    site_deadlines: dict[str | Site, float] | None = None,
+    metrics: Metrics | None = None,
+    output: str = "dataframe",
+    **kwargs,
+) -> pd.DataFrame | list[dict] | Iterator[dict]:
+    """
+    Runs many searches as one batch. Every query/site pair is scheduled on one
+    shared worker pool, and a job found by several queries has its detail page
+    fetched once.
+    :param queries: scrape_jobs arguments per search, e.g.
+        [{"search_term": "python", "location": "Austin, TX"}, ...]
+    :param max_workers: query/site pairs scraped at the same time overall
+    :param site_concurrency: cap on the pairs of a site scraped at the same time,
+        e.g. {"linkedin": 1}; sites not listed get 2
+    :param dedupe: "exact" or "fuzzy" to also merge the same posting found on several sites
+    :param deadline_seconds: time budget of the whole batch; pairs still running stop
+        and return the jobs found so far
+    :param site_deadlines: time budget of each query/site pair, e.g. {"linkedin": 60}
+    :param metrics: Metrics collecting request, parsing and assembly timings
+    :param kwargs: scrape_jobs arguments shared by every query, e.g. proxies or
+        results_wanted; http_cache, job_store and only_new apply to the whole batch
+    :param output: "dataframe", "records" or "iter" (see _jobs_result)
+    :return: Pandas DataFrame with each job once, however many queries found it;
+        attrs["truncated_sites"] lists the sites of pairs whose time budget ran out
+        and, with metrics, attrs["metrics"] holds metrics.summary()
+    """
+    set_logger_level(kwargs.get("verbose", 0))
+    _check_output(output)
+    if dedupe is not None:
+        _check_dedupe(dedupe)
+    caps = {
+        map_str_to_site(site) if isinstance(site, str) else site: cap
+        for site, cap in (site_concurrency or {}).items()
+    }
+    invalid = {site.value: cap for site, cap in caps.items() if cap < 1}
+    if invalid:
+        # a site that may never run would silently drop all of its queries
+        raise ValueError(
+            f"Invalid site concurrency: {invalid}, expected at least 1 per site"
+        )
+    cache = _open_cache(kwargs.get("http_cache"))
+    store = _open_store(kwargs.get("job_store"), kwargs.get("only_new", False))
+    details = DetailFetches()
+    call_deadline = (
+        time.monotonic() + deadline_seconds if deadline_seconds is not None else None
+    )
+    budgets = _site_budgets(site_deadlines)
+
+    pairs = []
+    build_parameters = inspect.signature(_build_scraper_input).parameters
+    for query in queries:
+        options = _query_options(query, kwargs)
+        scraper_input = _build_scraper_input(
+            **{name: options[name] for name in build_parameters}
+        )
+        pairs.extend(
+            (site, (site, scraper_input, options)) for site in scraper_input.site_type
+        )
+
+    def run(pair):
+        site, scraper_input, options = pair
+        return _scrape_site(
+            site,
+            scraper_input,
+            options["proxies"],
+            options["ca_cert"],
+            options["user_agent"],
+            cache,
+            store,
+            details,
+            call_deadline=call_deadline,
+            budget=budgets.get(site),
+            metrics=metrics,
+        )
+
+    def expires(pair) -> float:
+        # a pair's budget starts when it is scheduled
+        site = pair[0]
+        wait_until = _site_wait_until(
+            time.monotonic(), call_deadline, budgets.get(site)
+        )
+        return wait_until + DEADLINE_GRACE
+
+    records = {}
+    truncated_sites = []
+    for (site, scraper_input, options), future in run_capped(
+        pairs, run, max_workers, caps, expires
+    ):
+        if future is None:
+            site_value, job_response = _dropped_site(site)
+        else:
+            site_value, job_response = _finished_site(future, site)
+        if job_response.truncated and site_value not in truncated_sites:
+            truncated_sites.append(site_value)
+        for job in _record_jobs(store, site_value, job_response.jobs, scraper_input):
+            key = job.id or job.job_url
+            if key not in records:
+                started = time.perf_counter()
+                records[key] = _normalize_job(
+                    job,
+                    site_value,
+                    scraper_input.country,
+                    options["enforce_annual_salary"],
                 )
-                job_data["min_amount"] = compensation_obj.get("min_amount")
-                job_data["max_amount"] = compensation_obj.get("max_amount")
-                job_data["currency"] = compensation_obj.get("currency", "USD")
-                job_data["salary_source"] = SalarySource.DIRECT_DATA.value
-                if enforce_annual_salary and (
-                    job_data["interval"]
-                    and job_data["interval"] != "yearly"
-                    and job_data["min_amount"]
-                    and job_data["max_amount"]
-                ):
-                    convert_to_annual(job_data)
-            else:
-                if country_enum == Country.USA:
-                    (
-                        job_data["interval"],
-                        job_data["min_amount"],
-                        job_data["max_amount"],
-                        job_data["currency"],
-                    ) = extract_salary(
-                        job_data["description"],
-                        enforce_annual_salary=enforce_annual_salary,
+                if metrics is not None:
+                    metrics.observe(
+                        "job_normalization_seconds",
+                        time.perf_counter() - started,
+                        site=site_value,
                     )
-                    job_data["salary_source"] = SalarySource.DESCRIPTION.value
+    return _jobs_result(records.values(), dedupe, truncated_sites, metrics, output)
 
-            job_data["salary_source"] = (
-                job_data["salary_source"]
-                if "min_amount" in job_data and job_data["min_amount"]
-                else None
-            )
 
-            #naukri-specific fields
-            job_data["skills"] = (
-                ", ".join(job_data["skills"]) if job_data["skills"] else None
-            )
-            job_data["experience_range"] = job_data.get("experience_range")
-            job_data["company_rating"] = job_data.get("company_rating")
-            job_data["company_reviews_count"] = job_data.get("company_reviews_count")
-            job_data["vacancy_count"] = job_data.get("vacancy_count")
-            job_data["work_from_home_type"] = job_data.get("work_from_home_type")
-
-            job_df = pd.DataFrame([job_data])
-            jobs_dfs.append(job_df)
-
-    if jobs_dfs:
-        # Step 1: Filter out all-NA columns from each DataFrame before concatenation
-        filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
-
-        # Step 2: Concatenate the filtered DataFrames
-        jobs_df = pd.concat(filtered_dfs, ignore_index=True)
-
-        # Step 3: Ensure all desired columns are present, adding missing ones as empty
-        for column in desired_order:
-            if column not in jobs_df.columns:
-                jobs_df[column] = None  # Add missing columns as empty
-
-        # Reorder the DataFrame according to the desired order
-        jobs_df = jobs_df[desired_order]
-
-        # Step 4: Sort the DataFrame as required
-        return jobs_df.sort_values(
-            by=["site", "date_posted"], ascending=[True, False]
-        ).reset_index(drop=True)
-    else:
+OUTPUT_FORMATS = ("dataframe", "records", "iter")
+
+
+def _jobs_result(
+    records: Iterable[JobRecord],
+    dedupe: str | None,
+    truncated_sites: list[str],
+    metrics: Metrics | None,
+    output: str,
+) -> pd.DataFrame | list[dict] | Iterator[dict]:
+    """
+    The result of a scrape in the output asked for:
+
+    - "dataframe": the sorted DataFrame, with attrs
+    - "records": a list of plain dicts, sorted like the DataFrame, ready for JSON:
+      dates are ISO strings and missing values None, never NaN. pandas is not used.
+    - "iter": the same dicts, yielded as each site finishes (after dedupe, once
+      every site has)
+    """
+    if output == "dataframe":
+        jobs_df = _dedupe_frame(records, dedupe, metrics)
+        return _result_frame(jobs_df, truncated_sites, metrics)
+    if dedupe is not None:
+        # checked before the records generator starts scraping
+        _check_dedupe(dedupe)
+    plain_records = _plain_records(records, dedupe)
+    if output == "iter":
+        return plain_records
+    return _sort_plain_records(list(plain_records))
+
+
+def _plain_records(records: Iterable[JobRecord], dedupe: str | None) -> Iterator[dict]:
+    if dedupe is not None:
+        from jobspy.dedupe import dedupe_records
+
+        records = dedupe_records(list(records), dedupe)
+    for record in records:
+        yield {
+            key: _plain_value(value) for key, value in zip(record, record.values())
+        }
+
+
+def _plain_value(value):
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def _sort_plain_records(records: list[dict]) -> list[dict]:
+    """Sorts as _sort_jobs_frame does: by site, then newest first, undated last"""
+    # ISO dates sort by date; both sorts are stable, so the site sort keeps
+    # each site's jobs newest first
+    records.sort(key=lambda record: record["date_posted"] or "", reverse=True)
+    records.sort(key=lambda record: record["site"])
+    return records
+
+
+def _check_output(output: str):
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(f"Invalid output: {output}, expected one of {OUTPUT_FORMATS}")
+
+
+def _dedupe_frame(
+    records: Iterable[JobRecord], dedupe: str | None, metrics: Metrics | None = None
+) -> pd.DataFrame:
+    if dedupe is None:
+        return _records_to_frame(records, metrics=metrics)
+    # checked before the records generator starts scraping
+    _check_dedupe(dedupe)
+    from jobspy.dedupe import dedupe_records
+
+    return _records_to_frame(
+        dedupe_records(list(records), dedupe), [*desired_order, "sources"], metrics
+    )
+
+
+def _check_dedupe(dedupe: str):
+    # jobspy.dedupe, which needs numpy, is imported only when dedupe is asked for
+    from jobspy.dedupe import DEDUPE_MODES
+
+    if dedupe not in DEDUPE_MODES:
+        raise ValueError(f"Invalid dedupe mode: {dedupe}, expected one of {DEDUPE_MODES}")
+
+
+def _sort_jobs_frame(jobs_df: pd.DataFrame) -> pd.DataFrame:
+    if jobs_df.empty:
+        import pandas as pd
+
         return pd.DataFrame()
+    return jobs_df.sort_values(
+        by=["site", "date_posted"], ascending=[True, False]
+    ).reset_index(drop=True)
+
+
+def _result_frame(
+    jobs_df: pd.DataFrame, truncated_sites: list[str], metrics: Metrics | None
+) -> pd.DataFrame:
+    jobs_df = _sort_jobs_frame(jobs_df)
+    jobs_df.attrs["truncated_sites"] = truncated_sites
+    if metrics is not None:
+        jobs_df.attrs["metrics"] = metrics.summary()
+    return jobs_df
 
 
 # Add BDJobs to __all__
 __all__ = [
     "BDJobs",
+    "JobStore",
+    "Metrics",
+    "ResponseCache",
+    "close_sessions",
+    "iter_jobs",
+    "jobs_to_arrow",
+    "proxy_stats",
+    "scrape_jobs",
+    "scrape_jobs_batch",
+    "scrape_jobs_async",
+    "set_async_workers",
+    "set_html_parser",
+    "write_parquet",
 ]
\ No newline at end of file
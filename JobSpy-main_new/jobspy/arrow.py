@@ -0,0 +1,169 @@
+"""
+jobspy.arrow
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the Apache Arrow table builder and Parquet writer for job results.
+"""
+
+from __future__ import annotations
+
+import sys
+import types
+import typing
+from datetime import date, datetime
+from enum import Enum
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable
+
+from jobspy.model import Compensation, JobPost, Location
+from jobspy.util import desired_order
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# imported on first use by _require_pyarrow
+pa = pq = None
+
+# low-cardinality columns stored as dictionary<int32, string>
+DICTIONARY_COLUMNS = ("site", "company", "location", "currency")
+
+# record columns that are not JobPost fields under the same name
+_RENAMED_FIELDS = {"company": (JobPost, "company_name")}
+_COMPENSATION_COLUMNS = ("interval", "min_amount", "max_amount", "currency")
+_STRING_COLUMNS = ("site", "salary_source", "sources")
+
+
+def _require_pyarrow():
+    global pa, pq
+    if pa is not None:
+        return
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:  # optional dependency: pip install python-jobspy[parquet]
+        raise ImportError(
+            "pyarrow is required for Arrow/Parquet output: pip install pyarrow"
+        ) from None
+    pa, pq = pyarrow, pyarrow.parquet
+
+
+def _is_frame(jobs) -> bool:
+    # no DataFrame can exist before pandas is imported, so it is not imported here
+    pandas = sys.modules.get("pandas")
+    return pandas is not None and isinstance(jobs, pandas.DataFrame)
+
+
+def _arrow_type(annotation) -> pa.DataType:
+    """
+    Arrow type of a model field as it appears in a job record; lists, enums and
+    nested models are flattened to strings by scrape_jobs
+    """
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        annotation = next(
+            arg for arg in typing.get_args(annotation) if arg is not type(None)
+        )
+    if annotation is bool:
+        return pa.bool_()
+    if annotation is int:
+        return pa.int64()
+    if annotation is float:
+        return pa.float64()
+    if annotation is date:
+        return pa.date32()
+    return pa.string()
+
+
+def _column_type(column: str) -> pa.DataType:
+    if column in DICTIONARY_COLUMNS:
+        return pa.dictionary(pa.int32(), pa.string())
+    if column in _STRING_COLUMNS:
+        return pa.string()
+    if column in _COMPENSATION_COLUMNS:
+        return _arrow_type(Compensation.model_fields[column].annotation)
+    model, field = _RENAMED_FIELDS.get(column, (JobPost, column))
+    if field not in model.model_fields:
+        return pa.string()
+    return _arrow_type(model.model_fields[field].annotation)
+
+
+@lru_cache
+def job_schema(columns: tuple[str, ...] = tuple(desired_order)) -> pa.Schema:
+    """
+    Explicit Arrow schema of the scrape_jobs columns, derived from the JobPost fields
+    """
+    _require_pyarrow()
+    return pa.schema([pa.field(column, _column_type(column)) for column in columns])
+
+
+def _clean(value, arrow_type: pa.DataType):
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    if pa.types.is_date32(arrow_type):
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, str):
+            # records from output="records"/"iter" carry dates as ISO strings
+            return date.fromisoformat(value)
+    if pa.types.is_integer(arrow_type) and isinstance(value, float):
+        # pandas turns int columns with gaps into floats
+        return int(value)
+    if pa.types.is_string(arrow_type) or pa.types.is_dictionary(arrow_type):
+        if isinstance(value, Enum):
+            return str(value.value)
+        if isinstance(value, Location):
+            return value.display_location()
+        return value if isinstance(value, str) else str(value)
+    return value
+
+
+def jobs_to_arrow(jobs: pd.DataFrame | Iterable[dict]) -> pa.Table:
+    """
+    Builds an Arrow table with the explicit job schema
+    :param jobs: scrape_jobs DataFrame or job records (e.g. from iter_jobs or
+        output="records")
+    :return: pyarrow Table
+    """
+    _require_pyarrow()
+    if _is_frame(jobs) and len(jobs.columns):
+        columns = {column: jobs[column].tolist() for column in jobs.columns}
+    else:
+        records = [] if _is_frame(jobs) else list(jobs)
+        column_order = list(records[0]) if records else desired_order
+        columns = {
+            column: [record.get(column) for record in records]
+            for column in column_order
+        }
+
+    schema = job_schema(tuple(columns))
+    arrays = []
+    for field in schema:
+        values = [_clean(value, field.type) for value in columns[field.name]]
+        if pa.types.is_dictionary(field.type):
+            arrays.append(pa.array(values, type=pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(values, type=field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def write_parquet(
+    jobs: pd.DataFrame | Iterable[dict] | pa.Table,
+    path: str,
+    compression: str = "zstd",
+):
+    """
+    Writes jobs to a Parquet file; site, company, location and currency are
+    dictionary encoded
+    :param jobs: scrape_jobs DataFrame, job records or a table from jobs_to_arrow
+    :param path: destination file
+    :param compression: Parquet codec
+    """
+    _require_pyarrow()
+    table = jobs if isinstance(jobs, pa.Table) else jobs_to_arrow(jobs)
+    pq.write_table(
+        table,
+        path,
+        compression=compression,
+        use_dictionary=[
+            column for column in DICTIONARY_COLUMNS if column in table.column_names
+        ],
+    )
@@ -0,0 +1,122 @@
+"""
+jobspy.batch
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the scheduling and fetch coalescing used by scrape_jobs_batch.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Hashable, Iterable, Iterator
+
+# query/site pairs of one site scraped at the same time, unless overridden
+DEFAULT_SITE_CONCURRENCY = 2
+
+
+class DetailFetches:
+    """
+    Single-flight memo of job detail fetches shared by the scrapers of a batch:
+    the first scraper to ask for a job fetches it, scrapers asking meanwhile wait
+    for that fetch and later ones get its result
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._fetches: dict[Hashable, Future] = {}
+
+    def run(self, key: Hashable, fetch: Callable, *args):
+        with self._lock:
+            future = self._fetches.get(key)
+            owner = future is None
+            if owner:
+                future = self._fetches[key] = Future()
+        if owner:
+            try:
+                future.set_result(fetch(*args))
+            except BaseException as e:
+                # a failed fetch is not remembered, the next scraper tries again
+                with self._lock:
+                    del self._fetches[key]
+                future.set_exception(e)
+        return future.result()
+
+    def __len__(self) -> int:
+        return len(self._fetches)
+
+
+def run_capped(
+    tasks: Iterable[tuple[Hashable, object]],
+    run: Callable,
+    max_workers: int,
+    caps: dict[Hashable, int],
+    expires: Callable[[object], float] | None = None,
+) -> Iterator[tuple[object, Future | None]]:
+    """
+    Runs run(task) for (group, task) pairs on one pool of max_workers threads,
+    with at most caps[group] (default DEFAULT_SITE_CONCURRENCY) tasks of a group
+    running at once. A task is only submitted once its group has room, so no
+    worker sits blocked on a busy group. Yields (task, future) as tasks finish.
+    With expires, a task still running at expires(task), a time.monotonic()
+    value taken when it is due to be submitted, is yielded with None instead of
+    its future and no longer waited for; its slot goes to the next task, and a
+    task already expired when its turn comes is yielded with None unsubmitted.
+    """
+    if max_workers < 1 or any(cap < 1 for cap in caps.values()):
+        raise ValueError(
+            f"Invalid concurrency: max_workers={max_workers}, caps={caps}, "
+            "expected at least 1"
+        )
+    pending = defaultdict(deque)
+    for group, task in tasks:
+        pending[group].append(task)
+    running = defaultdict(int)
+    in_flight = {}
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def submit_ready() -> list:
+        """Submits the tasks whose group has room, returning the expired ones"""
+        expired = []
+        for group, queue in pending.items():
+            cap = caps.get(group, DEFAULT_SITE_CONCURRENCY)
+            while queue and running[group] < cap and len(in_flight) < max_workers:
+                task = queue.popleft()
+                expires_at = math.inf if expires is None else expires(task)
+                if expires_at <= time.monotonic():
+                    expired.append(task)
+                    continue
+                running[group] += 1
+                in_flight[executor.submit(run, task)] = (group, task, expires_at)
+        return expired
+
+    try:
+        while True:
+            for task in submit_ready():
+                yield task, None
+            if not in_flight:
+                break
+            expires_at = min(at for _, _, at in in_flight.values())
+            timeout = (
+                None
+                if expires_at == math.inf
+                else max(0.0, expires_at - time.monotonic())
+            )
+            done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                group, task, _ = in_flight.pop(future)
+                running[group] -= 1
+                yield task, future
+            now = time.monotonic()
+            for future, (group, task, at) in list(in_flight.items()):
+                if at <= now:
+                    # left to finish on its thread, unwaited for
+                    del in_flight[future]
+                    running[group] -= 1
+                    yield task, None
+    finally:
+        # abandoned tasks, and those of an abandoned iterator, are not waited for
+        executor.shutdown(wait=False, cancel_futures=True)
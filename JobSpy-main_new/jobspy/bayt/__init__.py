@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import random
-import time
-
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
+from jobspy.cache import ResponseCache
+from jobspy.store import JobStore
+from jobspy.parse import parse_html
 from jobspy.model import (
     Scraper,
     ScraperInput,
@@ -14,20 +14,32 @@ from jobspy.model import (
     Location,
     Country,
 )
-from jobspy.util import create_logger, create_session
+from jobspy.util import create_logger, create_session, stable_id
 
 log = create_logger("Bayt")
 
+# only the job listings of a search page are built into a tree
+JOB_LISTINGS = SoupStrainer("li", attrs={"data-js-job": True})
+
 
 class BaytScraper(Scraper):
     base_url = "https://www.bayt.com"
-    delay = 2
-    band_delay = 3
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        cache: ResponseCache | None = None,
+        job_store: JobStore | None = None,
     ):
-        super().__init__(Site.BAYT, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(
+            Site.BAYT,
+            proxies=proxies,
+            ca_cert=ca_cert,
+            cache=cache,
+            job_store=job_store,
+        )
         self.scraper_input = None
         self.session = None
         self.country = "worldwide"
@@ -35,7 +47,12 @@ class BaytScraper(Scraper):
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         self.scraper_input = scraper_input
         self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            is_tls=False,
+            has_retry=True,
+            rate_limit=True,
+            shared=self.site,
         )
         job_list: list[JobPost] = []
         page = 1
@@ -44,6 +61,9 @@ class BaytScraper(Scraper):
         )
 
         while len(job_list) < results_wanted:
+            if self.out_of_time():
+                log.warning("time budget spent, returning jobs found so far")
+                break
             log.info(f"Fetching Bayt jobs page {page}")
             job_elements = self._fetch_jobs(self.scraper_input.search_term, page)
             if not job_elements:
@@ -54,6 +74,17 @@ class BaytScraper(Scraper):
                     "First job element snippet:\n" + job_elements[0].prettify()[:500]
                 )
 
+            page_urls = [
+                self._extract_job_url(job.find("h2"))
+                for job in job_elements
+                if job.find("h2")
+            ]
+            if self.page_is_known(
+                scraper_input, [f"bayt-{stable_id(url)}" for url in page_urls if url]
+            ):
+                log.info("search page is made entirely of known jobs, stopping")
+                break
+
             initial_count = len(job_list)
             for job in job_elements:
                 try:
@@ -76,7 +107,6 @@ class BaytScraper(Scraper):
                 break
 
             page += 1
-            time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
 
         job_list = job_list[: scraper_input.results_wanted]
         return JobResponse(jobs=job_list)
@@ -87,9 +117,9 @@ class BaytScraper(Scraper):
         """
         try:
             url = f"{self.base_url}/en/international/jobs/{query}-jobs/?page={page}"
-            response = self.session.get(url)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = parse_html(response.text, JOB_LISTINGS)
             job_listings = soup.find_all("li", attrs={"data-js-job": ""})
             log.debug(f"Found {len(job_listings)} job listing elements")
             return job_listings
@@ -123,7 +153,7 @@ class BaytScraper(Scraper):
         location_tag = job.find("div", class_="t-mute t-small")
         location = location_tag.get_text(strip=True) if location_tag else None
 
-        job_id = f"bayt-{abs(hash(job_url))}"
+        job_id = f"bayt-{stable_id(job_url)}"
         location_obj = Location(
             city=location,
             country=Country.from_string(self.country),
@@ -1,23 +1,24 @@
 # __init__.py
 from __future__ import annotations
 
-import random
-import time
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from bs4.element import Tag
 
+from jobspy.cache import ResponseCache
+from jobspy.store import JobStore
 from jobspy.exception import BDJobsException
-from jobspy.bdjobs.constant import headers, search_params
+from jobspy.bdjobs.constant import headers, job_selectors, search_params
 from jobspy.bdjobs.util import (
     parse_location,
     parse_date,
     find_job_listings,
     is_job_remote,
 )
+from jobspy.parse import class_pattern, parse_html
 from jobspy.model import (
     JobPost,
     Location,
@@ -34,24 +35,41 @@ from jobspy.util import (
     create_logger,
     remove_attributes,
     markdown_converter,
+    stable_id,
 )
 
 log = create_logger("BDJobs")
 
+# only the job cards of a search page are built into a tree
+JOB_CARDS = SoupStrainer(
+    "div",
+    class_=class_pattern(*(selector.split(".", 1)[1] for selector in job_selectors)),
+)
+
 
 class BDJobs(Scraper):
     base_url = "https://jobs.bdjobs.com"
     search_url = "https://jobs.bdjobs.com/jobsearch.asp"
-    delay = 2
-    band_delay = 3
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        cache: ResponseCache | None = None,
+        job_store: JobStore | None = None,
     ):
         """
         Initializes BDJobsScraper with the BDJobs job search url
         """
-        super().__init__(Site.BDJOBS, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(
+            Site.BDJOBS,
+            proxies=proxies,
+            ca_cert=ca_cert,
+            user_agent=user_agent,
+            cache=cache,
+            job_store=job_store,
+        )
         self.session = create_session(
             proxies=self.proxies,
             ca_cert=ca_cert,
@@ -59,6 +77,10 @@ class BDJobs(Scraper):
             has_retry=True,
             delay=5,
             clear_cookies=True,
+            cache=self.cache,
+            cache_ttl=self.cache_ttl,
+            rate_limit=True,
+            shared=self.site,
         )
         self.session.headers.update(headers)
         self.scraper_input = None
@@ -83,6 +105,9 @@ class BDJobs(Scraper):
         continue_search = lambda: len(job_list) < scraper_input.results_wanted
 
         while continue_search():
+            if self.out_of_time():
+                log.warning("time budget spent, returning jobs found so far")
+                break
             request_count += 1
             log.info(f"search page: {request_count}")
 
@@ -101,14 +126,26 @@ class BDJobs(Scraper):
                     log.error(f"BDJobs response status code {response.status_code}")
                     break
 
-                soup = BeautifulSoup(response.text, "html.parser")
-                job_cards = find_job_listings(soup)
+                # cards found through their detail links need the full page
+                job_cards = find_job_listings(
+                    parse_html(response.text, JOB_CARDS)
+                ) or find_job_listings(parse_html(response.text))
 
                 if not job_cards or len(job_cards) == 0:
                     log.info("No more job listings found")
                     break
 
                 log.info(f"Found {len(job_cards)} job cards on page {page}")
+                page_links = [
+                    job_card.find("a", href=lambda h: h and "jobdetail" in h.lower())
+                    for job_card in job_cards
+                ]
+                if self.page_is_known(
+                    scraper_input,
+                    [self._job_url_and_id(link)[1] for link in page_links if link],
+                ):
+                    log.info("search page is made entirely of known jobs, stopping")
+                    break
 
                 for job_card in job_cards:
                     try:
@@ -123,8 +160,6 @@ class BDJobs(Scraper):
                         log.error(f"Error processing job card: {str(e)}")
 
                 page += 1
-                # Add delay between requests
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
 
             except Exception as e:
                 log.error(f"Error during scraping: {str(e)}")
@@ -133,6 +168,24 @@ class BDJobs(Scraper):
         job_list = job_list[: scraper_input.results_wanted]
         return JobResponse(jobs=job_list)
 
+    def _job_url_and_id(self, job_link: Tag) -> tuple[str, str]:
+        """
+        Resolves the job URL of a card link and the job ID it carries
+        :param job_link: Anchor pointing at the job detail page
+        :return: job URL and job ID
+        """
+        job_url = job_link.get("href")
+        if not job_url.startswith("http"):
+            job_url = urljoin(self.base_url, job_url)
+
+        # Extract job ID from URL
+        job_id = (
+            job_url.split("jobid=")[-1].split("&")[0]
+            if "jobid=" in job_url
+            else f"bdjobs-{stable_id(job_url)}"
+        )
+        return job_url, job_id
+
     def _process_job(self, job_card: Tag) -> Optional[JobPost]:
         """
         Processes a job card element into a JobPost object
@@ -144,17 +197,7 @@ class BDJobs(Scraper):
             job_link = job_card.find("a", href=lambda h: h and "jobdetail" in h.lower())
             if not job_link:
                 return None
-
-            job_url = job_link.get("href")
-            if not job_url.startswith("http"):
-                job_url = urljoin(self.base_url, job_url)
-
-            # Extract job ID from URL
-            job_id = (
-                job_url.split("jobid=")[-1].split("&")[0]
-                if "jobid=" in job_url
-                else f"bdjobs-{hash(job_url)}"
-            )
+            job_url, job_id = self._job_url_and_id(job_link)
 
             # Extract title
             title = job_link.get_text(strip=True)
@@ -238,8 +281,12 @@ class BDJobs(Scraper):
                 site=self.site,
             )
 
-            # Always fetch description for BDJobs
-            job_details = self._get_job_details(job_url)
+            # Always fetch description for BDJobs, unless an earlier run stored it
+            job_details = self.stored_details(
+                self.scraper_input, job_id, ("description", "job_type")
+            ) or self.fetch_details(
+                self.scraper_input, job_id, self._get_job_details, job_url
+            )
             job_post.description = job_details.get("description", "")
             job_post.job_type = job_details.get("job_type", "")
 
@@ -255,11 +302,11 @@ class BDJobs(Scraper):
         :return: Dictionary with job details
         """
         try:
-            response = self.session.get(job_url, timeout=60)
+            response = self.session.get(job_url, timeout=60, use_cache=True)
             if response.status_code != 200:
                 return {}
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = parse_html(response.text)
 
             # Find job description - IMPROVED based on correct.py
             description = ""
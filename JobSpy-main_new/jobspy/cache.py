@@ -0,0 +1,297 @@
+"""
+jobspy.cache
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the persistent HTTP response cache used for job detail pages.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import formatdate
+from typing import Callable
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from jobspy.model import Site
+
+DAY = 24 * 3600
+
+# how long a cached page is served without asking the site again
+DEFAULT_TTLS = {
+    Site.LINKEDIN: DAY,
+    Site.ZIP_RECRUITER: DAY,
+    Site.INTERNSHALA: DAY,
+    Site.BDJOBS: DAY,
+}
+DEFAULT_TTL = 12 * 3600
+# least recently used entries read per eviction step
+EVICTION_BATCH = 64
+# a hit only rewrites an entry's last access once it is older than this, so
+# reads rarely write; eviction order is only as fine as these seconds
+ACCESS_TIME_RESOLUTION = 600
+
+
+@dataclass
+class CachedEntry:
+    url: str
+    status_code: int
+    headers: dict
+    content: bytes
+    stored_at: float
+    ttl: int
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.stored_at + self.ttl
+
+    def revalidation_headers(self) -> dict:
+        headers = CaseInsensitiveDict(self.headers)
+        conditional = {}
+        if headers.get("etag"):
+            conditional["If-None-Match"] = headers["etag"]
+        if headers.get("last-modified"):
+            conditional["If-Modified-Since"] = headers["last-modified"]
+        elif not conditional:
+            conditional["If-Modified-Since"] = formatdate(
+                self.stored_at, usegmt=True
+            )
+        return conditional
+
+    def to_response(self) -> requests.Response:
+        response = requests.Response()
+        response.url = self.url
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = "utf-8"
+        response._content = self.content
+        response.from_cache = True
+        return response
+
+
+class ResponseCache:
+    """
+    SQLite store of responses keyed by method, URL and body, with per-site TTLs,
+    ETag/Last-Modified revalidation and least-recently-used eviction once the
+    stored bodies exceed max_bytes
+    """
+
+    def __init__(
+        self,
+        path: str = "jobspy_cache.sqlite",
+        max_bytes: int = 512 * 1024 * 1024,
+        ttls: dict[Site, int] | None = None,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status_code INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                content BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                ttl INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)"
+        )
+        # running total of the stored bodies, kept by triggers so that every
+        # process writing to the file keeps it right; summed once for older files
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_size (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                total INTEGER NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "INSERT OR IGNORE INTO cache_size"
+            " SELECT 0, COALESCE(SUM(size), 0) FROM responses"
+        )
+        self._conn.executescript(
+            """
+            CREATE TRIGGER IF NOT EXISTS responses_size_insert AFTER INSERT ON responses
+            BEGIN
+                UPDATE cache_size SET total = total + new.size WHERE id = 0;
+            END;
+            CREATE TRIGGER IF NOT EXISTS responses_size_update
+            AFTER UPDATE OF size ON responses
+            BEGIN
+                UPDATE cache_size SET total = total - old.size + new.size WHERE id = 0;
+            END;
+            CREATE TRIGGER IF NOT EXISTS responses_size_delete AFTER DELETE ON responses
+            BEGIN
+                UPDATE cache_size SET total = total - old.size WHERE id = 0;
+            END;
+            """
+        )
+        self._conn.commit()
+
+    def ttl_for(self, site: Site) -> int:
+        return self.ttls.get(site, DEFAULT_TTL)
+
+    @staticmethod
+    def make_key(
+        method: str,
+        url: str,
+        params: dict | None = None,
+        data: str | bytes | dict | None = None,
+        json_body: dict | list | None = None,
+    ) -> str:
+        if params:
+            url = f"{url}{'&' if '?' in url else '?'}{urlencode(sorted(params.items()), doseq=True)}"
+        if isinstance(data, dict):
+            data = urlencode(sorted(data.items()), doseq=True)
+        if isinstance(data, str):
+            data = data.encode()
+        body = data or b""
+        if json_body is not None:
+            body += json.dumps(json_body, sort_keys=True).encode()
+        digest = hashlib.sha256(f"{method.upper()} {url}\n".encode() + body)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> CachedEntry | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status_code, headers, content, stored_at, ttl, last_access"
+                " FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if now - row[-1] >= ACCESS_TIME_RESOLUTION:
+                self._conn.execute(
+                    "UPDATE responses SET last_access = ? WHERE key = ?", (now, key)
+                )
+                self._conn.commit()
+        url, status_code, headers, content, stored_at, ttl, _ = row
+        return CachedEntry(url, status_code, json.loads(headers), content, stored_at, ttl)
+
+    def put(self, key: str, response, ttl: int):
+        headers = {
+            name: ", ".join(value) if isinstance(value, list) else value
+            for name, value in response.headers.items()
+        }
+        content = response.text.encode("utf-8")
+        now = time.time()
+        with self._lock:
+            # an upsert rather than INSERT OR REPLACE, whose implicit delete
+            # does not fire the size triggers
+            self._conn.execute(
+                "INSERT INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (key) DO UPDATE SET url = excluded.url,"
+                " status_code = excluded.status_code, headers = excluded.headers,"
+                " content = excluded.content, size = excluded.size,"
+                " stored_at = excluded.stored_at, ttl = excluded.ttl,"
+                " last_access = excluded.last_access",
+                (
+                    key,
+                    str(response.url),
+                    response.status_code,
+                    json.dumps(headers),
+                    content,
+                    len(content),
+                    now,
+                    ttl,
+                    now,
+                ),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def refresh(self, key: str, ttl: int):
+        """Marks an entry fresh again after the site answered 304 Not Modified"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ?, ttl = ?, last_access = ? WHERE key = ?",
+                (now, ttl, now, key),
+            )
+            self._conn.commit()
+
+    def invalidate(self, method: str, url: str, **kwargs):
+        """Drops a stored response, e.g. a login wall served instead of the job page"""
+        key = self.make_key(
+            method, url, kwargs.get("params"), kwargs.get("data"), kwargs.get("json")
+        )
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def _evict(self):
+        """Drops the least recently used entries while the bodies exceed max_bytes"""
+        while True:
+            (total,) = self._conn.execute(
+                "SELECT total FROM cache_size WHERE id = 0"
+            ).fetchone()
+            if total <= self.max_bytes:
+                return
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY last_access LIMIT ?",
+                (EVICTION_BATCH,),
+            ).fetchall()
+            if not rows:
+                return
+            evicted = []
+            for key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                evicted.append((key,))
+                total -= size
+            self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def fetch(
+        self,
+        send: Callable[..., object],
+        method: str,
+        url: str,
+        ttl: int,
+        **kwargs,
+    ):
+        """
+        Serves a fresh cached response without touching the network, revalidates a
+        stale one with a conditional request, and stores new 200 responses
+        :param send: performs the real request, called with (method, url, **kwargs)
+        """
+        key = self.make_key(
+            method, url, kwargs.get("params"), kwargs.get("data"), kwargs.get("json")
+        )
+        entry = self.get(key)
+        if entry and entry.is_fresh:
+            return entry.to_response()
+        if entry:
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                **entry.revalidation_headers(),
+            }
+        response = send(method, url, **kwargs)
+        if entry and response.status_code == 304:
+            self.refresh(key, ttl)
+            return entry.to_response()
+        if response.status_code == 200:
+            self.put(key, response, ttl)
+        return response
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,81 @@
+"""
+jobspy.deadline
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the time budgets that cut a site's scrape short.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+import requests
+
+
+class DeadlineExceeded(requests.Timeout):
+    """
+    Raised instead of sending a request once the time budget is spent; scrapers
+    handle it like any other timeout and return the jobs they have so far
+    """
+
+
+class Deadline:
+    def __init__(self, at: float):
+        self.at = at  # time.monotonic() value
+        # set once the budget stopped a request or pagination, so the scrape
+        # returned fewer jobs than it would have
+        self.cut_short = False
+
+    @classmethod
+    def start(cls, call_deadline: float | None, budget: float | None) -> Deadline | None:
+        """
+        Deadline of a site starting now: its own budget, but no later than the
+        deadline of the whole call; None when neither is set
+        """
+        if budget is None:
+            return None if call_deadline is None else cls(call_deadline)
+        at = time.monotonic() + budget
+        return cls(at if call_deadline is None else min(at, call_deadline))
+
+    def remaining(self) -> float:
+        return self.at - time.monotonic()
+
+    def spent(self) -> bool:
+        """True once the budget is spent, marking the scrape as cut short"""
+        if self.remaining() <= 0:
+            self.cut_short = True
+            return True
+        return False
+
+    def cancel(self):
+        """Spends the budget at once: the scrape's next request is not sent"""
+        self.at = -math.inf
+
+    def exceeded(self, message: str) -> DeadlineExceeded:
+        """The error to raise for work the budget stops"""
+        self.cut_short = True
+        return DeadlineExceeded(message)
+
+
+_current: ContextVar[Deadline | None] = ContextVar("jobspy_deadline", default=None)
+
+
+def current_deadline() -> Deadline | None:
+    return _current.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Deadline | None) -> Iterator[Deadline | None]:
+    """
+    Applies deadline to the requests sent in this context; threads started inside
+    need contextvars.copy_context() to inherit it
+    """
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
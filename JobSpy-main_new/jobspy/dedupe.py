@@ -0,0 +1,286 @@
+"""
+jobspy.dedupe
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the cross-site duplicate detection applied to job records.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import defaultdict
+from difflib import SequenceMatcher
+from functools import lru_cache
+from collections.abc import Mapping
+
+import numpy as np
+
+from jobspy.record import JobRecord
+
+DEDUPE_MODES = ("exact", "fuzzy")
+
+NUM_PERM = 64
+LSH_BANDS = 16
+SHINGLE_SIZE = 3
+# estimated description similarity above which two jobs of a company are merged
+FUZZY_THRESHOLD = 0.8
+# title similarity (difflib ratio) above which two titles name the same role
+TITLE_THRESHOLD = 0.9
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_SHINGLE_MULTIPLIER = 1_000_003
+_rng = np.random.default_rng(seed=1)
+_PERM_A = _rng.integers(1, _MERSENNE_PRIME, size=(NUM_PERM, 1), dtype=np.uint64)
+_PERM_B = _rng.integers(0, _MERSENNE_PRIME, size=(NUM_PERM, 1), dtype=np.uint64)
+
+_NON_WORD = re.compile(r"[^\w\s]+")
+_SPACES = re.compile(r"\s+")
+_COMPANY_SUFFIX = re.compile(
+    r"\b(inc|llc|ltd|limited|corp|corporation|co|company|gmbh|plc|pvt|private)\b"
+)
+# title words sites abbreviate differently
+_TITLE_ABBREVIATIONS = {
+    "sr": "senior",
+    "jr": "junior",
+    "mgr": "manager",
+    "engr": "engineer",
+    "dev": "developer",
+    "asst": "assistant",
+    "assoc": "associate",
+}
+
+
+def normalize_text(value) -> str:
+    if not isinstance(value, str):
+        return ""
+    return _SPACES.sub(" ", _NON_WORD.sub(" ", value.lower())).strip()
+
+
+def normalize_company(value) -> str:
+    return _SPACES.sub(" ", _COMPANY_SUFFIX.sub(" ", normalize_text(value))).strip()
+
+
+def normalize_title(value) -> str:
+    return " ".join(
+        _TITLE_ABBREVIATIONS.get(word, word) for word in normalize_text(value).split()
+    )
+
+
+def normalize_location(value) -> str:
+    """City and state only; sites disagree on whether the country is appended"""
+    if not isinstance(value, str):
+        return ""
+    return normalize_text(", ".join(value.split(",")[:2]))
+
+
+def record_key(record: dict) -> tuple[str, str, str]:
+    return (
+        normalize_company(record.get("company")),
+        normalize_text(record.get("title")),
+        normalize_location(record.get("location")),
+    )
+
+
+def same_role(title: str, other_title: str) -> bool:
+    """Whether two normalized titles are the same or near-identical"""
+    return title == other_title or (
+        SequenceMatcher(None, title, other_title).ratio() >= TITLE_THRESHOLD
+    )
+
+
+def location_parts(value) -> tuple[str, str]:
+    """Normalized city and state"""
+    if not isinstance(value, str):
+        return "", ""
+    city, _, rest = value.partition(",")
+    return normalize_text(city), normalize_text(rest.partition(",")[0])
+
+
+def compatible_locations(location: tuple[str, str], other: tuple[str, str]) -> bool:
+    """
+    Whether two jobs can be in the same place: same city, and same state when
+    both give one; a job without a city is compatible with any place
+    """
+    (city, state), (other_city, other_state) = location, other
+    if not city or not other_city:
+        return True
+    return city == other_city and (not state or not other_state or state == other_state)
+
+
+@lru_cache(maxsize=1 << 16)
+def _word_hash(word: str) -> int:
+    """64-bit blake2b of a word; unlike hash() it is the same in every process"""
+    digest = hashlib.blake2b(word.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def minhash_signature(text: str) -> np.ndarray | None:
+    """
+    MinHash of the word shingles of text; None when text is too short to shingle
+    """
+    words = normalize_text(text).split()
+    if len(words) < SHINGLE_SIZE:
+        return None
+    # shingle hashes are combined from word hashes in numpy rather than joining
+    # every shingle into a string first
+    word_hashes = np.array([_word_hash(word) for word in words], dtype=np.uint64)
+    count = len(words) - SHINGLE_SIZE + 1
+    shingles = np.zeros(count, dtype=np.uint64)
+    for offset in range(SHINGLE_SIZE):
+        shingles = shingles * np.uint64(_SHINGLE_MULTIPLIER) + word_hashes[
+            offset : offset + count
+        ]
+    hashes = np.unique(shingles) & np.uint64(_MERSENNE_PRIME)
+    return ((_PERM_A * hashes + _PERM_B) % np.uint64(_MERSENNE_PRIME)).min(axis=1)
+
+
+def richness(record: dict) -> tuple[int, int]:
+    """Filled-in fields first, description length as the tie breaker"""
+    filled = sum(
+        1 for value in record.values() if value is not None and value == value
+    )
+    description = record.get("description")
+    return filled, len(description) if isinstance(description, str) else 0
+
+
+class _Groups:
+    """Union-find over record indexes"""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i: int, j: int):
+        root_i, root_j = self.find(i), self.find(j)
+        if root_i != root_j:
+            self.parent[max(root_i, root_j)] = min(root_i, root_j)
+
+
+def _merge_exact(records: list[dict], groups: _Groups):
+    # groups of each key with the job id they hold per site: one site lists a
+    # posting once, so its jobs with different ids are different postings
+    groups_by_key = defaultdict(list)
+    for i, record in enumerate(records):
+        key = record_key(record)
+        if not key[0] or not key[1]:
+            continue
+        site, job_id = record.get("site"), record.get("id")
+        for first, ids_by_site in groups_by_key[key]:
+            if ids_by_site.setdefault(site, job_id) == job_id:
+                groups.union(first, i)
+                break
+        else:
+            groups_by_key[key].append((i, {site: job_id}))
+
+
+def _same_posting(first: tuple, second: tuple) -> bool:
+    """
+    Whether two jobs with near-identical descriptions are one posting: companies
+    post the same description for several roles and cities, so the company,
+    role and place must agree too, and one site lists a posting only once
+    """
+    company, title, location, site, job_id = first
+    other_company, other_title, other_location, other_site, other_id = second
+    if company != other_company:
+        return False
+    if site == other_site and job_id != other_id:
+        return False
+    return same_role(title, other_title) and compatible_locations(
+        location, other_location
+    )
+
+
+def _merge_fuzzy(records: list[dict], groups: _Groups):
+    """
+    Locality-sensitive hashing: signatures are split into bands and only jobs
+    sharing a band bucket are compared, keeping the pass roughly linear
+    """
+    rows = NUM_PERM // LSH_BANDS
+    signatures = {}
+    buckets = defaultdict(list)
+    for i, record in enumerate(records):
+        company = normalize_company(record.get("company"))
+        signature = minhash_signature(record.get("description"))
+        if not company or signature is None:
+            continue
+        signatures[i] = signature
+        for band in range(LSH_BANDS):
+            band_key = (band, signature[band * rows : (band + 1) * rows].tobytes())
+            buckets[band_key].append(i)
+
+    postings = {}
+
+    def posting(i: int) -> tuple:
+        if i not in postings:
+            record = records[i]
+            postings[i] = (
+                normalize_company(record.get("company")),
+                normalize_title(record.get("title")),
+                location_parts(record.get("location")),
+                record.get("site"),
+                record.get("id"),
+            )
+        return postings[i]
+
+    # jobs of each group, so a merge can check every pair it joins: a job with
+    # no location must not bridge postings in two different cities
+    group_members = defaultdict(list)
+    for i in range(len(records)):
+        group_members[groups.find(i)].append(i)
+
+    compared = set()
+    for members in buckets.values():
+        for position, i in enumerate(members):
+            for j in members[position + 1 :]:
+                root_i, root_j = groups.find(i), groups.find(j)
+                if (i, j) in compared or root_i == root_j:
+                    continue
+                compared.add((i, j))
+                if not _same_posting(posting(i), posting(j)):
+                    continue
+                if np.mean(signatures[i] == signatures[j]) < FUZZY_THRESHOLD:
+                    continue
+                if all(
+                    _same_posting(posting(a), posting(b))
+                    for a in group_members[root_i]
+                    for b in group_members[root_j]
+                ):
+                    groups.union(i, j)
+                    joined = group_members.pop(root_i) + group_members.pop(root_j)
+                    group_members[groups.find(i)] = joined
+
+
+def dedupe_records(records: list[Mapping], mode: str) -> list[JobRecord]:
+    """
+    Collapses the same posting found on several sites into its richest record
+    :param records: job records as built by scrape_jobs
+    :param mode: "exact" merges jobs with the same normalized company, title and
+        location, unless one site lists them under different ids; "fuzzy" also
+        merges jobs of a company with near-identical titles, compatible locations
+        and near-identical descriptions found on different sites
+    :return: one record per posting with a "sources" field listing the merged sites
+    """
+    if mode not in DEDUPE_MODES:
+        raise ValueError(f"Invalid dedupe mode: {mode}, expected one of {DEDUPE_MODES}")
+    groups = _Groups(len(records))
+    _merge_exact(records, groups)
+    if mode == "fuzzy":
+        _merge_fuzzy(records, groups)
+
+    members = defaultdict(list)
+    for i in range(len(records)):
+        members[groups.find(i)].append(i)
+
+    deduped = []
+    for root in sorted(members):
+        group = [records[i] for i in members[root]]
+        richest = group[0] if len(group) == 1 else max(group, key=richness)
+        sources = list(dict.fromkeys(record.get("site") for record in group))
+        deduped.append(JobRecord(richest, sources=", ".join(filter(None, sources))))
+    return deduped
@@ -6,7 +6,10 @@ import requests
 from typing import Tuple
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
 
+from jobspy.cache import ResponseCache
+from jobspy.store import JobStore
 from jobspy.glassdoor.constant import fallback_token, query_template, headers
 from jobspy.glassdoor.util import (
     get_cursor_for_page,
@@ -34,13 +37,25 @@ log = create_logger("Glassdoor")
 
 class Glassdoor(Scraper):
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        cache: ResponseCache | None = None,
+        job_store: JobStore | None = None,
     ):
         """
         Initializes GlassdoorScraper with the Glassdoor job search url
         """
         site = Site(Site.GLASSDOOR)
-        super().__init__(site, proxies=proxies, ca_cert=ca_cert, user_agent=user_agent)
+        super().__init__(
+            site,
+            proxies=proxies,
+            ca_cert=ca_cert,
+            user_agent=user_agent,
+            cache=cache,
+            job_store=job_store,
+        )
 
         self.base_url = None
         self.country = None
@@ -61,7 +76,10 @@ class Glassdoor(Scraper):
         self.base_url = self.scraper_input.country.get_glassdoor_url()
 
         self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, has_retry=True
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            has_retry=True,
+            shared=(self.site, self.user_agent),
         )
         token = self._get_csrf_token()
         headers["gd-csrf-token"] = token if token else fallback_token
@@ -82,6 +100,9 @@ class Glassdoor(Scraper):
         tot_pages = (scraper_input.results_wanted // self.jobs_per_page) + 2
         range_end = min(tot_pages, self.max_pages + 1)
         for page in range(range_start, range_end):
+            if self.out_of_time():
+                log.warning("time budget spent, returning jobs found so far")
+                break
             log.info(f"search page: {page} / {range_end - 1}")
             try:
                 jobs, cursor = self._fetch_jobs_page(
@@ -132,10 +153,18 @@ class Glassdoor(Scraper):
             return jobs, None
 
         jobs_data = res_json["data"]["jobListings"]["jobListings"]
+        if self.page_is_known(
+            scraper_input,
+            [f'gd-{job["jobview"]["job"]["listingId"]}' for job in jobs_data],
+        ):
+            log.info("search page is made entirely of known jobs, stopping")
+            return jobs, None
 
         with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
             future_to_job_data = {
-                executor.submit(self._process_job, job): job for job in jobs_data
+                # the copied context carries the scrape's deadline into the worker
+                executor.submit(copy_context().run, self._process_job, job): job
+                for job in jobs_data
             }
             for future in as_completed(future_to_job_data):
                 try:
@@ -153,7 +182,9 @@ class Glassdoor(Scraper):
         """
         Fetches csrf token needed for API by visiting a generic page
         """
-        res = self.session.get(f"{self.base_url}/Job/computer-science-jobs.htm")
+        res = self.session.get(
+            f"{self.base_url}/Job/computer-science-jobs.htm", timeout_seconds=15
+        )
         pattern = r'"token":\s*"([^"]+)"'
         matches = re.findall(pattern, res.text)
         token = None
@@ -187,8 +218,20 @@ class Glassdoor(Scraper):
             location = parse_location(location_name)
 
         compensation = parse_compensation(job["header"])
+        stored = self.stored_details(
+            self.scraper_input, f"gd-{job_id}", ("description",)
+        )
         try:
-            description = self._fetch_job_description(job_id)
+            description = (
+                stored["description"]
+                if stored
+                else self.fetch_details(
+                    self.scraper_input,
+                    f"gd-{job_id}",
+                    self._fetch_job_description,
+                    job_id,
+                )
+            )
         except:
             description = None
         company_url = f"{self.base_url}Overview/W-EI_IE{company_id}.htm"
@@ -246,7 +289,7 @@ class Glassdoor(Scraper):
                 """,
             }
         ]
-        res = requests.post(url, json=body, headers=headers)
+        res = self.session.post(url, json=body, headers=headers, timeout=15)
         if res.status_code != 200:
             return None
         data = res.json()[0]
@@ -259,7 +302,7 @@ class Glassdoor(Scraper):
         if not location or is_remote:
             return "11047", "STATE"  # remote options
         url = f"{self.base_url}/findPopularLocationAjax.htm?maxLocationsToReturn=10&term={location}"
-        res = self.session.get(url)
+        res = self.session.get(url, timeout_seconds=15)
         if res.status_code != 200:
             if res.status_code == 429:
                 err = f"429 Response - Blocked by Glassdoor for too many requests"
@@ -6,6 +6,8 @@ import json
 from typing import Tuple
 from datetime import datetime, timedelta
 
+from jobspy.cache import ResponseCache
+from jobspy.store import JobStore
 from jobspy.google.constant import headers_jobs, headers_initial, async_param
 from jobspy.model import (
     Scraper,
@@ -22,13 +24,24 @@ from jobspy.google.util import log, find_job_info_initial_page, find_job_info
 
 class Google(Scraper):
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        cache: ResponseCache | None = None,
+        job_store: JobStore | None = None,
     ):
         """
         Initializes Google Scraper with the Goodle jobs search url
         """
         site = Site(Site.GOOGLE)
-        super().__init__(site, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(
+            site,
+            proxies=proxies,
+            ca_cert=ca_cert,
+            cache=cache,
+            job_store=job_store,
+        )
 
         self.country = None
         self.session = None
@@ -48,7 +61,11 @@ class Google(Scraper):
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
 
         self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            is_tls=False,
+            has_retry=True,
+            shared=self.site,
         )
         forward_cursor, job_list = self._get_initial_cursor_and_jobs()
         if forward_cursor is None:
@@ -63,6 +80,9 @@ class Google(Scraper):
             len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset
             and forward_cursor
         ):
+            if self.out_of_time():
+                log.warning("time budget spent, returning jobs found so far")
+                break
             log.info(
                 f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
             )
@@ -74,6 +94,9 @@ class Google(Scraper):
             if not jobs:
                 log.info(f"found no jobs on page: {page}")
                 break
+            if self.page_is_known(scraper_input, [job.id for job in jobs]):
+                log.info("search page is made entirely of known jobs, stopping")
+                break
             job_list += jobs
             page += 1
         return JobResponse(
@@ -121,7 +144,9 @@ class Google(Scraper):
             query = self.scraper_input.google_search_term
 
         params = {"q": query, "udm": "8"}
-        response = self.session.get(self.url, headers=headers_initial, params=params)
+        response = self.session.get(
+            self.url, headers=headers_initial, params=params, timeout=10
+        )
 
         pattern_fc = r'<div jsname="Yust4d"[^>]+data-async-fc="([^"]+)"'
         match_fc = re.search(pattern_fc, response.text)
@@ -136,7 +161,9 @@ class Google(Scraper):
 
     def _get_jobs_next_page(self, forward_cursor: str) -> Tuple[list[JobPost], str]:
         params = {"fc": [forward_cursor], "fcv": ["3"], "async": [async_param]}
-        response = self.session.get(self.jobs_url, headers=headers_jobs, params=params)
+        response = self.session.get(
+            self.jobs_url, headers=headers_jobs, params=params, timeout=10
+        )
         return self._parse_jobs(response.text)
 
     def _parse_jobs(self, job_data: str) -> Tuple[list[JobPost], str]:
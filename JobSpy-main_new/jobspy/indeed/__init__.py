@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import math
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
 from datetime import datetime
 from typing import Tuple
 
+from jobspy.cache import ResponseCache
+from jobspy.store import JobStore
 from jobspy.indeed.constant import job_search_query, api_headers
 from jobspy.indeed.util import is_job_remote, get_compensation, get_job_type
 from jobspy.model import (
@@ -28,15 +32,25 @@ log = create_logger("Indeed")
 
 class Indeed(Scraper):
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        cache: ResponseCache | None = None,
+        job_store: JobStore | None = None,
     ):
         """
         Initializes IndeedScraper with the Indeed API url
         """
-        super().__init__(Site.INDEED, proxies=proxies)
+        super().__init__(
+            Site.INDEED,
+            proxies=proxies,
+            cache=cache,
+            job_store=job_store,
+        )
 
         self.session = create_session(
-            proxies=self.proxies, ca_cert=ca_cert, is_tls=False
+            proxies=self.proxies, ca_cert=ca_cert, is_tls=False, shared=self.site
         )
         self.scraper_input = None
         self.jobs_per_page = 100
@@ -58,21 +72,41 @@ class Indeed(Scraper):
         self.base_url = f"https://{domain}.indeed.com"
         self.headers = api_headers.copy()
         self.headers["indeed-co"] = self.scraper_input.country.indeed_domain_value
-        job_list = []
         page = 1
 
         cursor = None
 
-        while len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset:
-            log.info(
-                f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
-            )
-            jobs, cursor = self._scrape_page(cursor)
-            if not jobs:
-                log.info(f"found no jobs on page: {page}")
-                break
-            job_list += jobs
-            page += 1
+        # each page is processed by the worker pool while the next one, whose
+        # cursor the decoded page gives, is fetched; futures are kept in page order
+        page_futures: list[Future] = []
+        wanted = scraper_input.results_wanted + scraper_input.offset
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            while len(self.seen_urls) < wanted:
+                if self.out_of_time():
+                    log.warning("time budget spent, returning jobs found so far")
+                    break
+                log.info(
+                    f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
+                )
+                try:
+                    jobs, cursor = self._fetch_page(cursor)
+                except Exception as e:
+                    # the pages already handed to the pool are kept; a
+                    # DeadlineExceeded has marked the scrape as cut short
+                    log.error(f"failed to get jobs on page: {page}, {e}")
+                    break
+                if not jobs:
+                    log.info(f"found no jobs on page: {page}")
+                    break
+                page_futures.append(
+                    # the copied context carries the scrape's deadline into the worker
+                    executor.submit(copy_context().run, self._process_page, jobs)
+                )
+                if cursor is None:
+                    break
+                page += 1
+
+        job_list = [job for future in page_futures for job in future.result()]
         return JobResponse(
             jobs=job_list[
                 scraper_input.offset : scraper_input.offset
@@ -80,11 +114,11 @@ class Indeed(Scraper):
             ]
         )
 
-    def _scrape_page(self, cursor: str | None) -> Tuple[list[JobPost], str | None]:
+    def _fetch_page(self, cursor: str | None) -> Tuple[list[dict], str | None]:
         """
-        Scrapes a page of Indeed for jobs with scraper_input criteria
+        Fetches a page of Indeed for jobs with scraper_input criteria
         :param cursor:
-        :return: jobs found on page, next page cursor
+        :return: job dicts on page not seen on earlier pages, next page cursor
         """
         jobs = []
         new_cursor = None
@@ -125,14 +159,22 @@ class Indeed(Scraper):
         data = response.json()
         jobs = data["data"]["jobSearch"]["results"]
         new_cursor = data["data"]["jobSearch"]["pageInfo"]["nextCursor"]
+        if self.page_is_known(
+            self.scraper_input, [f'in-{job["job"]["key"]}' for job in jobs]
+        ):
+            log.info("search page is made entirely of known jobs, stopping")
+            return [], None
 
-        job_list = []
+        new_jobs = []
         for job in jobs:
-            processed_job = self._process_job(job["job"])
-            if processed_job:
-                job_list.append(processed_job)
+            job_url = f'{self.base_url}/viewjob?jk={job["job"]["key"]}'
+            if job_url not in self.seen_urls:
+                self.seen_urls.add(job_url)
+                new_jobs.append(job["job"])
+        return new_jobs, new_cursor
 
-        return job_list, new_cursor
+    def _process_page(self, jobs: list[dict]) -> list[JobPost]:
+        return [self._process_job(job) for job in jobs]
 
     def _build_filters(self):
         """
@@ -192,16 +234,13 @@ class Indeed(Scraper):
                 """
         return filters_str
 
-    def _process_job(self, job: dict) -> JobPost | None:
+    def _process_job(self, job: dict) -> JobPost:
         """
         Parses the job dict into JobPost model
         :param job: dict to parse
-        :return: JobPost if it's a new job
+        :return: JobPost
         """
         job_url = f'{self.base_url}/viewjob?jk={job["key"]}'
-        if job_url in self.seen_urls:
-            return
-        self.seen_urls.add(job_url)
         description = job["description"]["html"]
         if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
             description = markdown_converter(description)
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
-import random
-import time
+import re
 from datetime import datetime, timedelta, date
 from typing import Optional
 from urllib.parse import urljoin, quote
 
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from bs4.element import Tag
 
+from jobspy.cache import ResponseCache
+from jobspy.store import JobStore
 from jobspy.exception import InternshalaException
 from jobspy.internshala.constant import headers
+from jobspy.parse import parse_html
 from jobspy.internshala.util import (
     find_job_cards,
     parse_location,
@@ -35,20 +37,34 @@ from jobspy.util import (
     plain_converter,
     create_session,
     create_logger,
+    stable_id,
 )
 
 log = create_logger("Internshala")
 
+# only the cards of a listing page are built into a tree
+LISTING_CARDS = SoupStrainer("div", class_=re.compile("individual_internship"))
+
 
 class Internshala(Scraper):
     base_url = "https://internshala.com"
-    delay = 2
-    band_delay = 3
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        cache: ResponseCache | None = None,
+        job_store: JobStore | None = None,
     ):
-        super().__init__(Site.INTERNSHALA, proxies=proxies, ca_cert=ca_cert, user_agent=user_agent)
+        super().__init__(
+            Site.INTERNSHALA,
+            proxies=proxies,
+            ca_cert=ca_cert,
+            user_agent=user_agent,
+            cache=cache,
+            job_store=job_store,
+        )
         self.session = create_session(
             proxies=self.proxies,
             ca_cert=ca_cert,
@@ -56,6 +72,11 @@ class Internshala(Scraper):
             has_retry=True,
             delay=5,
             clear_cookies=True,
+            cache=self.cache,
+            cache_ttl=self.cache_ttl,
+            rate_limit=True,
+            # the user agent is set on the session below
+            shared=(self.site, user_agent),
         )
         self.session.headers.update(headers)
         if user_agent:
@@ -96,6 +117,9 @@ class Internshala(Scraper):
 
             page = 1
             while len(job_list) < results_wanted:
+                if self.out_of_time():
+                    log.warning("time budget spent, returning jobs found so far")
+                    break
                 url = urljoin(self.base_url, path)
                 if page > 1:
                     if url.endswith("/"):
@@ -114,12 +138,22 @@ class Internshala(Scraper):
                     log.warning(f"Internshala response status code {resp.status_code} for {url}")
                     break
 
-                soup = BeautifulSoup(resp.text, "html.parser")
-                cards = find_job_cards(soup)
+                # cards missing the usual class are only found in the full page
+                cards = find_job_cards(
+                    parse_html(resp.text, LISTING_CARDS)
+                ) or find_job_cards(parse_html(resp.text))
                 if not cards:
                     log.info("Internshala: no more job cards found")
                     break
 
+                page_urls = [self._card_job_url(card) for card in cards]
+                if self.page_is_known(
+                    scraper_input,
+                    [f"internshala-{stable_id(url)}" for url in page_urls if url],
+                ):
+                    log.info("Internshala: page is made entirely of known jobs")
+                    break
+
                 page_added = 0
                 for card in cards:
                     employment_type = (card.get("employment_type") or "").strip().lower()
@@ -154,13 +188,20 @@ class Internshala(Scraper):
                     break
 
                 page += 1
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
 
         return JobResponse(jobs=job_list[:results_wanted])
 
+    def _card_job_url(self, card: Tag) -> Optional[str]:
+        link = self._card_link(card)
+        return urljoin(self.base_url, link.get("href")) if link else None
+
+    @staticmethod
+    def _card_link(card: Tag) -> Optional[Tag]:
+        return card.find("a", href=lambda h: h and ("/internship/detail/" in h or "/job/detail/" in h))
+
     def _process_card(self, card: Tag, posted_cutoff: Optional[datetime], kind: str) -> Optional[JobPost]:
 
-        link = card.find("a", href=lambda h: h and ("/internship/detail/" in h or "/job/detail/" in h))
+        link = self._card_link(card)
         if not link:
             return None
 
@@ -228,7 +269,12 @@ class Internshala(Scraper):
 
         description: str | None = None
         if self.scraper_input and self.scraper_input.linkedin_fetch_description:
-            description = self._fetch_description(job_url)
+            description = self.fetch_details(
+                self.scraper_input,
+                f"internshala-{stable_id(job_url)}",
+                self._fetch_description,
+                job_url,
+            )
 
         if description:
             if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
@@ -248,7 +294,7 @@ class Internshala(Scraper):
             listing_type = "internship"
 
         job_post = JobPost(
-            id=f"internshala-{hash(job_url)}",
+            id=f"internshala-{stable_id(job_url)}",
             title=title,
             company_name=company_name,
             job_url=job_url,
@@ -265,7 +311,11 @@ class Internshala(Scraper):
 
     def _fetch_description(self, job_url: str) -> Optional[str]:
         try:
-            resp = self.session.get(job_url, timeout=self.scraper_input.request_timeout if self.scraper_input else 60)
+            resp = self.session.get(
+                job_url,
+                timeout=self.scraper_input.request_timeout if self.scraper_input else 60,
+                use_cache=True,
+            )
         except Exception as e:
             log.error(f"Internshala description fetch failed for {job_url}: {e}")
             return None
@@ -274,7 +324,7 @@ class Internshala(Scraper):
             log.warning(f"Internshala description fetch status {resp.status_code} for {job_url}")
             return None
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = parse_html(resp.text)
 
         about_header = soup.find(lambda tag: tag.name in ["h2", "h3"] and "about the internship" in tag.get_text(strip=True).lower())
         if about_header:
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
 import math
-import random
-import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
 from datetime import datetime
 from typing import Optional
 from urllib.parse import urlparse, urlunparse, unquote
 
 import regex as re
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from bs4.element import Tag
 
+from jobspy.cache import ResponseCache
+from jobspy.store import JobStore
 from jobspy.exception import LinkedInException
 from jobspy.linkedin.constant import headers
+from jobspy.parse import class_pattern, parse_html
 from jobspy.linkedin.util import (
     is_job_remote,
     job_type_code,
@@ -43,20 +46,43 @@ from jobspy.util import (
 
 log = create_logger("LinkedIn")
 
+# only the job cards of a search page are built into a tree
+SEARCH_CARDS = SoupStrainer("div", class_=class_pattern("base-search-card"))
+
 
 class LinkedIn(Scraper):
     base_url = "https://www.linkedin.com"
-    delay = 3
-    band_delay = 4
     jobs_per_page = 25
+    detail_workers = 4
+    # filled in from the job page, so reused from the job store when known
+    detail_fields = (
+        "description",
+        "job_level",
+        "company_industry",
+        "job_type",
+        "job_url_direct",
+        "company_logo",
+        "job_function",
+    )
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        cache: ResponseCache | None = None,
+        job_store: JobStore | None = None,
     ):
         """
         Initializes LinkedInScraper with the LinkedIn job search url
         """
-        super().__init__(Site.LINKEDIN, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(
+            Site.LINKEDIN,
+            proxies=proxies,
+            ca_cert=ca_cert,
+            cache=cache,
+            job_store=job_store,
+        )
         self.session = create_session(
             proxies=self.proxies,
             ca_cert=ca_cert,
@@ -64,6 +90,10 @@ class LinkedIn(Scraper):
             has_retry=True,
             delay=5,
             clear_cookies=True,
+            cache=self.cache,
+            cache_ttl=self.cache_ttl,
+            rate_limit=True,
+            shared=self.site,
         )
         self.session.headers.update(headers)
         self.scraper_input = None
@@ -77,7 +107,9 @@ class LinkedIn(Scraper):
         :return: job_response
         """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
+        # cards are processed (and job pages fetched) by the worker pool while
+        # pagination carries on; futures are kept in card order
+        job_futures: list[Future] = []
         seen_ids = set()
         start = scraper_input.offset // 10 * 10 if scraper_input.offset else 0
         request_count = 0
@@ -85,89 +117,110 @@ class LinkedIn(Scraper):
             scraper_input.hours_old * 3600 if scraper_input.hours_old else None
         )
         continue_search = (
-            lambda: len(job_list) < scraper_input.results_wanted and start < 1000
+            lambda: len(job_futures) < scraper_input.results_wanted and start < 1000
         )
-        while continue_search():
-            request_count += 1
-            log.info(
-                f"search page: {request_count} / {math.ceil(scraper_input.results_wanted / 10)}"
-            )
-            params = {
-                "keywords": scraper_input.search_term,
-                "location": scraper_input.location,
-                "distance": scraper_input.distance,
-                "f_WT": 2 if scraper_input.is_remote else None,
-                "f_JT": (
-                    job_type_code(scraper_input.job_type)
-                    if scraper_input.job_type
-                    else None
-                ),
-                "pageNum": 0,
-                "start": start,
-                "f_AL": "true" if scraper_input.easy_apply else None,
-                "f_C": (
-                    ",".join(map(str, scraper_input.linkedin_company_ids))
-                    if scraper_input.linkedin_company_ids
-                    else None
-                ),
-            }
-            if seconds_old is not None:
-                params["f_TPR"] = f"r{seconds_old}"
-
-            params = {k: v for k, v in params.items() if v is not None}
-            try:
-                response = self.session.get(
-                    f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?",
-                    params=params,
-                    timeout=10,
+        with ThreadPoolExecutor(max_workers=self.detail_workers) as executor:
+            while continue_search():
+                if self.out_of_time():
+                    log.warning("time budget spent, returning jobs found so far")
+                    break
+                request_count += 1
+                log.info(
+                    f"search page: {request_count} / {math.ceil(scraper_input.results_wanted / 10)}"
                 )
-                if response.status_code not in range(200, 400):
-                    if response.status_code == 429:
-                        err = (
-                            f"429 Response - Blocked by LinkedIn for too many requests"
-                        )
+                params = {
+                    "keywords": scraper_input.search_term,
+                    "location": scraper_input.location,
+                    "distance": scraper_input.distance,
+                    "f_WT": 2 if scraper_input.is_remote else None,
+                    "f_JT": (
+                        job_type_code(scraper_input.job_type)
+                        if scraper_input.job_type
+                        else None
+                    ),
+                    "pageNum": 0,
+                    "start": start,
+                    "f_AL": "true" if scraper_input.easy_apply else None,
+                    "f_C": (
+                        ",".join(map(str, scraper_input.linkedin_company_ids))
+                        if scraper_input.linkedin_company_ids
+                        else None
+                    ),
+                }
+                if seconds_old is not None:
+                    params["f_TPR"] = f"r{seconds_old}"
+
+                params = {k: v for k, v in params.items() if v is not None}
+                try:
+                    response = self.session.get(
+                        f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?",
+                        params=params,
+                        timeout=10,
+                    )
+                    if response.status_code not in range(200, 400):
+                        if response.status_code == 429:
+                            err = (
+                                f"429 Response - Blocked by LinkedIn for too many requests"
+                            )
+                        else:
+                            err = f"LinkedIn response status code {response.status_code}"
+                            err += f" - {response.text}"
+                        log.error(err)
+                        break
+                except Exception as e:
+                    if "Proxy responded with" in str(e):
+                        log.error(f"LinkedIn: Bad proxy")
                     else:
-                        err = f"LinkedIn response status code {response.status_code}"
-                        err += f" - {response.text}"
-                    log.error(err)
-                    return JobResponse(jobs=job_list)
-            except Exception as e:
-                if "Proxy responded with" in str(e):
-                    log.error(f"LinkedIn: Bad proxy")
-                else:
-                    log.error(f"LinkedIn: {str(e)}")
-                return JobResponse(jobs=job_list)
+                        log.error(f"LinkedIn: {str(e)}")
+                    break
 
-            soup = BeautifulSoup(response.text, "html.parser")
-            job_cards = soup.find_all("div", class_="base-search-card")
-            if len(job_cards) == 0:
-                return JobResponse(jobs=job_list)
+                soup = parse_html(response.text, SEARCH_CARDS)
+                job_cards = soup.find_all("div", class_="base-search-card")
+                if len(job_cards) == 0:
+                    break
 
-            for job_card in job_cards:
-                href_tag = job_card.find("a", class_="base-card__full-link")
-                if href_tag and "href" in href_tag.attrs:
-                    href = href_tag.attrs["href"].split("?")[0]
-                    job_id = href.split("-")[-1]
+                page_cards = []
+                for job_card in job_cards:
+                    href_tag = job_card.find("a", class_="base-card__full-link")
+                    if href_tag and "href" in href_tag.attrs:
+                        href = href_tag.attrs["href"].split("?")[0]
+                        page_cards.append((job_card, href.split("-")[-1]))
+                if self.page_is_known(
+                    scraper_input, [f"li-{job_id}" for _, job_id in page_cards]
+                ):
+                    log.info("search page is made entirely of known jobs, stopping")
+                    break
 
+                for job_card, job_id in page_cards:
                     if job_id in seen_ids:
                         continue
                     seen_ids.add(job_id)
 
-                    try:
-                        fetch_desc = scraper_input.linkedin_fetch_description
-                        job_post = self._process_job(job_card, job_id, fetch_desc)
-                        if job_post:
-                            job_list.append(job_post)
-                        if not continue_search():
-                            break
-                    except Exception as e:
-                        raise LinkedInException(str(e))
+                    fetch_desc = scraper_input.linkedin_fetch_description
+                    job_futures.append(
+                        # the copied context carries the scrape's deadline into the worker
+                        executor.submit(
+                            copy_context().run,
+                            self._process_job,
+                            job_card,
+                            job_id,
+                            fetch_desc,
+                        )
+                    )
+                    if not continue_search():
+                        break
 
-            if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
-                start += len(job_cards)
+                if continue_search():
+                    start += len(job_cards)
 
-        job_list = job_list[: scraper_input.results_wanted]
+        job_list: list[JobPost] = []
+        for future in job_futures[: scraper_input.results_wanted]:
+            try:
+                job_post = future.result()
+            except Exception as e:
+                raise LinkedInException(str(e))
+            if job_post:
+                job_list.append(job_post)
         return JobResponse(jobs=job_list)
 
     def _process_job(
@@ -218,7 +271,11 @@ class LinkedIn(Scraper):
                 date_posted = None
         job_details = {}
         if full_descr:
-            job_details = self._get_job_details(job_id)
+            job_details = self.stored_details(
+                self.scraper_input, f"li-{job_id}", self.detail_fields
+            ) or self.fetch_details(
+                self.scraper_input, f"li-{job_id}", self._get_job_details, job_id
+            )
             description = job_details.get("description")
         is_remote = is_job_remote(title, description, location)
 
@@ -233,7 +290,7 @@ class LinkedIn(Scraper):
             job_url=f"{self.base_url}/jobs/view/{job_id}",
             compensation=compensation,
             job_type=job_details.get("job_type"),
-            job_level=job_details.get("job_level", "").lower(),
+            job_level=(job_details.get("job_level") or "").lower(),
             company_industry=job_details.get("company_industry"),
             description=job_details.get("description"),
             job_url_direct=job_details.get("job_url_direct"),
@@ -248,17 +305,18 @@ class LinkedIn(Scraper):
         :param job_page_url:
         :return: dict
         """
+        job_page_url = f"{self.base_url}/jobs/view/{job_id}"
         try:
-            response = self.session.get(
-                f"{self.base_url}/jobs/view/{job_id}", timeout=5
-            )
+            response = self.session.get(job_page_url, timeout=5, use_cache=True)
             response.raise_for_status()
         except:
             return {}
         if "linkedin.com/signup" in response.url:
+            if self.cache:
+                self.cache.invalidate("GET", job_page_url)
             return {}
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = parse_html(response.text)
         div_content = soup.find(
             "div", class_=lambda x: x and "show-more-less-html__markup" in x
         )
@@ -0,0 +1,304 @@
+"""
+jobspy.markdown
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the fast HTML to markdown converter for job descriptions.
+
+It follows markdownify's default conversion rule for rule, but over a light tree
+built straight from the html.parser tokenizer instead of a BeautifulSoup tree,
+and only for the tags job boards use in descriptions. Markup with any other
+tag that markdownify converts (tables, images, code, ...) is left to markdownify.
+"""
+
+from __future__ import annotations
+
+import re
+from html.parser import HTMLParser
+
+re_whitespace = re.compile(r"[\t ]+")
+re_all_whitespace = re.compile(r"[\t \r\n]+")
+re_newline_whitespace = re.compile(r"[\t \r\n]*[\r\n][\t \r\n]*")
+re_line_with_content = re.compile(r"^(.*)", flags=re.MULTILINE)
+re_extract_newlines = re.compile(r"^(\n*)((?:.*[^\n])?)(\n*)$", flags=re.DOTALL)
+re_heading = re.compile(r"h(\d+)$")
+
+# whitespace next to these is dropped (markdownify's block-level elements)
+BLOCK_TAGS = frozenset(
+    {"p", "blockquote", "article", "div", "section", "ol", "ul", "li"}
+    | {"dl", "dt", "dd", "table", "thead", "tbody", "tfoot", "tr", "td", "th"}
+    | {f"h{n}" for n in range(1, 10)}
+)
+
+# tags markdownify converts in ways this module does not implement
+UNSUPPORTED_TAGS = frozenset(
+    {"pre", "code", "kbd", "samp", "blockquote", "img", "video", "table"}
+    | {"caption", "figcaption", "thead", "tbody", "tfoot", "tr", "td", "th"}
+    | {"dl", "dt", "dd"}
+)
+
+# elements the html.parser tree builder of bs4 closes as soon as they open
+VOID_TAGS = frozenset(
+    {"area", "base", "br", "col", "embed", "hr", "img", "input", "keygen", "link"}
+    | {"menuitem", "meta", "param", "source", "track", "wbr", "basefont"}
+    | {"bgsound", "command", "frame", "image", "isindex", "nextid", "spacer"}
+)
+
+INLINE_MARKUP = {
+    "b": "**",
+    "strong": "**",
+    "em": "*",
+    "i": "*",
+    "del": "~~",
+    "s": "~~",
+    "sub": "",
+    "sup": "",
+}
+
+
+class Unsupported(Exception):
+    pass
+
+
+class Element:
+    __slots__ = ("name", "attrs", "children", "parent")
+
+    def __init__(self, name: str, attrs: dict, parent: Element | None):
+        self.name = name
+        self.attrs = attrs
+        self.children: list = []
+        self.parent = parent
+
+
+class Ignored:
+    """Comment, doctype or processing instruction: skipped but still a sibling"""
+
+    __slots__ = ()
+    name = None
+
+
+IGNORED = Ignored()
+
+
+class TreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = self.current = Element("[document]", {}, None)
+        self.data: list[str] = []
+
+    def flush(self):
+        if self.data:
+            self.current.children.append("".join(self.data))
+            self.data = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in UNSUPPORTED_TAGS:
+            raise Unsupported(tag)
+        self.flush()
+        element = Element(
+            tag, {name: value or "" for name, value in attrs}, self.current
+        )
+        self.current.children.append(element)
+        if tag not in VOID_TAGS:
+            self.current = element
+
+    def handle_endtag(self, tag):
+        self.flush()
+        element = self.current
+        while element is not None and element.name != tag:
+            element = element.parent
+        if element is not None and element.parent is not None:
+            self.current = element.parent
+
+    def handle_data(self, data):
+        self.data.append(data)
+
+    def handle_comment(self, data):
+        self.flush()
+        self.current.children.append(IGNORED)
+
+    handle_decl = handle_pi = unknown_decl = handle_comment
+
+    def build(self, html: str) -> Element:
+        self.feed(html)
+        self.close()
+        self.flush()
+        return self.root
+
+
+def is_block(node) -> bool:
+    return isinstance(node, Element) and node.name in BLOCK_TAGS
+
+
+def chomp(text: str) -> tuple[str, str, str]:
+    prefix = " " if text and text[0] == " " else ""
+    suffix = " " if text and text[-1] == " " else ""
+    return prefix, suffix, text.strip()
+
+
+def convert_text(text: str, parent: Element, previous, following) -> str:
+    text = re_newline_whitespace.sub("\n", text)
+    text = re_whitespace.sub(" ", text)
+    text = text.replace("*", r"\*").replace("_", r"\_")
+    block_parent = parent.name in BLOCK_TAGS
+    if is_block(previous) or (block_parent and previous is None):
+        text = text.lstrip(" \t\r\n")
+    if is_block(following) or (block_parent and following is None):
+        text = text.rstrip()
+    return text
+
+
+def convert_element(element: Element, inline: bool, in_li: bool) -> str:
+    children = element.children
+    block = element.name in BLOCK_TAGS
+    last = len(children) - 1
+    child_inline = inline or re_heading.match(element.name) is not None
+    child_in_li = in_li or element.name == "li"
+
+    child_strings = []
+    for index, child in enumerate(children):
+        if child is IGNORED:
+            continue
+        previous = children[index - 1] if index else None
+        following = children[index + 1] if index < last else None
+        if isinstance(child, str):
+            if not child.strip() and (
+                (block and (previous is None or following is None))
+                or is_block(previous)
+                or is_block(following)
+            ):
+                continue
+            text = convert_text(child, element, previous, following)
+        else:
+            text = convert_element(child, child_inline, child_in_li)
+        if text:
+            child_strings.append(text)
+
+    # collapse the newlines between children to at most two
+    collapsed = [""]
+    for child_string in child_strings:
+        leading, content, trailing = re_extract_newlines.match(child_string).groups()
+        if collapsed[-1] and leading:
+            previous_trailing = collapsed.pop()
+            leading = "\n" * min(2, max(len(previous_trailing), len(leading)))
+        collapsed.extend((leading, content, trailing))
+    return finish(element, "".join(collapsed), inline, in_li)
+
+
+def finish(element: Element, text: str, inline: bool, in_li: bool) -> str:
+    """Applies the conversion of the element itself to its converted children"""
+    name = element.name
+    if name in INLINE_MARKUP:
+        prefix, suffix, text = chomp(text)
+        if not text:
+            return ""
+        markup = INLINE_MARKUP[name]
+        return f"{prefix}{markup}{text}{markup}{suffix}"
+    if name == "p":
+        if inline:
+            return " " + text.strip(" \t\r\n") + " "
+        text = text.strip(" \t\r\n")
+        return f"\n\n{text}\n\n" if text else ""
+    if name in ("div", "article", "section"):
+        if inline:
+            return " " + text.strip() + " "
+        text = text.strip()
+        return f"\n\n{text}\n\n" if text else ""
+    if name == "br":
+        if inline:
+            return text + " " if text else " "
+        return "  \n" + text
+    if name == "a":
+        prefix, suffix, text = chomp(text)
+        if not text:
+            return ""
+        href = element.attrs.get("href")
+        title = element.attrs.get("title")
+        if text.replace(r"\_", "_") == href and not title:
+            return f"<{href}>"
+        title_part = ' "%s"' % title.replace('"', r"\"") if title else ""
+        return f"{prefix}[{text}]({href}{title_part}){suffix}" if href else text
+    if name in ("ul", "ol"):
+        return convert_list(element, text, in_li)
+    if name == "li":
+        return convert_li(element, text)
+    heading = re_heading.match(name)
+    if heading:
+        if inline:
+            return text
+        level = max(1, min(6, int(heading.group(1))))
+        text = text.strip()
+        if level <= 2:
+            text = text.rstrip()
+            line = ("=" if level == 1 else "-") * len(text)
+            return f"\n\n{text}\n{line}\n\n" if text else ""
+        text = re_all_whitespace.sub(" ", text)
+        return f"\n\n{'#' * level} {text}\n\n"
+    if name == "hr":
+        return "\n\n---\n\n"
+    if name == "q":
+        return '"' + text + '"'
+    if name in ("script", "style"):
+        return ""
+    if name == "[document]":
+        return text.strip("\n")
+    return text
+
+
+def convert_list(element: Element, text: str, in_li: bool) -> str:
+    siblings = element.parent.children
+    following = None
+    for sibling in siblings[siblings.index(element) + 1 :]:
+        if isinstance(sibling, Element) or (
+            isinstance(sibling, str) and sibling.strip()
+        ):
+            following = sibling
+            break
+    before_paragraph = following is not None and (
+        isinstance(following, str) or following.name not in ("ul", "ol")
+    )
+    if in_li:
+        return "\n" + text.rstrip()
+    return "\n\n" + text + ("\n" if before_paragraph else "")
+
+
+def convert_li(element: Element, text: str) -> str:
+    text = text.strip()
+    if not text:
+        return "\n"
+    parent = element.parent
+    if parent.name == "ol":
+        start = parent.attrs.get("start")
+        start = int(start) if start and start.isnumeric() else 1
+        siblings = parent.children
+        previous_items = sum(
+            1
+            for sibling in siblings[: siblings.index(element)]
+            if isinstance(sibling, Element) and sibling.name == "li"
+        )
+        bullet = f"{start + previous_items}."
+    else:
+        depth = -1
+        node = element
+        while node is not None:
+            if node.name == "ul":
+                depth += 1
+            node = node.parent
+        bullet = "*+-"[depth % 3]
+    bullet += " "
+    indent = " " * len(bullet)
+    text = re_line_with_content.sub(
+        lambda match: indent + match.group(1) if match.group(1) else "", text
+    )
+    return bullet + text[len(bullet) :] + "\n"
+
+
+def html_to_markdown(html: str) -> str | None:
+    """
+    Converts html the way markdownify does with its default options
+    :return: markdown, or None when html has tags this converter leaves to markdownify
+    """
+    try:
+        root = TreeBuilder().build(html)
+    except Unsupported:
+        return None
+    return convert_element(root, inline=False, in_li=False)
@@ -0,0 +1,171 @@
+"""
+jobspy.metrics
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the timing metrics collected while scraping, with JSON and
+Prometheus textfile export.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator
+
+
+@dataclass
+class Timing:
+    count: int = 0
+    total: float = 0.0  # seconds
+    max: float = 0.0
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+
+class Metrics:
+    """
+    Timings of a run, per metric name and label set. Pass one to scrape_jobs
+    (metrics=...) to collect:
+
+    - request_seconds: HTTP requests, by site, host and status ("error" when no
+      response came back)
+    - parse_seconds: HTML pages parsed, by site
+    - description_conversion_seconds: descriptions converted, by site, format and
+      whether the conversion cache had them
+    - model_construction_seconds: JobPost, Location and Compensation validation,
+      by site and model
+    - job_normalization_seconds: jobs flattened into result records, by site
+    - dataframe_assembly_seconds: result DataFrames built
+    - webhook_delivery_seconds: webhook posts, by status (see webhook_delivery.py)
+
+    Subclass and override observe() to forward observations elsewhere as well.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timings: dict[tuple[str, tuple[tuple[str, str], ...]], Timing] = {}
+
+    def observe(self, name: str, seconds: float, **labels):
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        with self._lock:
+            timing = self._timings.get(key)
+            if timing is None:
+                timing = self._timings[key] = Timing()
+            timing.add(seconds)
+
+    def summary(self) -> dict[str, list[dict]]:
+        """
+        JSON-friendly totals, e.g. {"request_seconds": [{"labels": {...},
+        "count": 3, "sum": 1.2, "max": 0.6, "mean": 0.4}, ...]}
+        """
+        with self._lock:
+            timings = sorted(self._timings.items())
+        summary = {}
+        for (name, labels), timing in timings:
+            summary.setdefault(name, []).append(
+                {
+                    "labels": dict(labels),
+                    "count": timing.count,
+                    "sum": round(timing.total, 6),
+                    "max": round(timing.max, 6),
+                    "mean": round(timing.total / timing.count, 6),
+                }
+            )
+        return summary
+
+    def to_prometheus(self, prefix: str = "jobspy") -> str:
+        """Timings in the Prometheus text exposition format, as summaries"""
+        lines = []
+        for name, entries in self.summary().items():
+            metric = f"{prefix}_{name}"
+            lines.append(f"# TYPE {metric} summary")
+            for entry in entries:
+                labels = _prometheus_labels(entry["labels"])
+                lines.append(f"{metric}_count{labels} {entry['count']}")
+                lines.append(f"{metric}_sum{labels} {entry['sum']}")
+            lines.append(f"# TYPE {metric}_max gauge")
+            for entry in entries:
+                labels = _prometheus_labels(entry["labels"])
+                lines.append(f"{metric}_max{labels} {entry['max']}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str, prefix: str = "jobspy"):
+        """
+        Writes the timings as a node_exporter textfile; the file is replaced in
+        one step so the collector never reads it half written
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(self.to_prometheus(prefix))
+        os.replace(temp_path, path)
+
+
+def _prometheus_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        for value in labels.values()
+    )
+    pairs = (f'{label}="{value}"' for label, value in zip(labels, escaped))
+    return "{" + ",".join(pairs) + "}"
+
+
+# the metrics of the current scrape and the labels its observations get
+_current: ContextVar[tuple[Metrics, dict] | None] = ContextVar(
+    "jobspy_metrics", default=None
+)
+
+
+def current_metrics() -> Metrics | None:
+    scope = _current.get()
+    return scope[0] if scope else None
+
+
+@contextmanager
+def metrics_scope(metrics: Metrics | None, **labels) -> Iterator[Metrics | None]:
+    """
+    Sends the observations made in this context to metrics, labelled with labels
+    on top of the enclosing scope's; threads started inside need
+    contextvars.copy_context() to inherit it
+    """
+    if metrics is None:
+        yield None
+        return
+    scope = _current.get()
+    outer = scope[1] if scope and scope[0] is metrics else {}
+    token = _current.set((metrics, {**outer, **labels}))
+    try:
+        yield metrics
+    finally:
+        _current.reset(token)
+
+
+def observe(name: str, seconds: float, **labels):
+    """Records a timing in the current scope's metrics, if any"""
+    scope = _current.get()
+    if scope is not None:
+        metrics, scope_labels = scope
+        metrics.observe(name, seconds, **{**scope_labels, **labels})
+
+
+@contextmanager
+def timed(name: str, **labels) -> Iterator[None]:
+    """Times the block into the current scope's metrics, if any"""
+    if _current.get() is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - started, **labels)
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from concurrent.futures import Executor
+from contextvars import copy_context
+from typing import TYPE_CHECKING, Callable, Optional
 from datetime import date
 from enum import Enum
 from pydantic import BaseModel
 
+from jobspy.deadline import current_deadline
+from jobspy.metrics import current_metrics, observe
+
+if TYPE_CHECKING:
+    from jobspy.batch import DetailFetches
+    from jobspy.cache import ResponseCache
+    from jobspy.store import JobStore
+
 
 class JobType(Enum):
     FULL_TIME = (
@@ -178,7 +190,23 @@ class Country(Enum):
         )
 
 
-class Location(BaseModel):
+class TimedModel(BaseModel):
+    """Reports how long its validation takes to the current metrics, if any"""
+
+    def __init__(self, **data):
+        if current_metrics() is None:
+            super().__init__(**data)
+            return
+        started = time.perf_counter()
+        super().__init__(**data)
+        observe(
+            "model_construction_seconds",
+            time.perf_counter() - started,
+            model=type(self).__name__,
+        )
+
+
+class Location(TimedModel):
     country: Country | str | None = None
     city: Optional[str] = None
     state: Optional[str] = None
@@ -224,7 +252,7 @@ class CompensationInterval(Enum):
             return cls[pay_period].value if pay_period in cls.__members__ else None
 
 
-class Compensation(BaseModel):
+class Compensation(TimedModel):
     interval: Optional[CompensationInterval] = None
     min_amount: float | None = None
     max_amount: float | None = None
@@ -236,7 +264,7 @@ class DescriptionFormat(Enum):
     HTML = "html"
     PLAIN = "plain"
 
-class JobPost(BaseModel):
+class JobPost(TimedModel):
     id: str | None = None
     title: str
     company_name: str | None
@@ -282,6 +310,8 @@ class JobPost(BaseModel):
 
 class JobResponse(BaseModel):
     jobs: list[JobPost] = []
+    # the site's time budget ran out before it finished
+    truncated: bool = False
 
 
 class Site(Enum):
@@ -321,16 +351,90 @@ class ScraperInput(BaseModel):
 
     results_wanted: int = 15
     hours_old: int | None = None
+    only_new: bool = False
 
 
 class Scraper(ABC):
     def __init__(
-        self, site: Site, proxies: list[str] | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        site: Site,
+        proxies: list[str] | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        cache: ResponseCache | None = None,
+        job_store: JobStore | None = None,
     ):
         self.site = site
         self.proxies = proxies
         self.ca_cert = ca_cert
         self.user_agent = user_agent
+        self.cache = cache
+        self.cache_ttl = cache.ttl_for(site) if cache else None
+        self.job_store = job_store
+        # set by scrape_jobs_batch so its scrapers share job detail fetches
+        self.detail_fetches: DetailFetches | None = None
+
+    def page_is_known(self, scraper_input: ScraperInput, job_ids: list[str]) -> bool:
+        """
+        True when only new jobs were asked for and every job on a results page is
+        already in the job store, so pagination can stop before detail requests
+        """
+        return bool(
+            scraper_input.only_new
+            and self.job_store
+            and self.job_store.all_known(job_ids)
+        )
+
+    def out_of_time(self) -> bool:
+        """
+        True once the time budget of the current scrape is spent; scrapers stop
+        paginating and return the jobs they have
+        """
+        deadline = current_deadline()
+        return deadline is not None and deadline.spent()
+
+    def stored_details(
+        self, scraper_input: ScraperInput, job_id: str, fields: tuple[str, ...]
+    ) -> dict | None:
+        """
+        Detail fields of a job an earlier run already fetched, taken from the job
+        store instead of requesting the job page again; None when it must be fetched
+        """
+        if not self.job_store:
+            return None
+        stored = self.job_store.get_with_description(
+            job_id, scraper_input.description_format
+        )
+        if stored is None:
+            return None
+        return {field: getattr(stored, field) for field in fields}
+
+    def fetch_details(
+        self, scraper_input: ScraperInput, job_id: str, fetch: Callable, *args
+    ):
+        """
+        Returns fetch(*args), the detail page of a job; within a batch, a job found
+        by several queries is fetched once and the result shared
+        """
+        if self.detail_fetches is None:
+            return fetch(*args)
+        key = (job_id, scraper_input.description_format)
+        return self.detail_fetches.run(key, fetch, *args)
 
     @abstractmethod
     def scrape(self, scraper_input: ScraperInput) -> JobResponse: ...
+
+    async def scrape_async(
+        self, scraper_input: ScraperInput, executor: Executor | None = None
+    ) -> JobResponse:
+        """
+        Thread-offloading wrapper, not async I/O: the blocking scrape runs on a
+        thread of executor (the event loop's default executor when None),
+        holding it until it returns. Cancelling the awaiting task does not stop
+        the thread; see _scrape_site_async.
+        """
+        loop = asyncio.get_running_loop()
+        # the copied context carries the scrape's deadline and metrics into the thread
+        return await loop.run_in_executor(
+            executor, copy_context().run, self.scrape, scraper_input
+        )
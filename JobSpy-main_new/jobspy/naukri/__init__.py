@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import math
-import random
-import time
 from datetime import datetime, date, timedelta
 from typing import Optional
 
 import regex as re
 import requests
 
+from jobspy.cache import ResponseCache
+from jobspy.store import JobStore
 from jobspy.exception import NaukriException
 from jobspy.naukri.constant import headers as naukri_headers
 from jobspy.naukri.util import (
@@ -39,17 +39,26 @@ log = create_logger("Naukri")
 
 class Naukri(Scraper):
     base_url = "https://www.naukri.com/jobapi/v3/search"
-    delay = 3
-    band_delay = 4
     jobs_per_page = 20  
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        cache: ResponseCache | None = None,
+        job_store: JobStore | None = None,
     ):
         """
         Initializes NaukriScraper with the Naukri API URL
         """
-        super().__init__(Site.NAUKRI, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(
+            Site.NAUKRI,
+            proxies=proxies,
+            ca_cert=ca_cert,
+            cache=cache,
+            job_store=job_store,
+        )
         self.session = create_session(
             proxies=self.proxies,
             ca_cert=ca_cert,
@@ -57,6 +66,8 @@ class Naukri(Scraper):
             has_retry=True,
             delay=5,
             clear_cookies=True,
+            rate_limit=True,
+            shared=self.site,
         )
         self.session.headers.update(naukri_headers)
         self.scraper_input = None
@@ -83,6 +94,9 @@ class Naukri(Scraper):
         )
 
         while continue_search():
+            if self.out_of_time():
+                log.warning("time budget spent, returning jobs found so far")
+                break
             request_count += 1
             log.info(
                 f"Scraping page {request_count} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)} "
@@ -121,6 +135,12 @@ class Naukri(Scraper):
             except Exception as e:
                 log.error(f"Naukri API request failed: {str(e)}")
                 return JobResponse(jobs=job_list)
+            if self.page_is_known(
+                scraper_input,
+                [f"nk-{job['jobId']}" for job in job_details if job.get("jobId")],
+            ):
+                log.info("search page is made entirely of known jobs, stopping")
+                break
 
             for job in job_details:
                 job_id = job.get("jobId")
@@ -142,7 +162,6 @@ class Naukri(Scraper):
                     raise NaukriException(str(e))
 
             if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
                 page += 1
 
         job_list = job_list[:scraper_input.results_wanted]
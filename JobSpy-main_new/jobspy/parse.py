@@ -0,0 +1,66 @@
+"""
+jobspy.parse
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the HTML parser layer shared by the scrapers.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+from jobspy.metrics import timed
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+
+    DEFAULT_HTML_PARSER = "lxml"
+except ImportError:
+    DEFAULT_HTML_PARSER = "html.parser"
+
+HTML_PARSERS = ("lxml", "html.parser", "html5lib")
+
+_html_parser = DEFAULT_HTML_PARSER
+
+
+def set_html_parser(name: str):
+    """
+    Switches the bs4 backend every scraper parses pages with
+    :param name: "lxml" (default when installed), "html.parser" or "html5lib"
+    """
+    global _html_parser
+    if name not in HTML_PARSERS:
+        raise ValueError(f"Invalid HTML parser: {name}, expected one of {HTML_PARSERS}")
+    _html_parser = name
+
+
+def get_html_parser() -> str:
+    return _html_parser
+
+
+def class_pattern(*class_names: str) -> re.Pattern:
+    """
+    Matches a class attribute containing any of class_names. SoupStrainer sees
+    the raw attribute string while parsing, so a plain class_="x" would miss
+    elements that carry several classes.
+    """
+    names = "|".join(re.escape(name) for name in class_names)
+    return re.compile(rf"(?:^|\s)(?:{names})(?:\s|$)")
+
+
+def parse_html(markup: str, only: SoupStrainer | None = None) -> BeautifulSoup:
+    """
+    Parses markup with the configured backend
+    :param only: strainer of the elements to build; the rest of the document is
+        skipped, which is much cheaper when a page is mostly unneeded markup
+    :return: BeautifulSoup tree
+    """
+    # imported here so that importing jobspy does not load bs4
+    from bs4 import BeautifulSoup
+
+    with timed("parse_seconds"):
+        return BeautifulSoup(markup, _html_parser, parse_only=only)
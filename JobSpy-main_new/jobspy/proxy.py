@@ -0,0 +1,130 @@
+"""
+jobspy.proxy
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the proxy pool that picks proxies by their observed health.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass
+
+# responses that count against the proxy that carried them
+BAD_PROXY_STATUS_CODES = {403, 407, 429}
+
+# smoothing factor of the latency and error rate moving averages
+EWMA_ALPHA = 0.3
+# latency assumed for proxies that have not answered yet, so they get tried early
+DEFAULT_LATENCY = 1.0
+BASE_COOLDOWN = 10.0
+MAX_COOLDOWN = 600.0
+# attempts of one request on different proxies before the error is raised
+MAX_ATTEMPTS = 3
+
+
+@dataclass
+class ProxyHealth:
+    requests: int = 0
+    errors: int = 0
+    throttled: int = 0  # 429 responses
+    latency: float | None = None  # moving average, seconds
+    error_rate: float = 0.0  # moving average of failed requests
+    strikes: int = 0  # failures since the last success
+    quarantined_until: float = 0.0
+
+    def score(self) -> float:
+        """Selection weight: fast proxies that rarely fail are picked most"""
+        latency = DEFAULT_LATENCY if self.latency is None else max(self.latency, 0.05)
+        return max((1 - self.error_rate) ** 2 / latency, 0.01)
+
+
+_health: dict[str, ProxyHealth] = {}
+_health_lock = threading.Lock()
+
+
+def proxy_key(proxy: dict) -> str:
+    return proxy.get("http") or proxy.get("https") or ""
+
+
+def _health_for(key: str) -> ProxyHealth:
+    health = _health.get(key)
+    if health is None:
+        health = _health[key] = ProxyHealth()
+    return health
+
+
+class ProxyPool:
+    """
+    Weighted random choice over proxies by health score. A proxy that errors or
+    is throttled is quarantined, for twice as long after each further strike;
+    while every proxy is quarantined the one released soonest is used. Health is
+    shared by every pool in the process that holds the same proxy.
+    """
+
+    def __init__(self, proxies: list[dict]):
+        self.proxies = proxies
+        self.attempts = min(len(proxies), MAX_ATTEMPTS)
+
+    def choose(self, exclude: tuple[str, ...] = ()) -> dict:
+        """Picks a proxy, avoiding the ones in exclude when others are usable"""
+        now = time.time()
+        with _health_lock:
+            entries = [
+                (proxy, _health_for(proxy_key(proxy)))
+                for proxy in self.proxies
+                if proxy_key(proxy) not in exclude
+            ] or [(proxy, _health_for(proxy_key(proxy))) for proxy in self.proxies]
+            available = [
+                (proxy, health)
+                for proxy, health in entries
+                if health.quarantined_until <= now
+            ]
+            if not available:
+                return min(entries, key=lambda entry: entry[1].quarantined_until)[0]
+            weights = [health.score() for _, health in available]
+        return random.choices(available, weights=weights)[0][0]
+
+    def record(
+        self, proxy: dict, latency: float, status_code: int | None = None
+    ) -> bool:
+        """
+        Updates the proxy's health after a request; status_code is None when the
+        request failed without a response. Returns whether the proxy did its job
+        """
+        failed = status_code is None or status_code in BAD_PROXY_STATUS_CODES
+        with _health_lock:
+            health = _health_for(proxy_key(proxy))
+            health.requests += 1
+            health.errors += status_code is None
+            health.throttled += status_code == 429
+            health.error_rate += EWMA_ALPHA * (failed - health.error_rate)
+            if status_code is not None:
+                health.latency = (
+                    latency
+                    if health.latency is None
+                    else health.latency + EWMA_ALPHA * (latency - health.latency)
+                )
+            if failed:
+                health.strikes += 1
+                cooldown = min(MAX_COOLDOWN, BASE_COOLDOWN * 2 ** (health.strikes - 1))
+                health.quarantined_until = time.time() + cooldown
+            else:
+                health.strikes = 0
+                health.quarantined_until = 0.0
+        return not failed
+
+    def stats(self) -> dict[str, dict]:
+        with _health_lock:
+            return {
+                proxy_key(proxy): asdict(_health_for(proxy_key(proxy)))
+                for proxy in self.proxies
+            }
+
+
+def proxy_stats() -> dict[str, dict]:
+    """Health of every proxy used in this process, keyed by proxy URL"""
+    with _health_lock:
+        return {key: asdict(health) for key, health in _health.items()}
@@ -0,0 +1,151 @@
+"""
+jobspy.ratelimit
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the adaptive per-host rate limiter shared by all scrapers in a process.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+# responses that mean the host wants us to slow down
+THROTTLE_STATUS_CODES = {429, 503}
+# longest Retry-After pause a throttled request waits out before it is sent again
+MAX_RETRY_AFTER = 60.0
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    rate: float  # requests per second to start with
+    min_rate: float
+    max_rate: float
+    burst: float = 1.0
+    increase: float = 0.05  # added to the rate after each healthy response
+    decrease: float = 0.5  # rate multiplier after a throttled response
+    jitter: float = 0.5  # each request costs 1 to 1 + jitter tokens
+
+
+DEFAULT_POLICY = RateLimitPolicy(rate=0.5, min_rate=0.05, max_rate=2.0)
+
+# matched against the end of the host name, first match wins; hosts whose
+# scrapers used to sleep between search pages start at that pace
+HOST_POLICIES = {
+    # one page per 3-7s, detail pages included
+    "linkedin.com": RateLimitPolicy(rate=0.2, min_rate=0.05, max_rate=5.0),
+    # search pages, one per 5s; detail pages come from www.ziprecruiter.com
+    "api.ziprecruiter.com": RateLimitPolicy(rate=0.2, min_rate=0.05, max_rate=2.0),
+    "ziprecruiter.com": RateLimitPolicy(rate=5.0, min_rate=0.2, max_rate=20.0, burst=5),
+    # one page per 3-7s
+    "naukri.com": RateLimitPolicy(rate=0.2, min_rate=0.05, max_rate=2.0),
+    "internshala.com": RateLimitPolicy(rate=0.5, min_rate=0.05, max_rate=2.0),
+    "bdjobs.com": RateLimitPolicy(rate=1.0, min_rate=0.05, max_rate=4.0),
+    # one page per 2-5s
+    "bayt.com": RateLimitPolicy(rate=0.3, min_rate=0.05, max_rate=2.0),
+}
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header, given as seconds or an HTTP date"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HostRateLimiter:
+    """
+    Token bucket whose refill rate adapts AIMD style: it grows additively while
+    the host answers normally and is cut multiplicatively on 429/503. A
+    Retry-After header pauses the host for the time it asks for.
+    """
+
+    def __init__(self, policy: RateLimitPolicy = DEFAULT_POLICY):
+        self.policy = policy
+        self.rate = policy.rate
+        self._lock = threading.Lock()
+        self._tokens = policy.burst
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+
+    def acquire(self, max_wait: float | None = None) -> bool:
+        """
+        Blocks until the caller may send a request to this host
+        :param max_wait: longest the caller may wait, in seconds
+        :return: False, at once and without taking a turn, when the wait would
+            be longer than max_wait
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.policy.burst,
+                self._tokens + (now - self._updated_at) * self.rate,
+            )
+            self._updated_at = now
+            # tokens may go negative: that is the queue of callers already waiting
+            tokens = self._tokens - random.uniform(1, 1 + self.policy.jitter)
+            wait = max(-tokens / self.rate, self._blocked_until - now)
+            if max_wait is not None and wait > max_wait:
+                return False
+            self._tokens = tokens
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    def record(self, status_code: int, retry_after: str | None = None):
+        """Adapts the rate to a response from this host"""
+        with self._lock:
+            if status_code in THROTTLE_STATUS_CODES:
+                self.rate = max(self.policy.min_rate, self.rate * self.policy.decrease)
+                pause = parse_retry_after(retry_after)
+                if pause:
+                    self._blocked_until = max(
+                        self._blocked_until, time.monotonic() + pause
+                    )
+            elif status_code < 500:
+                self.rate = min(self.policy.max_rate, self.rate + self.policy.increase)
+
+    def paused_for(self) -> float:
+        """Seconds left of the pause asked for by a Retry-After header"""
+        with self._lock:
+            return max(0.0, self._blocked_until - time.monotonic())
+
+    def stats(self) -> dict:
+        return {"rate": self.rate, "blocked_for": self.paused_for()}
+
+
+_limiters: dict[str, HostRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def policy_for(host: str) -> RateLimitPolicy:
+    for suffix, policy in HOST_POLICIES.items():
+        if host == suffix or host.endswith(f".{suffix}"):
+            return policy
+    return DEFAULT_POLICY
+
+
+def limiter_for(url: str) -> HostRateLimiter:
+    """The process-wide limiter of the URL's host, shared by every session"""
+    host = (urlparse(url).hostname or "").lower()
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = _limiters[host] = HostRateLimiter(policy_for(host))
+        return limiter
+
+
+def limiter_stats() -> dict[str, dict]:
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {host: limiter.stats() for host, limiter in limiters.items()}
@@ -0,0 +1,160 @@
+"""
+jobspy.record
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the compact job record passed from the scrapers to the output
+stage (DataFrame, Arrow table or records).
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Mapping
+from operator import attrgetter
+from typing import Iterator
+
+from jobspy.util import desired_order
+
+# columns most sites fill in, held in slots; any other value is kept in a dict
+# of only the values that are set, which most jobs leave empty or tiny
+DENSE_COLUMNS = (
+    "id",
+    "site",
+    "job_url",
+    "job_url_direct",
+    "title",
+    "company",
+    "location",
+    "date_posted",
+    "job_type",
+    "salary_source",
+    "interval",
+    "min_amount",
+    "max_amount",
+    "currency",
+    "is_remote",
+    "emails",
+    "description",
+    "company_url",
+)
+
+# columns with few distinct values, whose strings are interned so that the jobs
+# of a company, place or site share one copy
+INTERNED_COLUMNS = frozenset(
+    {
+        "site",
+        "company",
+        "location",
+        "job_type",
+        "salary_source",
+        "interval",
+        "currency",
+        "job_level",
+        "job_function",
+        "listing_type",
+        "company_industry",
+        "company_url",
+        "company_logo",
+        "company_addresses",
+        "company_num_employees",
+        "company_revenue",
+        "experience_range",
+        "work_from_home_type",
+    }
+)
+
+_DENSE = frozenset(DENSE_COLUMNS)
+_COLUMNS = frozenset(desired_order)
+_SPARSE_COLUMNS = tuple(column for column in desired_order if column not in _DENSE)
+_dense_values = attrgetter(*DENSE_COLUMNS)
+# each column with its position among the dense values, None for sparse columns
+_COLUMN_POSITIONS = tuple(
+    (column, DENSE_COLUMNS.index(column) if column in _DENSE else None)
+    for column in desired_order
+)
+
+
+def _compact(column: str, value):
+    if type(value) is str and column in INTERNED_COLUMNS:
+        return sys.intern(value)
+    return value
+
+
+class JobRecord(Mapping):
+    """
+    A job record keyed by the columns of the scrape_jobs DataFrame (desired_order),
+    read like a dict; columns without a value read as None. Extra fields, such as
+    the "sources" dedupe adds, follow the columns.
+    """
+
+    __slots__ = (*DENSE_COLUMNS, "_sparse")
+
+    def __init__(self, values: Mapping, **extra):
+        """
+        :param values: the record's column values; keys other than columns are ignored
+        :param extra: fields to add after the columns
+        """
+        if isinstance(values, JobRecord):
+            # already compact: copy the slots and the set sparse columns
+            for column, value in zip(DENSE_COLUMNS, _dense_values(values)):
+                setattr(self, column, value)
+            sparse = {
+                column: value
+                for column, value in (values._sparse or {}).items()
+                if column in _COLUMNS
+            }
+        else:
+            get = values.get
+            for column in DENSE_COLUMNS:
+                value = get(column)
+                if type(value) is str and column in INTERNED_COLUMNS:
+                    value = sys.intern(value)
+                setattr(self, column, value)
+            sparse = {
+                column: _compact(column, value)
+                for column in _SPARSE_COLUMNS
+                if (value := get(column)) is not None
+            }
+        sparse.update(extra)
+        self._sparse = sparse or None
+
+    def __getitem__(self, key: str):
+        if key in _DENSE:
+            return getattr(self, key)
+        sparse = self._sparse
+        if sparse is not None and key in sparse:
+            return sparse[key]
+        if key in _COLUMNS:
+            return None
+        raise KeyError(key)
+
+    def get(self, key: str, default=None):
+        if key in _DENSE:
+            return getattr(self, key)
+        sparse = self._sparse
+        if sparse is not None and key in sparse:
+            return sparse[key]
+        return None if key in _COLUMNS else default
+
+    def values(self) -> list:
+        """The values in key order, as a list"""
+        dense = _dense_values(self)
+        sparse = self._sparse or {}
+        values = [
+            dense[position] if position is not None else sparse.get(column)
+            for column, position in _COLUMN_POSITIONS
+        ]
+        values.extend(value for key, value in sparse.items() if key not in _COLUMNS)
+        return values
+
+    def __iter__(self) -> Iterator[str]:
+        yield from desired_order
+        if self._sparse is not None:
+            yield from (key for key in self._sparse if key not in _COLUMNS)
+
+    def __len__(self) -> int:
+        extra = sum(1 for key in self._sparse or () if key not in _COLUMNS)
+        return len(desired_order) + extra
+
+    def __repr__(self) -> str:
+        return f"JobRecord({dict(self)!r})"
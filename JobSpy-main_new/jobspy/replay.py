@@ -0,0 +1,169 @@
+"""
+jobspy.replay
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the record/replay transport used to run scrapers against
+saved responses, e.g. for benchmarks that must not hit the live sites.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, ContextManager, Iterator
+from urllib.parse import urlparse
+
+import requests
+
+from jobspy.cache import CachedEntry, ResponseCache
+
+
+class FixtureMissing(requests.ConnectionError):
+    """
+    Raised while replaying a request that was never recorded; scrapers handle it
+    like a failed connection
+    """
+
+
+class Fixtures:
+    """
+    Directory of recorded responses, one JSON file per distinct request in a
+    folder per host. A request sent several times keeps each response, in order.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def file_for(self, method: str, url: str, **kwargs) -> str:
+        key = ResponseCache.make_key(
+            method, url, kwargs.get("params"), kwargs.get("data"), kwargs.get("json")
+        )
+        host = urlparse(url).hostname or "_"
+        return os.path.join(self.path, host, f"{key}.json")
+
+    def load(self, file: str) -> list[dict]:
+        try:
+            with open(file, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+
+    def save(self, file: str, responses: list[dict]):
+        os.makedirs(os.path.dirname(file), exist_ok=True)
+        with open(file, "w", encoding="utf-8") as f:
+            json.dump(responses, f, ensure_ascii=False)
+
+
+class Recorder:
+    """
+    Sends requests to the network as usual and saves every response. A request
+    recorded by an earlier session has its responses replaced, not appended to.
+    """
+
+    def __init__(self, path: str):
+        self.fixtures = Fixtures(path)
+        self.recorded = 0
+        self._lock = threading.Lock()
+        self._responses: dict[str, list[dict]] = {}
+
+    def send(self, send: Callable, method: str, url: str, **kwargs):
+        response = send(method, url, **kwargs)
+        file = self.fixtures.file_for(method, url, **kwargs)
+        headers = {
+            name: ", ".join(value) if isinstance(value, list) else value
+            for name, value in response.headers.items()
+        }
+        with self._lock:
+            responses = self._responses.setdefault(file, [])
+            responses.append(
+                {
+                    "method": method.upper(),
+                    "url": str(response.url or url),
+                    "status_code": response.status_code,
+                    "headers": headers,
+                    "text": response.text,
+                }
+            )
+            self.fixtures.save(file, responses)
+            self.recorded += 1
+        return response
+
+
+class Replayer:
+    """
+    Answers requests from recorded responses without touching the network. A
+    request sent more often than it was recorded gets its last response again.
+    """
+
+    def __init__(self, path: str):
+        self.fixtures = Fixtures(path)
+        self.hits = 0
+        self.misses = 0
+        # time spent looking up and building responses, standing in for the network
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+        self._responses: dict[str, list[dict]] = {}
+        self._sent: dict[str, int] = {}
+
+    def send(self, send: Callable, method: str, url: str, **kwargs):
+        started = time.process_time()
+        file = self.fixtures.file_for(method, url, **kwargs)
+        with self._lock:
+            responses = self._responses.get(file)
+            if responses is None:
+                responses = self._responses[file] = self.fixtures.load(file)
+            sent = self._sent[file] = self._sent.get(file, 0) + 1
+            if not responses:
+                self.misses += 1
+                self.seconds += time.process_time() - started
+                raise FixtureMissing(f"no recorded response for {method} {url}")
+            self.hits += 1
+        recorded = responses[min(sent, len(responses)) - 1]
+        response = CachedEntry(
+            recorded["url"],
+            recorded["status_code"],
+            recorded["headers"],
+            recorded["text"].encode("utf-8"),
+            stored_at=0,
+            ttl=0,
+        ).to_response()
+        response.from_cache = False
+        with self._lock:
+            self.seconds += time.process_time() - started
+        return response
+
+
+_transport: Recorder | Replayer | None = None
+
+
+def current_transport() -> Recorder | Replayer | None:
+    return _transport
+
+
+@contextmanager
+def use_transport(
+    transport: Recorder | Replayer | None,
+) -> Iterator[Recorder | Replayer | None]:
+    """
+    Sends every session request of the process through transport while active;
+    replayed requests skip proxies and the rate limiter
+    """
+    global _transport
+    previous, _transport = _transport, transport
+    try:
+        yield transport
+    finally:
+        _transport = previous
+
+
+def recording(path: str) -> ContextManager[Recorder]:
+    """Records the responses of the requests sent inside the block into path"""
+    return use_transport(Recorder(path))
+
+
+def replaying(path: str) -> ContextManager[Replayer]:
+    """Answers the requests sent inside the block from the fixtures in path"""
+    return use_transport(Replayer(path))
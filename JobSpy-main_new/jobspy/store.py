@@ -0,0 +1,175 @@
+"""
+jobspy.store
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the local job store that remembers jobs across runs.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Iterable
+
+from jobspy.model import Country, DescriptionFormat, JobPost, JobType
+
+# keeps each IN (...) query under SQLite's bound parameter limit
+ID_CHUNK_SIZE = 500
+
+
+def encode_job(job: JobPost) -> str:
+    """
+    Serializes a JobPost to JSON. Country and JobType values are tuples, which
+    JSON turns into lists that no longer validate, so members are stored by name.
+    """
+    data = job.model_dump(mode="json")
+    if job.location and isinstance(job.location.country, Country):
+        data["location"]["country"] = None
+        data["location"]["country_member"] = job.location.country.name
+    if job.job_type:
+        data["job_type"] = [job_type.name for job_type in job.job_type]
+    return json.dumps(data)
+
+
+def decode_job(text: str) -> JobPost:
+    data = json.loads(text)
+    location = data.get("location")
+    if location and location.get("country_member"):
+        location["country"] = Country[location.pop("country_member")]
+    if data.get("job_type"):
+        data["job_type"] = [JobType[name] for name in data["job_type"]]
+    return JobPost.model_validate(data)
+
+
+class JobStore:
+    """
+    SQLite table of every job scraped so far, keyed by JobPost.id and indexed
+    on site and date_posted
+    """
+
+    def __init__(self, path: str = "jobspy_jobs.sqlite"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                site TEXT NOT NULL,
+                date_posted TEXT,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                description_format TEXT,
+                job TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_jobs_date_posted ON jobs (date_posted)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_site ON jobs (site)")
+        self._conn.commit()
+
+    def known_ids(self, job_ids: Iterable[str]) -> set[str]:
+        """Returns the subset of job_ids that are already stored"""
+        job_ids = list({job_id for job_id in job_ids if job_id})
+        known = set()
+        with self._lock:
+            for i in range(0, len(job_ids), ID_CHUNK_SIZE):
+                chunk = job_ids[i : i + ID_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT id FROM jobs WHERE id IN ({placeholders})", chunk
+                ).fetchall()
+                known.update(row[0] for row in rows)
+        return known
+
+    def all_known(self, job_ids: list[str]) -> bool:
+        """True when there is at least one id and every one of them is stored"""
+        unique_ids = {job_id for job_id in job_ids if job_id}
+        return bool(unique_ids) and len(self.known_ids(unique_ids)) == len(unique_ids)
+
+    def get(self, job_id: str) -> JobPost | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT job FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return decode_job(row[0]) if row else None
+
+    def get_with_description(
+        self, job_id: str, description_format: DescriptionFormat | None
+    ) -> JobPost | None:
+        """Returns the stored job if it was saved with a description in that format"""
+        if description_format is None:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT job FROM jobs WHERE id = ? AND description_format = ?",
+                (job_id, description_format.value),
+            ).fetchone()
+        return decode_job(row[0]) if row else None
+
+    def add(
+        self,
+        site: str,
+        jobs: Iterable[JobPost],
+        description_format: DescriptionFormat | None = None,
+    ):
+        """
+        Inserts new jobs and refreshes last_seen and the stored copy of known ones.
+        A stored copy that has a description is not replaced by one without.
+        """
+        now = time.time()
+        rows = [
+            (
+                job.id,
+                site,
+                job.date_posted.isoformat() if job.date_posted else None,
+                now,
+                now,
+                (
+                    description_format.value
+                    if description_format and job.description
+                    else None
+                ),
+                encode_job(job),
+            )
+            for job in jobs
+            if job.id
+        ]
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT INTO jobs (
+                    id,
+                    site,
+                    date_posted,
+                    first_seen,
+                    last_seen,
+                    description_format,
+                    job
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (id) DO UPDATE SET
+                    date_posted = excluded.date_posted,
+                    last_seen = excluded.last_seen,
+                    job = CASE
+                        WHEN excluded.description_format IS NULL
+                            AND jobs.description_format IS NOT NULL
+                        THEN jobs.job
+                        ELSE excluded.job
+                    END,
+                    description_format = COALESCE(
+                        excluded.description_format, jobs.description_format
+                    )
+                """,
+                rows,
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
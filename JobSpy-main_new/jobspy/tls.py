@@ -0,0 +1,45 @@
+"""
+jobspy.tls
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the tls-client session. It is imported only when a session
+with tls is created, since tls_client loads its native library on import.
+"""
+
+from __future__ import annotations
+
+import tls_client
+
+try:
+    from tls_client.exceptions import TLSClientException
+except ImportError:  # tls-client 1.x spells it this way
+    from tls_client.exceptions import TLSClientExeption as TLSClientException
+
+from jobspy.util import RotatingProxySession
+
+
+class TLSRotating(RotatingProxySession, tls_client.Session):
+    proxy_errors = (TLSClientException,)
+    timeout_keyword = "timeout_seconds"
+
+    def __init__(self, proxies=None, cache=None, cache_ttl=None, rate_limit=False):
+        RotatingProxySession.__init__(
+            self,
+            proxies=proxies,
+            cache=cache,
+            cache_ttl=cache_ttl,
+            rate_limit=rate_limit,
+        )
+        tls_client.Session.__init__(self, random_tls_extension_order=True)
+
+    def execute_request(self, method, url, use_cache=False, **kwargs):
+        if use_cache and self.cache:
+            return self.cache.fetch(self._send, method, url, self.cache_ttl, **kwargs)
+        return self._send(method, url, **kwargs)
+
+    def _send_via(self, proxy, method, url, **kwargs):
+        response = tls_client.Session.execute_request(
+            self, method, url, proxy=proxy or None, **kwargs
+        )
+        response.ok = response.status_code in range(200, 400)
+        return response
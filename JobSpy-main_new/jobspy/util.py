@@ -1,18 +1,29 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+import math
 import re
 import ssl
-from itertools import cycle
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable
+from urllib.parse import urlparse
 
-import numpy as np
 import requests
-import tls_client
 import urllib3
-from markdownify import markdownify as md
 from requests.adapters import HTTPAdapter, Retry
 from urllib3.util.ssl_ import create_urllib3_context
 
+from jobspy.cache import ResponseCache
+from jobspy.deadline import current_deadline
+from jobspy.markdown import html_to_markdown
+from jobspy.metrics import current_metrics, observe
+from jobspy.parse import get_html_parser
+from jobspy.proxy import ProxyPool, proxy_key
+from jobspy.ratelimit import MAX_RETRY_AFTER, THROTTLE_STATUS_CODES, limiter_for
+from jobspy.replay import current_transport
 from jobspy.model import CompensationInterval, JobType, Site
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -54,17 +65,30 @@ def create_logger(name: str):
 
 
 class RotatingProxySession:
-    def __init__(self, proxies=None):
+    # errors raised when the request never got a response, e.g. a dead proxy
+    proxy_errors: tuple[type[Exception], ...] = ()
+    # errors raised when the client's own retries of 5xx responses ran out
+    retries_exhausted: tuple[type[Exception], ...] = ()
+    # times a request throttled by its host is sent again, with rate_limit
+    throttle_resends = 2
+    # keyword the client takes the request timeout as, and its value when not given
+    timeout_keyword = "timeout"
+    default_timeout = 30
+
+    def __init__(self, proxies=None, cache=None, cache_ttl=None, rate_limit=False):
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self.rate_limit = rate_limit
+        # set by scrapers once per-session setup such as fetching cookies is done
+        self.warmed_up = False
+        self.last_used = time.monotonic()
         if isinstance(proxies, str):
-            self.proxy_cycle = cycle([self.format_proxy(proxies)])
-        elif isinstance(proxies, list):
-            self.proxy_cycle = (
-                cycle([self.format_proxy(proxy) for proxy in proxies])
-                if proxies
-                else None
-            )
-        else:
-            self.proxy_cycle = None
+            proxies = [proxies]
+        self.proxy_pool = (
+            ProxyPool([self.format_proxy(proxy) for proxy in proxies])
+            if isinstance(proxies, list) and proxies
+            else None
+        )
 
     @staticmethod
     def format_proxy(proxy):
@@ -75,10 +99,144 @@ class RotatingProxySession:
             return {"http": proxy, "https": proxy}
         return {"http": f"http://{proxy}", "https": f"http://{proxy}"}
 
+    def proxy_stats(self) -> dict[str, dict]:
+        """Health of this session's proxies, keyed by proxy URL"""
+        return self.proxy_pool.stats() if self.proxy_pool else {}
+
+    def _send_via(self, proxy, method, url, **kwargs):
+        raise NotImplementedError
+
+    def _send(self, method, url, **kwargs):
+        self.last_used = time.monotonic()
+        if current_metrics() is None:
+            return self._send_transport(method, url, **kwargs)
+        started = time.perf_counter()
+        status = "error"
+        try:
+            response = self._send_transport(method, url, **kwargs)
+            status = response.status_code
+            return response
+        finally:
+            observe(
+                "request_seconds",
+                time.perf_counter() - started,
+                host=urlparse(url).hostname,
+                status=status,
+            )
+
+    def _send_transport(self, method, url, **kwargs):
+        transport = current_transport()
+        if transport is not None:
+            # recorded or replayed, see jobspy.replay
+            return transport.send(self._send_network, method, url, **kwargs)
+        return self._send_network(method, url, **kwargs)
+
+    def _send_network(self, method, url, **kwargs):
+        """
+        Sends the request; with rate_limit, a throttled request is sent again
+        once the host's limiter, slowed down by the 429/503, lets it through
+        """
+        limiter = limiter_for(url) if self.rate_limit else None
+        for resend in range(self.throttle_resends + 1):
+            response = self._send_rotating(method, url, limiter, **kwargs)
+            if (
+                limiter is None
+                or response.status_code not in THROTTLE_STATUS_CODES
+                or resend == self.throttle_resends
+                or limiter.paused_for() > MAX_RETRY_AFTER
+            ):
+                return response
+
+    def _send_rotating(self, method, url, limiter, **kwargs):
+        """
+        Sends the request through the healthiest proxies, moving on to another
+        proxy when one fails or is throttled
+        """
+        self.last_used = time.monotonic()
+        if self.timeout_keyword != "timeout" and "timeout" in kwargs:
+            # the requests-style keyword is accepted whatever the client
+            kwargs[self.timeout_keyword] = kwargs.pop("timeout")
+        kwargs.setdefault(self.timeout_keyword, self.default_timeout)
+        deadline = current_deadline()
+        attempts = self.proxy_pool.attempts if self.proxy_pool else 1
+        tried = ()
+        for attempt in range(attempts):
+            proxy = self.proxy_pool.choose(tried) if self.proxy_pool else None
+            tried += (proxy_key(proxy),) if proxy else ()
+            direct = proxy is None or proxy["http"] == "http://localhost"
+            if deadline is not None and deadline.remaining() <= 0:
+                raise deadline.exceeded(f"time budget spent before {method} {url}")
+            if limiter and not limiter.acquire(
+                deadline.remaining() if deadline is not None else None
+            ):
+                # the host's rate limit would hold the request past the budget
+                raise deadline.exceeded(
+                    f"time budget spent waiting to send {method} {url}"
+                )
+            cut_to_deadline = False
+            if deadline is not None:
+                remaining = deadline.remaining()
+                if remaining <= 0:
+                    raise deadline.exceeded(f"time budget spent before {method} {url}")
+                if remaining < kwargs[self.timeout_keyword]:
+                    kwargs[self.timeout_keyword] = math.ceil(remaining)
+                    cut_to_deadline = True
+            started = time.monotonic()
+            try:
+                response = self._send_via(
+                    {} if direct else proxy, method, url, **kwargs
+                )
+            except self.retries_exhausted:
+                # the host kept failing: another proxy may fare better, but it
+                # is neither a throttle nor the proxy's fault
+                if attempt == attempts - 1:
+                    raise
+                continue
+            except self.proxy_errors as exc:
+                if cut_to_deadline and deadline.remaining() <= 0:
+                    # the timeout was cut to the time left, which ran out: the
+                    # proxy may be healthy, so it is not held against it
+                    raise deadline.exceeded(
+                        f"time budget spent during {method} {url}"
+                    ) from exc
+                if proxy:
+                    self.proxy_pool.record(proxy, time.monotonic() - started)
+                if attempt == attempts - 1:
+                    raise
+                continue
+            if limiter:
+                retry_after = response.headers.get("Retry-After")
+                limiter.record(response.status_code, retry_after)
+            if proxy is None:
+                return response
+            healthy = self.proxy_pool.record(
+                proxy, time.monotonic() - started, response.status_code
+            )
+            if healthy or attempt == attempts - 1:
+                return response
+
 
 class RequestsRotating(RotatingProxySession, requests.Session):
-    def __init__(self, proxies=None, has_retry=False, delay=1, clear_cookies=False):
-        RotatingProxySession.__init__(self, proxies=proxies)
+    proxy_errors = (requests.ConnectionError, requests.Timeout)
+    retries_exhausted = (requests.exceptions.RetryError,)
+
+    def __init__(
+        self,
+        proxies=None,
+        has_retry=False,
+        delay=1,
+        clear_cookies=False,
+        cache=None,
+        cache_ttl=None,
+        rate_limit=False,
+    ):
+        RotatingProxySession.__init__(
+            self,
+            proxies=proxies,
+            cache=cache,
+            cache_ttl=cache_ttl,
+            rate_limit=rate_limit,
+        )
         requests.Session.__init__(self)
         self.clear_cookies = clear_cookies
         self.allow_redirects = True
@@ -86,12 +244,20 @@ class RequestsRotating(RotatingProxySession, requests.Session):
 
     def setup_session(self, has_retry, delay):
         if has_retry:
+            status_forcelist = [500, 502, 503, 504, 429]
+            # throttled responses reach _send_network, which cools down the proxy
+            # and slows down the host's limiter before sending again; urllib3
+            # would otherwise retry any 429/503 with a Retry-After by itself
+            handles_throttling = bool(self.proxy_pool) or self.rate_limit
+            if handles_throttling:
+                status_forcelist = [500, 502, 504]
             retries = Retry(
                 total=3,
                 connect=3,
                 status=3,
-                status_forcelist=[500, 502, 503, 504, 429],
+                status_forcelist=status_forcelist,
                 backoff_factor=delay,
+                respect_retry_after_header=not handles_throttling,
             )
             adapter = SSLAdapter(max_retries=retries)
             self.mount("http://", adapter)
@@ -101,34 +267,40 @@ class RequestsRotating(RotatingProxySession, requests.Session):
             adapter = SSLAdapter()
             self.mount("https://", adapter)
 
-    def request(self, method, url, **kwargs):
+    def request(self, method, url, use_cache=False, **kwargs):
+        if use_cache and self.cache:
+            return self.cache.fetch(self._send, method, url, self.cache_ttl, **kwargs)
+        return self._send(method, url, **kwargs)
+
+    def _send_via(self, proxy, method, url, **kwargs):
         if self.clear_cookies:
             self.cookies.clear()
+        # passed per request rather than set on the session, which threads share
+        return requests.Session.request(self, method, url, proxies=proxy, **kwargs)
 
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            if next_proxy["http"] != "http://localhost":
-                self.proxies = next_proxy
-            else:
-                self.proxies = {}
-        return requests.Session.request(self, method, url, **kwargs)
 
+# shared sessions unused for this long are closed
+SESSION_IDLE_TIMEOUT = 300
 
-class TLSRotating(RotatingProxySession, tls_client.Session):
-    def __init__(self, proxies=None):
-        RotatingProxySession.__init__(self, proxies=proxies)
-        tls_client.Session.__init__(self, random_tls_extension_order=True)
+_sessions: dict[tuple, requests.Session] = {}
+_sessions_lock = threading.Lock()
 
-    def execute_request(self, *args, **kwargs):
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            if next_proxy["http"] != "http://localhost":
-                self.proxies = next_proxy
-            else:
-                self.proxies = {}
-        response = tls_client.Session.execute_request(self, *args, **kwargs)
-        response.ok = response.status_code in range(200, 400)
-        return response
+
+def _evict_idle_sessions():
+    now = time.monotonic()
+    for key, session in list(_sessions.items()):
+        if now - session.last_used > SESSION_IDLE_TIMEOUT:
+            del _sessions[key]
+            session.close()
+
+
+def close_sessions():
+    """Closes every shared session, e.g. before the process exits"""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
 
 
 def create_session(
@@ -139,19 +311,71 @@ def create_session(
     has_retry: bool = False,
     delay: int = 1,
     clear_cookies: bool = False,
+    cache: ResponseCache | None = None,
+    cache_ttl: int | None = None,
+    rate_limit: bool = False,
+    shared: Hashable | None = None,
 ) -> requests.Session:
     """
-    Creates a requests session with optional tls, proxy, and retry settings.
+    Creates a requests session with optional tls, proxy, retry and response cache settings.
+    Requests made with use_cache=True are served from the cache while younger than cache_ttl.
+    With rate_limit, network requests wait on the adaptive limiter of their host.
+    With a shared key (e.g. the site), the process-wide session created earlier with
+    the same key and settings is returned, keeping its connections and cookies warm.
     :return: A session object
     """
+    if shared is not None:
+        if isinstance(proxies, list):
+            proxies_key = tuple(proxies)
+        elif isinstance(proxies, dict):
+            proxies_key = tuple(sorted(proxies.items()))
+        else:
+            proxies_key = proxies
+        key = (
+            shared,
+            proxies_key,
+            ca_cert,
+            is_tls,
+            has_retry,
+            delay,
+            clear_cookies,
+            cache,
+            cache_ttl,
+            rate_limit,
+        )
+        with _sessions_lock:
+            _evict_idle_sessions()
+            session = _sessions.get(key)
+            if session is None:
+                session = _sessions[key] = create_session(
+                    proxies=proxies,
+                    ca_cert=ca_cert,
+                    is_tls=is_tls,
+                    has_retry=has_retry,
+                    delay=delay,
+                    clear_cookies=clear_cookies,
+                    cache=cache,
+                    cache_ttl=cache_ttl,
+                    rate_limit=rate_limit,
+                )
+            session.last_used = time.monotonic()
+        return session
+
     if is_tls:
-        session = TLSRotating(proxies=proxies)
+        from jobspy.tls import TLSRotating
+
+        session = TLSRotating(
+            proxies=proxies, cache=cache, cache_ttl=cache_ttl, rate_limit=rate_limit
+        )
     else:
         session = RequestsRotating(
             proxies=proxies,
             has_retry=has_retry,
             delay=delay,
             clear_cookies=clear_cookies,
+            cache=cache,
+            cache_ttl=cache_ttl,
+            rate_limit=rate_limit,
         )
 
     if ca_cert:
@@ -182,20 +406,79 @@ def set_logger_level(verbose: int):
         raise ValueError(f"Invalid log level: {level_name}")
 
 
+# descriptions converted earlier are kept, by format and content hash of the html
+CONVERSION_CACHE_SIZE = 4096
+
+_conversions: OrderedDict[tuple[str, bytes], str] = OrderedDict()
+_conversions_lock = threading.Lock()
+
+
+def _memoized_conversion(format: str, html: str, convert: Callable[[str], str]) -> str:
+    """
+    Converts each distinct description once; multi-location postings repeat the
+    same description, so later copies come from a bounded LRU cache
+    """
+    started = time.perf_counter()
+    key = (format, hashlib.blake2b(html.encode(), digest_size=16).digest())
+    with _conversions_lock:
+        converted = _conversions.get(key)
+        if converted is not None:
+            _conversions.move_to_end(key)
+    if converted is None:
+        converted = convert(html)
+        with _conversions_lock:
+            _conversions[key] = converted
+            if len(_conversions) > CONVERSION_CACHE_SIZE:
+                _conversions.popitem(last=False)
+        cached = False
+    else:
+        cached = True
+    observe(
+        "description_conversion_seconds",
+        time.perf_counter() - started,
+        format=format,
+        cached=cached,
+    )
+    return converted
+
+
+def _to_markdown(description_html: str) -> str:
+    markdown = html_to_markdown(description_html)
+    if markdown is None:
+        # markup the fast converter leaves to markdownify, e.g. tables or images
+        from markdownify import markdownify as md
+
+        markdown = md(description_html)
+    return markdown.strip()
+
+
+def _to_plain(description_html: str) -> str:
+    from bs4 import BeautifulSoup
+
+    # a fragment, not a page, so not timed as a page parse
+    soup = BeautifulSoup(description_html, get_html_parser())
+    text = soup.get_text(separator=" ")
+    text = re.sub(r'\s+',' ',text)
+    return text.strip()
+
+
 def markdown_converter(description_html: str):
     if description_html is None:
         return None
-    markdown = md(description_html)
-    return markdown.strip()
+    return _memoized_conversion("markdown", description_html, _to_markdown)
 
 def plain_converter(decription_html:str):
-    from bs4 import BeautifulSoup
     if decription_html is None:
         return None
-    soup = BeautifulSoup(decription_html, "html.parser")
-    text = soup.get_text(separator=" ")
-    text = re.sub(r'\s+',' ',text)
-    return text.strip()
+    return _memoized_conversion("plain", decription_html, _to_plain)
+
+
+def stable_id(value: str) -> str:
+    """
+    Short digest used for job ids built from a URL; unlike hash() it is the same
+    in every process, so ids can be matched against earlier runs
+    """
+    return hashlib.blake2b(value.encode(), digest_size=8).hexdigest()
 
 
 def extract_emails_from_text(text: str) -> list[str] | None:
@@ -230,6 +513,8 @@ def currency_parser(cur_str):
     else:
         num = float(cur_str)
 
+    import numpy as np
+
     return np.round(num, 2)
 
 
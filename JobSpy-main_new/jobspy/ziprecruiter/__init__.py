@@ -3,12 +3,13 @@ from __future__ import annotations
 import json
 import math
 import re
-import time
 from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from datetime import datetime
 
-from bs4 import BeautifulSoup
-
+from jobspy.cache import ResponseCache
+from jobspy.store import JobStore
+from jobspy.parse import parse_html
 from jobspy.ziprecruiter.constant import headers, get_cookie_data
 from jobspy.util import (
     extract_emails_from_text,
@@ -38,19 +39,38 @@ class ZipRecruiter(Scraper):
     api_url = "https://api.ziprecruiter.com"
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        cache: ResponseCache | None = None,
+        job_store: JobStore | None = None,
     ):
         """
         Initializes ZipRecruiterScraper with the ZipRecruiter job search url
         """
-        super().__init__(Site.ZIP_RECRUITER, proxies=proxies)
+        super().__init__(
+            Site.ZIP_RECRUITER,
+            proxies=proxies,
+            cache=cache,
+            job_store=job_store,
+        )
 
         self.scraper_input = None
-        self.session = create_session(proxies=proxies, ca_cert=ca_cert)
+        self.session = create_session(
+            proxies=proxies,
+            ca_cert=ca_cert,
+            cache=self.cache,
+            cache_ttl=self.cache_ttl,
+            rate_limit=True,
+            shared=self.site,
+        )
         self.session.headers.update(headers)
-        self._get_cookies()
+        # a shared session keeps the cookies from an earlier scrape
+        if not self.session.warmed_up:
+            self._get_cookies()
+            self.session.warmed_up = True
 
-        self.delay = 5
         self.jobs_per_page = 20
         self.seen_urls = set()
 
@@ -68,8 +88,9 @@ class ZipRecruiter(Scraper):
         for page in range(1, max_pages + 1):
             if len(job_list) >= scraper_input.results_wanted:
                 break
-            if page > 1:
-                time.sleep(self.delay)
+            if self.out_of_time():
+                log.warning("time budget spent, returning jobs found so far")
+                break
             log.info(f"search page: {page} / {max_pages}")
             jobs_on_page, continue_token = self._find_jobs_in_page(
                 scraper_input, continue_token
@@ -115,8 +136,17 @@ class ZipRecruiter(Scraper):
         res_data = res.json()
         jobs_list = res_data.get("jobs", [])
         next_continue_token = res_data.get("continue", None)
+        if self.page_is_known(
+            scraper_input, [f'zr-{job["listing_key"]}' for job in jobs_list]
+        ):
+            log.info("search page is made entirely of known jobs, stopping")
+            return [], None
         with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            job_results = [executor.submit(self._process_job, job) for job in jobs_list]
+            # the copied context carries the scrape's deadline into the workers
+            job_results = [
+                executor.submit(copy_context().run, self._process_job, job)
+                for job in jobs_list
+            ]
 
         job_list = list(filter(None, (result.result() for result in job_results)))
         return job_list, next_continue_token
@@ -154,7 +184,21 @@ class ZipRecruiter(Scraper):
         comp_min = int(job["compensation_min"]) if "compensation_min" in job else None
         comp_max = int(job["compensation_max"]) if "compensation_max" in job else None
         comp_currency = job.get("compensation_currency")
-        description_full, job_url_direct = self._get_descr(job_url)
+        stored = self.stored_details(
+            self.scraper_input,
+            f'zr-{job["listing_key"]}',
+            ("description", "job_url_direct"),
+        )
+        description_full, job_url_direct = (
+            (stored["description"], stored["job_url_direct"])
+            if stored
+            else self.fetch_details(
+                self.scraper_input,
+                f'zr-{job["listing_key"]}',
+                self._get_descr,
+                job_url,
+            )
+        )
 
         return JobPost(
             id=f'zr-{job["listing_key"]}',
@@ -177,10 +221,16 @@ class ZipRecruiter(Scraper):
         )
 
     def _get_descr(self, job_url):
-        res = self.session.get(job_url, allow_redirects=True)
+        try:
+            res = self.session.get(job_url, allow_redirects=True, use_cache=True)
+        except Exception as e:
+            # the job keeps its search snippet; a failed or timed out job page,
+            # the deadline's included, must not lose the rest of the page
+            log.warning(f"failed to get job description: {e}")
+            return None, None
         description_full = job_url_direct = None
         if res.ok:
-            soup = BeautifulSoup(res.text, "html.parser")
+            soup = parse_html(res.text)
             job_descr_div = soup.find("div", class_="job_description")
             company_descr_section = soup.find("section", class_="company_description")
             job_description_clean = (
@@ -4,7 +4,7 @@ JobSpy Production Script - Ready to use with all sites
 """
 
 import pandas as pd
-from jobspy import scrape_jobs
+from jobspy import scrape_jobs, write_parquet
 import argparse
 import sys
 from datetime import datetime
@@ -61,7 +61,7 @@ class JobSpyRunner:
             return pd.DataFrame()
     
     def save_results(self, filename=None):
-        """Save all results to CSV"""
+        """Save all results to CSV, or to Parquet when filename ends in .parquet"""
         if not self.results:
             print("No results to save")
             return
@@ -72,7 +72,10 @@ class JobSpyRunner:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"jobspy_results_{timestamp}.csv"
         
-        combined.to_csv(filename, index=False)
+        if filename.endswith(".parquet"):
+            write_parquet(combined, filename)
+        else:
+            combined.to_csv(filename, index=False)
         print(f"💾 Saved {len(combined)} jobs to {filename}")
         
         return combined
@@ -141,7 +144,7 @@ def main():
     parser.add_argument("--job-type", choices=["fulltime", "parttime", "internship", "contract"],
                        help="Job type filter")
     parser.add_argument("--hours", type=int, help="Jobs posted within X hours")
-    parser.add_argument("--output", help="Output CSV filename")
+    parser.add_argument("--output", help="Output filename (.csv or .parquet)")
     parser.add_argument("--verbose", action="store_true", help="Verbose output")
     
     args = parser.parse_args()
@@ -40,26 +40,21 @@ except Exception as e:
 
 # Use local JobSpy-main folder instead of installed package
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'JobSpy-main_new'))
-from jobspy import scrape_jobs
+from jobspy import Metrics, scrape_jobs
 import json
 import sys
-from datetime import datetime, date
-import pandas as pd
-
-def json_serial(obj):
-    """JSON serializer for objects not serializable by default json code"""
-    if isinstance(obj, (datetime, date)):
-        return obj.isoformat()
-    if pd.isna(obj):
-        return None
-    raise TypeError(f"Type {type(obj)} not serializable")
+from collections import Counter
+from datetime import datetime
+from webhook_delivery import DeliveryConfig, Outbox, deliver_jobs, drain, json_serial
 
 def scrape_and_send_to_n8n(webhook_url, search_term="software intern", location="United States", 
                            site_name=["indeed", "linkedin", "glassdoor", "google", "zip_recruiter"],
                            results_wanted=20, hours_old=72, country_indeed='USA',
                            internshala_search_term=None, google_search_term=None,
                            job_type=None, is_remote=False, distance=50, verbose=1,
-                           linkedin_fetch_description=True):
+                           linkedin_fetch_description=True, only_new=False,
+                           job_store="jobspy_jobs.sqlite", delivery_config=None,
+                           outbox_path="webhook_outbox.sqlite", metrics_textfile=None):
     """
     Scrape jobs and send directly to n8n webhook
     
@@ -68,6 +63,11 @@ def scrape_and_send_to_n8n(webhook_url, search_term="software intern", location=
     - job_type: fulltime, parttime, internship, contract
     - is_remote: Filter for remote jobs only
     - distance: Distance in miles from location (default 50)
+    - only_new: Only send jobs an earlier run has not delivered (needs the outbox)
+    - job_store: SQLite file remembering the jobs found by earlier runs
+    - delivery_config: DeliveryConfig with batch size, gzip, parallelism and retries
+    - outbox_path: SQLite outbox keeping batches until n8n acknowledges them (None to disable)
+    - metrics_textfile: Prometheus textfile to write the run's timings to (e.g. for node_exporter)
     """
     
     print(f"🔍 Searching for: {search_term}")
@@ -81,10 +81,25 @@ def scrape_and_send_to_n8n(webhook_url, search_term="software intern", location=
         print(f"💼 Job type: {job_type}")
     if is_remote:
         print(f"🏠 Remote: Yes")
+    if only_new and not outbox_path:
+        # the outbox is what remembers which jobs were delivered
+        print("⚠️  Only new jobs needs the webhook outbox, sending all jobs instead")
+        only_new = False
+    if only_new:
+        print(f"🆕 Only new jobs (delivered ones tracked in {outbox_path})")
+    
+    # Resend batches a previous run could not deliver before scraping new ones
+    outbox = Outbox(outbox_path) if outbox_path else None
+    batches, pending_jobs = outbox.pending() if outbox else (0, 0)
+    if batches:
+        print(f"📤 Resending {batches} undelivered batches ({pending_jobs} jobs) from {outbox_path}")
+        drain(outbox, delivery_config)
     print("⏳ Scraping jobs... This may take 1-2 minutes\n")
     
+    metrics = Metrics()
     try:
-        # Scrape jobs with all parameters
+        # Scrape jobs with all parameters. A list rather than the iter_jobs
+        # stream: every batch sent to n8n carries the run's total_jobs
         jobs = scrape_jobs(
             site_name=site_name,
             search_term=search_term,
@@ -99,78 +114,79 @@ def scrape_and_send_to_n8n(webhook_url, search_term="software intern", location=
             linkedin_fetch_description=linkedin_fetch_description,
             internshala_search_term=internshala_search_term,
             verbose=verbose,
+            job_store=job_store,
+            metrics=metrics,
+            output="records",
         )
         
+        if only_new:
+            # Skip jobs n8n acknowledged or that wait in the outbox, not every
+            # job the store has seen: a job whose batch was dead-lettered, or
+            # that was scraped by a run that stopped before queueing it, has
+            # never been delivered and goes out again
+            known = outbox.known_ids(job['id'] for job in jobs)
+            jobs = [job for job in jobs if job['id'] not in known]
+        
         if len(jobs) == 0:
+            if only_new:
+                print("❌ No new jobs since the last run.")
+                return
             print("❌ No jobs found. Try different search terms.")
             return
         
         print(f"\n✅ Found {len(jobs)} jobs total!")
         
         # Show breakdown by site
-        if 'site' in jobs.columns:
-            site_counts = jobs['site'].value_counts()
-            print("\n📊 Jobs per site:")
-            for site, count in site_counts.items():
-                print(f"   {site}: {count} jobs")
-            
-            # Show which sites returned no jobs
-            missing_sites = set(site_name) - set(site_counts.index)
-            if missing_sites:
-                print(f"\n⚠️  No jobs from: {', '.join(missing_sites)}")
+        site_counts = Counter(job['site'] for job in jobs).most_common()
+        print("\n📊 Jobs per site:")
+        for site, count in site_counts:
+            print(f"   {site}: {count} jobs")
         
-        # Convert DataFrame to dict and handle date serialization
-        jobs_data = jobs.to_dict('records')
-        
-        # Clean the data - convert any remaining date objects and NaN values
-        cleaned_jobs = []
-        for job in jobs_data:
-            cleaned_job = {}
-            for key, value in job.items():
-                # Handle date objects
-                if isinstance(value, (datetime, date)):
-                    cleaned_job[key] = value.isoformat()
-                # Handle NaN/None
-                elif pd.isna(value):
-                    cleaned_job[key] = None
-                # Handle everything else
-                else:
-                    cleaned_job[key] = value
-            cleaned_jobs.append(cleaned_job)
+        # Show which sites returned no jobs
+        missing_sites = set(site_name) - {site for site, _ in site_counts}
+        if missing_sites:
+            print(f"\n⚠️  No jobs from: {', '.join(missing_sites)}")
         
         # Preview first job
-        if cleaned_jobs:
+        if jobs:
             print("\n📋 Sample job:")
-            print(f"   Title: {cleaned_jobs[0].get('title', 'N/A')}")
-            print(f"   Company: {cleaned_jobs[0].get('company', 'N/A')}")
-            print(f"   Location: {cleaned_jobs[0].get('location', 'N/A')}\n")
+            print(f"   Title: {jobs[0].get('title', 'N/A')}")
+            print(f"   Company: {jobs[0].get('company', 'N/A')}")
+            print(f"   Location: {jobs[0].get('location', 'N/A')}\n")
         
-        # Send to n8n webhook
-        print(f"📤 Sending {len(cleaned_jobs)} jobs to n8n...")
+        # Send to n8n webhook in batches
+        delivery_config = delivery_config or DeliveryConfig()
+        print(f"📤 Sending {len(jobs)} jobs to n8n in batches of {delivery_config.batch_size}...")
         
-        payload = {
+        meta = {
             'timestamp': datetime.now().isoformat(),
             'search_term': search_term,
             'location': location,
-            'total_jobs': len(cleaned_jobs),
-            'jobs': cleaned_jobs
         }
+        payload = {**meta, 'total_jobs': len(jobs), 'jobs': jobs}
         
-        response = requests.post(
-            webhook_url,
-            json=payload,
-            headers={'Content-Type': 'application/json'},
-            timeout=30
+        report = deliver_jobs(
+            webhook_url, jobs, meta, delivery_config, outbox=outbox,
+            metrics=metrics,
         )
         
-        if response.status_code == 200:
-            print(f"✅ Successfully sent to n8n!")
-            print(f"   Response: {response.text[:100]}")
+        if report.ok:
+            print(f"✅ Successfully sent {report.delivered_jobs} jobs to n8n in {report.batches} batches!")
         else:
-            print(f"❌ Failed to send. Status code: {response.status_code}")
-            print(f"   Response: {response.text}")
+            if outbox:
+                # outbox reports hold the batches' outbox ids
+                failed = ', '.join(f"#{batch_id}" for batch_id in report.failed_batches)
+            else:
+                failed = ', '.join(str(index + 1) for index in report.failed_batches)
+            print(f"❌ {len(report.failed_batches)}/{report.batches} batches failed (batch {failed})")
+            print(f"   Delivered {report.delivered_jobs} jobs")
+            if outbox:
+                print(f"   Undelivered batches stay in {outbox_path} and are resent on the next run")
+                if outbox.dead_letters():
+                    print(f"   Batches n8n rejected for good are dead-lettered there and not resent")
         
-        # Also save locally as backup
+        # Also save locally as backup, with the run's timings
+        payload['metrics'] = metrics.summary()
         filename = f"jobs_backup_{datetime.now().strftime('%Y%m%d_%H%M')}.json"
         with open(filename, 'w') as f:
             json.dump(payload, f, indent=2, default=json_serial)
@@ -180,6 +196,10 @@ def scrape_and_send_to_n8n(webhook_url, search_term="software intern", location=
         print(f"❌ Error: {str(e)}")
         import traceback
         traceback.print_exc()
+    finally:
+        if metrics_textfile:
+            metrics.write_prometheus(metrics_textfile)
+            print(f"📈 Metrics written to: {metrics_textfile}")
 
 import argparse
 
@@ -222,6 +242,17 @@ if __name__ == "__main__":
     ENV_VERBOSE = int(os.getenv("VERBOSE", "1"))
     ENV_LINKEDIN_FETCH_DESC = os.getenv("LINKEDIN_FETCH_DESCRIPTION", "true").lower() == "true"
 
+    # Incremental mode: skip jobs already sent by an earlier run (needs WEBHOOK_OUTBOX)
+    ENV_ONLY_NEW = os.getenv("ONLY_NEW", "false").lower() == "true"
+    ENV_JOB_STORE = os.getenv("JOB_STORE", "jobspy_jobs.sqlite")
+
+    # Webhook delivery: jobs per request, parallel requests, gzip bodies, retries
+    ENV_DELIVERY_CONFIG = DeliveryConfig.from_env()
+    # Outbox file for batches n8n has not acknowledged yet (empty to disable)
+    ENV_WEBHOOK_OUTBOX = os.getenv("WEBHOOK_OUTBOX", "webhook_outbox.sqlite")
+    # Prometheus textfile for request, parsing and delivery timings (empty to disable)
+    ENV_METRICS_TEXTFILE = os.getenv("METRICS_TEXTFILE", "")
+
     # 1. Parse Command Line Arguments
     parser = argparse.ArgumentParser(description="Job Spy Scraper")
     
@@ -332,5 +363,10 @@ if __name__ == "__main__":
             is_remote=ENV_IS_REMOTE,
             distance=ENV_DISTANCE,
             verbose=ENV_VERBOSE,
-            linkedin_fetch_description=ENV_LINKEDIN_FETCH_DESC
+            linkedin_fetch_description=ENV_LINKEDIN_FETCH_DESC,
+            only_new=ENV_ONLY_NEW,
+            job_store=ENV_JOB_STORE,
+            delivery_config=ENV_DELIVERY_CONFIG,
+            outbox_path=ENV_WEBHOOK_OUTBOX or None,
+            metrics_textfile=ENV_METRICS_TEXTFILE or None,
         )
\ No newline at end of file
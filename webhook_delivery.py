@@ -0,0 +1,459 @@
+"""
+Batched webhook delivery for scraped jobs.
+
+Jobs are split into batches that are gzip-compressed and posted in parallel,
+with a cap on the number of requests in flight and per-batch retries with
+exponential backoff.
+
+With an Outbox, batches are first written to a SQLite file and only removed
+once the webhook answers 2xx, so batches that could not be delivered are sent
+again by the next run (or by `python webhook_delivery.py --daemon`) without
+re-scraping: delivery is at-least-once. Batches the webhook rejects for good
+(a 4xx other than 408, 425 or 429) or that used up their attempts are kept
+aside as dead letters instead of being resent. The outbox also remembers
+which jobs it has delivered, so a run can leave out the ones already sent.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import date, datetime
+
+import requests
+
+# status codes worth another attempt; anything else is a permanent failure
+RETRY_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+# request errors worth another attempt; other request errors are permanent
+RETRY_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+# keeps each IN (...) query under SQLite's bound parameter limit
+ID_CHUNK_SIZE = 500
+
+
+def json_serial(obj):
+    """JSON serializer for objects not serializable by default json code"""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    # only pandas' missing values (NaT, NA) get here, and only when the jobs
+    # came from a DataFrame, so pandas is not imported for them
+    pd = sys.modules.get("pandas")
+    if pd is not None and pd.isna(obj):
+        return None
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
+@dataclass
+class DeliveryConfig:
+    batch_size: int = 50
+    max_in_flight: int = 4
+    gzip: bool = True
+    max_retries: int = 4
+    backoff: float = 1.0
+    max_backoff: float = 30.0
+    timeout: float = 30.0
+    # drains an outbox batch may fail before it is kept aside as a dead letter
+    max_outbox_attempts: int = 10
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            batch_size=int(os.getenv("WEBHOOK_BATCH_SIZE", "50")),
+            max_in_flight=int(os.getenv("WEBHOOK_MAX_IN_FLIGHT", "4")),
+            gzip=os.getenv("WEBHOOK_GZIP", "true").lower() == "true",
+            max_retries=int(os.getenv("WEBHOOK_MAX_RETRIES", "4")),
+            timeout=float(os.getenv("WEBHOOK_TIMEOUT", "30")),
+            max_outbox_attempts=int(os.getenv("WEBHOOK_MAX_OUTBOX_ATTEMPTS", "10")),
+        )
+
+
+@dataclass
+class DeliveryReport:
+    batches: int = 0
+    delivered_jobs: int = 0
+    failed_batches: list = field(default_factory=list)
+
+    @property
+    def ok(self):
+        return not self.failed_batches
+
+
+def make_batches(jobs, batch_size):
+    return [jobs[i : i + batch_size] for i in range(0, len(jobs), batch_size)]
+
+
+def make_payloads(jobs, meta, batch_size):
+    """One request body per batch: meta plus batch_index, batch_count, total_jobs and jobs"""
+    batches = make_batches(jobs, batch_size)
+    return [
+        {
+            **meta,
+            "batch_index": index,
+            "batch_count": len(batches),
+            "total_jobs": len(jobs),
+            "jobs": batch,
+        }
+        for index, batch in enumerate(batches)
+    ]
+
+
+def encode_payload(payload):
+    return json.dumps(payload, default=json_serial).encode("utf-8")
+
+
+def retry_delay(attempt, config, response=None):
+    """Honours Retry-After, otherwise exponential backoff with full jitter"""
+    if response is not None and response.headers.get("Retry-After", "").isdigit():
+        return min(float(response.headers["Retry-After"]), config.max_backoff)
+    return random.uniform(0, min(config.max_backoff, config.backoff * 2**attempt))
+
+
+def post_body(session, webhook_url, body, config, metrics=None):
+    """
+    Posts one JSON body, retrying timeouts, connection errors, 429 and 5xx responses.
+    Each attempt is timed into metrics (a jobspy.Metrics) when given.
+    Returns (success, detail, retryable); retryable is False when the webhook
+    rejected the body for good, so sending it again cannot succeed.
+    """
+    headers = {"Content-Type": "application/json"}
+    if config.gzip:
+        body = gzip.compress(body)
+        headers["Content-Encoding"] = "gzip"
+    detail = None
+    for attempt in range(config.max_retries + 1):
+        response = None
+        started = time.perf_counter()
+        try:
+            response = session.post(
+                webhook_url, data=body, headers=headers, timeout=config.timeout
+            )
+            if metrics is not None:
+                metrics.observe(
+                    "webhook_delivery_seconds",
+                    time.perf_counter() - started,
+                    status=response.status_code,
+                )
+            if response.ok:
+                return True, response.text[:100], False
+            detail = f"status code {response.status_code}: {response.text[:200]}"
+            if response.status_code not in RETRY_STATUS_CODES:
+                return False, detail, response.status_code >= 500
+        except requests.RequestException as e:
+            detail = str(e)
+            if metrics is not None:
+                metrics.observe(
+                    "webhook_delivery_seconds",
+                    time.perf_counter() - started,
+                    status="error",
+                )
+            if not isinstance(e, RETRY_ERRORS):
+                # e.g. an invalid URL or too many redirects: resending cannot help
+                return False, detail, False
+        if attempt < config.max_retries:
+            time.sleep(retry_delay(attempt, config, response))
+    return False, detail, True
+
+
+def send_bounded(tasks, send, max_in_flight):
+    """
+    Runs send(task) for each task with at most max_in_flight running at a time,
+    pulling the next task only when one finishes. Yields (task, result).
+    """
+    tasks = iter(tasks)
+    in_flight = {}
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+
+        def submit_next():
+            task = next(tasks, None)
+            if task is not None:
+                in_flight[executor.submit(send, task)] = task
+
+        for _ in range(max_in_flight):
+            submit_next()
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield in_flight.pop(future), future.result()
+                submit_next()
+
+
+class Outbox:
+    """
+    SQLite spool of webhook batches. A batch stays until the webhook acknowledges
+    it; failed batches are retried with backoff by later drains, up to
+    max_outbox_attempts, and batches rejected for good are dead-lettered: kept
+    with their last error but never sent again. Rows are leased while being
+    sent so two processes draining the same file do not double send.
+
+    The jobs table maps each job id to the batch carrying it and is marked
+    delivered when that batch is acknowledged. Jobs of a dead-lettered batch
+    are forgotten, so a later run sends them again.
+    """
+
+    def __init__(self, path="webhook_outbox.sqlite", lease_seconds=300):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS batches (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                webhook_url TEXT NOT NULL,
+                body BLOB NOT NULL,
+                job_count INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL,
+                leased_until REAL NOT NULL DEFAULT 0,
+                last_error TEXT,
+                dead_at REAL
+            )
+            """
+        )
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(batches)")]
+        if "dead_at" not in columns:
+            # outbox files written before dead letters existed
+            self._conn.execute("ALTER TABLE batches ADD COLUMN dead_at REAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                batch_id INTEGER NOT NULL,
+                delivered_at REAL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_batch_id ON jobs (batch_id)")
+        self._conn.commit()
+
+    def enqueue(self, webhook_url, payloads):
+        """Writes batches to disk before any of them is sent; returns their ids"""
+        now = time.time()
+        ids = []
+        with self._lock:
+            for payload in payloads:
+                cursor = self._conn.execute(
+                    "INSERT INTO batches (webhook_url, body, job_count, created_at, next_attempt_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (webhook_url, encode_payload(payload), len(payload["jobs"]), now, now),
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO jobs (job_id, batch_id) VALUES (?, ?)",
+                    [
+                        (job["id"], cursor.lastrowid)
+                        for job in payload["jobs"]
+                        if isinstance(job, dict) and job.get("id")
+                    ],
+                )
+                ids.append(cursor.lastrowid)
+            self._conn.commit()
+        return ids
+
+    def lease_due(self, limit=None):
+        """Claims batches whose next attempt is due; returns (id, url, body, job_count) rows"""
+        now = time.time()
+        with self._lock:
+            # the write lock is taken up front so another process cannot lease the same rows
+            self._conn.execute("BEGIN IMMEDIATE")
+            rows = self._conn.execute(
+                "SELECT id, webhook_url, body, job_count FROM batches"
+                " WHERE dead_at IS NULL AND next_attempt_at <= ? AND leased_until <= ?"
+                " ORDER BY id LIMIT ?",
+                (now, now, -1 if limit is None else limit),
+            ).fetchall()
+            self._conn.executemany(
+                "UPDATE batches SET leased_until = ? WHERE id = ?",
+                [(now + self.lease_seconds, row[0]) for row in rows],
+            )
+            self._conn.commit()
+        return rows
+
+    def release(self, batch_id):
+        """Gives a leased batch back untouched, e.g. when a drain stops early"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE batches SET leased_until = 0 WHERE id = ?", (batch_id,)
+            )
+            self._conn.commit()
+
+    def ack(self, batch_id):
+        with self._lock:
+            self._conn.execute("DELETE FROM batches WHERE id = ?", (batch_id,))
+            self._conn.execute(
+                "UPDATE jobs SET delivered_at = ? WHERE batch_id = ?",
+                (time.time(), batch_id),
+            )
+            self._conn.commit()
+
+    def fail(self, batch_id, error, config, retryable=True):
+        """
+        Releases the lease and schedules the next attempt with exponential backoff;
+        a batch that cannot be retried or used up its attempts is dead-lettered.
+        Returns whether the batch will be retried.
+        """
+        with self._lock:
+            (attempts,) = self._conn.execute(
+                "SELECT attempts FROM batches WHERE id = ?", (batch_id,)
+            ).fetchone()
+            now = time.time()
+            retry = retryable and attempts + 1 < config.max_outbox_attempts
+            delay = min(3600.0, config.backoff * 60 * 2**attempts)
+            self._conn.execute(
+                "UPDATE batches SET attempts = attempts + 1, next_attempt_at = ?,"
+                " leased_until = 0, last_error = ?, dead_at = ? WHERE id = ?",
+                (now + delay, error, None if retry else now, batch_id),
+            )
+            if not retry:
+                # the dead letter will never deliver these jobs
+                self._conn.execute(
+                    "DELETE FROM jobs WHERE batch_id = ? AND delivered_at IS NULL",
+                    (batch_id,),
+                )
+            self._conn.commit()
+        return retry
+
+    def known_ids(self, job_ids):
+        """Returns the subset of job_ids already delivered or waiting to be"""
+        job_ids = list({job_id for job_id in job_ids if job_id})
+        known = set()
+        with self._lock:
+            for i in range(0, len(job_ids), ID_CHUNK_SIZE):
+                chunk = job_ids[i : i + ID_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT job_id FROM jobs WHERE job_id IN ({placeholders})", chunk
+                ).fetchall()
+                known.update(row[0] for row in rows)
+        return known
+
+    def pending(self):
+        """(batches, jobs) waiting for delivery"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(job_count), 0) FROM batches"
+                " WHERE dead_at IS NULL"
+            ).fetchone()
+
+    def dead_letters(self):
+        """(id, webhook_url, job_count, attempts, last_error) of dead-lettered batches"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT id, webhook_url, job_count, attempts, last_error FROM batches"
+                " WHERE dead_at IS NOT NULL ORDER BY id"
+            ).fetchall()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def drain(outbox, config=None, session=None, metrics=None):
+    """
+    Sends every due batch in the outbox, including ones left by earlier runs.
+    Once a batch has used up its retries the endpoint is taken to be down and
+    the batches not yet sent are left for the next drain. A batch the webhook
+    rejects for good (4xx) is dead-lettered and does not hold the others back.
+    """
+    config = config or DeliveryConfig()
+    session = session or requests.Session()
+    rows = outbox.lease_due()
+    report = DeliveryReport(batches=len(rows))
+    endpoint_down = threading.Event()
+
+    def send(row):
+        if endpoint_down.is_set():
+            return None, "skipped", True
+        batch_id, webhook_url, body, _ = row
+        return post_body(session, webhook_url, body, config, metrics)
+
+    for (batch_id, _, _, job_count), (success, detail, retryable) in send_bounded(
+        rows, send, config.max_in_flight
+    ):
+        if success is None:
+            outbox.release(batch_id)
+            report.failed_batches.append(batch_id)
+        elif success:
+            outbox.ack(batch_id)
+            report.delivered_jobs += job_count
+            print(f"   ✅ Outbox batch {batch_id} delivered")
+        else:
+            if retryable:
+                # the endpoint is unreachable or overloaded, not the batch at fault
+                endpoint_down.set()
+            report.failed_batches.append(batch_id)
+            if outbox.fail(batch_id, detail, config, retryable):
+                print(f"   ❌ Outbox batch {batch_id} failed, kept for retry: {detail}")
+            else:
+                print(f"   ☠️ Outbox batch {batch_id} failed, dead-lettered: {detail}")
+    report.failed_batches.sort()
+    return report
+
+
+def deliver_jobs(
+    webhook_url, jobs, meta, config=None, session=None, outbox=None, metrics=None
+):
+    """
+    Sends jobs to the webhook in batches of config.batch_size. At most
+    config.max_in_flight batches are being sent (or encoded) at a time.
+    With an outbox the batches are spooled to disk first and the whole outbox
+    is drained, so batches left over from earlier runs go out as well.
+    """
+    config = config or DeliveryConfig()
+    session = session or requests.Session()
+    payloads = make_payloads(jobs, meta, config.batch_size)
+    if outbox is not None:
+        outbox.enqueue(webhook_url, payloads)
+        return drain(outbox, config, session, metrics)
+
+    report = DeliveryReport(batches=len(payloads))
+
+    def send(index):
+        # the body is encoded here, on the worker, so only in-flight batches are held encoded
+        return post_body(
+            session, webhook_url, encode_payload(payloads[index]), config, metrics
+        )
+
+    for index, (success, detail, _) in send_bounded(
+        range(len(payloads)), send, config.max_in_flight
+    ):
+        if success:
+            report.delivered_jobs += len(payloads[index]["jobs"])
+            print(f"   ✅ Batch {index + 1}/{len(payloads)} delivered")
+        else:
+            report.failed_batches.append(index)
+            print(f"   ❌ Batch {index + 1}/{len(payloads)} failed: {detail}")
+    report.failed_batches.sort()
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Send batches left in the webhook outbox")
+    parser.add_argument("--outbox", default=os.getenv("WEBHOOK_OUTBOX", "webhook_outbox.sqlite"))
+    parser.add_argument("--daemon", action="store_true", help="Keep draining every --interval seconds")
+    parser.add_argument("--interval", type=int, default=60)
+    args = parser.parse_args()
+
+    outbox = Outbox(args.outbox)
+    dead = outbox.dead_letters()
+    if dead:
+        print(f"☠️ {len(dead)} dead-lettered batches in {args.outbox} (not resent)")
+    while True:
+        batches, jobs = outbox.pending()
+        if batches:
+            print(f"📤 {batches} batches ({jobs} jobs) waiting in {args.outbox}")
+            drain(outbox, DeliveryConfig.from_env())
+        if not args.daemon:
+            break
+        time.sleep(args.interval)